@@ -20,6 +20,9 @@ import redis.asyncio as redis
 from functools import lru_cache
 import openai
 
+from broadcast_hub import BroadcastHub
+from json_snapshot import JsonSnapshot
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -57,6 +60,13 @@ def get_redis_client():
 # Create FastAPI app
 app = FastAPI(title="Static.news API")
 
+# Live comment sockets: one Redis subscription feeds all of them
+comments_hub = BroadcastHub(max_queue=128, name="comments")
+comment_relay: Optional[asyncio.Task] = None
+
+# Written by the broadcast controller once a minute; parsed once per version
+metrics_snapshot = JsonSnapshot("/app/data/metrics.json", recheck_interval=0.5)
+
 # Add CORS
 app.add_middleware(
     CORSMiddleware,
@@ -354,13 +364,8 @@ async def get_user_profile(
 @app.get("/metrics")
 async def get_metrics(redis_client = Depends(get_redis_client)):
     """Get current broadcast metrics"""
-    # Get latest metrics from file
-    metrics = {}
-    metrics_file = "/app/data/metrics.json"
-    
-    if os.path.exists(metrics_file):
-        with open(metrics_file, 'r') as f:
-            metrics = json.load(f)
+    # Latest metrics from the controller (copied: the snapshot is shared)
+    metrics = dict(metrics_snapshot.get() or {})
     
     # Add real-time data from Redis
     breakdown_metrics = await redis_client.hgetall("metrics:breakdowns")
@@ -380,6 +385,7 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "backend-api",
+        "websockets": comments_hub.stats(),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -635,8 +641,12 @@ async def get_analytics_dashboard():
     try:
         from core.analytics_dashboard import analytics_dashboard
         
-        overview = await analytics_dashboard.get_dashboard_overview()
-        realtime = await analytics_dashboard.get_realtime_metrics()
+        # Overview is cached and single-flighted inside the dashboard;
+        # fetch it alongside the realtime metrics rather than after them
+        overview, realtime = await asyncio.gather(
+            analytics_dashboard.get_dashboard_overview(),
+            analytics_dashboard.get_realtime_metrics()
+        )
         
         return {
             "overview": overview,
@@ -732,25 +742,48 @@ async def record_viewership_data(
 # WebSocket for real-time updates
 from fastapi import WebSocket, WebSocketDisconnect
 
+async def relay_comments():
+    """Single subscriber to the comment stream, fanned out through the hub"""
+    while True:
+        pubsub = get_redis_client().pubsub()
+        try:
+            await pubsub.subscribe("comments:new")
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    # Already JSON from the publisher: forwarded as-is
+                    comments_hub.broadcast(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Comment relay error, resubscribing: {e}")
+            await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.close()
+            except Exception:
+                pass
+
 @app.websocket("/ws/comments")
 async def websocket_comments(websocket: WebSocket):
     """WebSocket for real-time comment stream"""
+    global comment_relay
     await websocket.accept()
-    redis_client = get_redis_client()
+    comments_hub.register(websocket)
+    
+    if comment_relay is None or comment_relay.done():
+        comment_relay = asyncio.create_task(relay_comments())
     
     try:
-        # Subscribe to comment stream
-        pubsub = redis_client.pubsub()
-        await pubsub.subscribe("comments:new")
-        
+        # Comments arrive via the hub; just wait for the client to leave
         while True:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                await websocket.send_text(message["data"])
-                
+            await websocket.receive_text()
+            
     except WebSocketDisconnect:
-        await pubsub.unsubscribe("comments:new")
         logger.info("WebSocket disconnected")
+    except Exception:
+        pass
+    finally:
+        comments_hub.unregister(websocket)
 
 if __name__ == "__main__":
     import uvicorn
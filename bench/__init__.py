@@ -0,0 +1,6 @@
+"""
+Static.news load-test harness
+Starts the streaming, render-backend and backend servers locally and hammers them
+
+Run with: python -m bench --help
+"""
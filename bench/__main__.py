@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Static.news load test
+Starts each server locally, opens thousands of WebSocket and /stream clients,
+injects segments and comments, and reports delivery latency, throughput, RSS and CPU
+
+    python -m bench --ws-clients 2000 --stream-clients 500 --duration 20
+    python -m bench --scenario streaming --backplane --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+
+from bench.report import print_report
+from bench.scenarios import SCENARIOS, BenchConfig
+from bench.servers import FakeRedis
+
+def raise_file_limit():
+    """Every client and server socket is a file descriptor"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+async def run(scenarios, config: BenchConfig):
+    redis = FakeRedis().start()
+    results = {}
+    try:
+        for name in scenarios:
+            print(f"Running {name}: {config.ws_clients} ws clients, "
+                  f"{config.stream_clients if name == 'streaming' else 0} /stream listeners, "
+                  f"{config.duration:.0f}s...", file=sys.stderr)
+            try:
+                results[name] = await SCENARIOS[name](config, redis)
+            except Exception as e:
+                # One service failing to start (missing deps) shouldn't sink the others
+                results[name] = {'error': str(e)}
+    finally:
+        redis.stop()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--ws-clients", type=int, default=1000)
+    parser.add_argument("--stream-clients", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds of injection per scenario")
+    parser.add_argument("--rate", type=float, default=2.0, help="Injected events per second")
+    parser.add_argument("--backplane", action="store_true",
+                        help="Run streaming and render-backend with the Redis backplane enabled")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    limit = raise_file_limit()
+    needed = 2 * (args.ws_clients + args.stream_clients) + 100
+    if needed > limit:
+        print(f"Warning: ~{needed} sockets needed but the file limit is {limit}", file=sys.stderr)
+
+    config = BenchConfig(args.ws_clients, args.stream_clients, args.duration, args.rate, args.backplane)
+    results = asyncio.run(run(args.scenario or list(SCENARIOS), config))
+
+    print_report(results)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Backend launcher for the bench
+Runs backend/api_server.py against the bench's fakeredis instead of redis:6379
+(get_redis_client only honours the host part of REDIS_URL, so it's overridden here)
+"""
+
+import argparse
+
+import redis.asyncio as redis
+import uvicorn
+
+import api_server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--redis-port", type=int, required=True)
+    args = parser.parse_args()
+
+    client = redis.Redis(host="127.0.0.1", port=args.redis_port, decode_responses=True)
+    api_server.app.dependency_overrides[api_server.get_redis_client] = lambda: client
+    # The comment relay calls it directly rather than through Depends
+    api_server.get_redis_client = lambda: client
+
+    uvicorn.run(api_server.app, host="127.0.0.1", port=args.port, log_level="warning")
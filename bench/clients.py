@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Bench Clients
+Thousands of WebSocket and /stream clients on one event loop
+Each client records what it needs to compute delivery latency; nothing else
+"""
+
+import asyncio
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+from bench.report import Recorder
+
+# Called with (parsed message, receive wall-clock time)
+MessageHandler = Callable[[Dict, float], None]
+
+class WsSwarm:
+    """Many WebSocket clients on one URL, all handing messages to one callback"""
+
+    def __init__(self, url: str, count: int, on_message: MessageHandler,
+                 connect_concurrency: int = 200):
+        self.url = url
+        self.count = count
+        self.on_message = on_message
+        self.connect_concurrency = connect_concurrency
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.tasks: List[asyncio.Task] = []
+
+        # Stats
+        self.connected = 0
+        self.failed = 0
+        self.dropped = 0
+        self.messages = 0
+        self.bytes = 0
+        self.connect_time = Recorder()
+
+    async def start(self):
+        """Open every connection, a batch at a time; returns once all have tried"""
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+        gate = asyncio.Semaphore(self.connect_concurrency)
+        ready = [asyncio.Event() for _ in range(self.count)]
+        self.tasks = [asyncio.create_task(self._client(gate, event)) for event in ready]
+        await asyncio.gather(*[event.wait() for event in ready])
+
+    async def _client(self, gate: asyncio.Semaphore, ready: asyncio.Event):
+        try:
+            async with gate:
+                started = time.perf_counter()
+                ws = await self.session.ws_connect(self.url, heartbeat=None, max_msg_size=0)
+                self.connect_time.record((time.perf_counter() - started) * 1000)
+                self.connected += 1
+        except Exception:
+            self.failed += 1
+            ready.set()
+            return
+        ready.set()
+
+        try:
+            async for msg in ws:
+                received_at = time.time()
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    self.messages += 1
+                    self.bytes += len(msg.data)
+                    self.on_message(json.loads(msg.data), received_at)
+                elif msg.type == aiohttp.WSMsgType.BINARY:
+                    self.messages += 1
+                    self.bytes += len(msg.data)
+            self.dropped += 1  # Server closed on us (e.g. too far behind)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.dropped += 1
+        finally:
+            await ws.close()
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        await self.session.close()
+
+    def stats(self) -> Dict:
+        return {
+            'clients': self.count,
+            'connected': self.connected,
+            'failed': self.failed,
+            'dropped': self.dropped,
+            'messages': self.messages,
+            'kb_received': round(self.bytes / 1024, 1),
+            'connect': self.connect_time.summary()
+        }
+
+class StreamSwarm:
+    """Many /stream listeners reading the endless MP3 as fast as it comes"""
+
+    def __init__(self, url: str, count: int, connect_concurrency: int = 200):
+        self.url = url
+        self.count = count
+        self.connect_concurrency = connect_concurrency
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.tasks: List[asyncio.Task] = []
+        self.started_at = 0.0
+
+        # Stats
+        self.connected = 0
+        self.failed = 0
+        self.bytes = 0
+        self.kbps = 0.0
+        self.first_byte = Recorder()
+
+    async def start(self):
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0),
+                                             timeout=aiohttp.ClientTimeout(total=None))
+        gate = asyncio.Semaphore(self.connect_concurrency)
+        ready = [asyncio.Event() for _ in range(self.count)]
+        self.tasks = [asyncio.create_task(self._listener(gate, event)) for event in ready]
+        await asyncio.gather(*[event.wait() for event in ready])
+        self.started_at = time.monotonic()
+        self.bytes = 0  # Count steady state only, not the connect burst
+
+    async def _listener(self, gate: asyncio.Semaphore, ready: asyncio.Event):
+        try:
+            async with gate:
+                started = time.perf_counter()
+                response = await self.session.get(self.url)
+                first = await response.content.readany()
+                self.first_byte.record((time.perf_counter() - started) * 1000)
+                self.connected += 1
+        except Exception:
+            self.failed += 1
+            ready.set()
+            return
+        ready.set()
+
+        try:
+            self.bytes += len(first)
+            while True:
+                chunk = await response.content.readany()
+                if not chunk:
+                    break
+                self.bytes += len(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+        finally:
+            response.close()
+
+    async def stop(self):
+        elapsed = max(1e-9, time.monotonic() - self.started_at)
+        self.kbps = self.bytes * 8 / 1000 / elapsed / max(1, self.connected)
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        await self.session.close()
+
+    def stats(self) -> Dict:
+        return {
+            'listeners': self.count,
+            'connected': self.connected,
+            'failed': self.failed,
+            'kbps_per_listener': round(self.kbps, 1),
+            'first_byte': self.first_byte.summary()
+        }
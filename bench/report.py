@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Bench Report
+Latency samples, percentiles and the printed summary
+"""
+
+import math
+from typing import Dict, List, Optional
+
+class Recorder:
+    """Raw latency samples in milliseconds; exact percentiles at the end"""
+
+    def __init__(self):
+        self.samples: List[float] = []
+
+    def record(self, ms: float):
+        self.samples.append(ms)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(len(ordered) * p / 100) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict:
+        return {
+            'count': len(self.samples),
+            'p50_ms': _round(self.percentile(50)),
+            'p99_ms': _round(self.percentile(99)),
+            'max_ms': _round(max(self.samples) if self.samples else None)
+        }
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 2)
+
+def print_report(results: Dict):
+    """Readable nested dump of one run's results"""
+    for scenario, result in results.items():
+        print(f"\n== {scenario} ==")
+        _print_section(result, indent=1)
+
+def _print_section(section: Dict, indent: int):
+    pad = '  ' * indent
+    for key, value in section.items():
+        if isinstance(value, dict):
+            print(f"{pad}{key}:")
+            _print_section(value, indent + 1)
+        else:
+            print(f"{pad}{key + ':':<24}{value}")
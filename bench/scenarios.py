@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Bench Scenarios
+One per service: start it, attach the clients, inject events, measure delivery
+Latency is injection (or scheduled tick) to client receive, on this machine's clock
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from bench.clients import StreamSwarm, WsSwarm
+from bench.report import Recorder
+from bench.servers import REPO, FakeRedis, ServerProcess
+
+@dataclass
+class BenchConfig:
+    ws_clients: int = 1000
+    stream_clients: int = 100
+    duration: float = 15.0
+    rate: float = 2.0  # Injected events per second
+    backplane: bool = False  # Run streaming/render-backend with REDIS_URL set
+
+async def _measure(server: ServerProcess, swarms: List, inject: Optional[Callable[[], Awaitable[None]]],
+                   config: BenchConfig) -> Dict:
+    """Connect everyone, then inject for the configured duration while sampling the server"""
+    for swarm in swarms:
+        await swarm.start()
+
+    server.start_sampling()
+    started = time.monotonic()
+    injected = 0
+    while time.monotonic() - started < config.duration:
+        if inject:
+            await inject()
+            injected += 1
+        await asyncio.sleep(1 / config.rate)
+    await asyncio.sleep(1.0)  # Let the last events land
+    elapsed = time.monotonic() - started
+    process = await server.stop_sampling()
+
+    health = await server.health()
+    for swarm in swarms:
+        await swarm.stop()
+    return {
+        'injected': injected,
+        'elapsed_s': round(elapsed, 1),
+        'server_process': process,
+        'server_websockets': health.get('websockets', {})
+    }
+
+def _delivery(latency: Recorder, expected: int, elapsed: float) -> Dict:
+    return {
+        **latency.summary(),
+        'delivered_percent': round(len(latency) / expected * 100, 1) if expected else None,
+        'deliveries_per_s': round(len(latency) / max(1e-9, elapsed), 1)
+    }
+
+async def run_streaming(config: BenchConfig, redis: Optional[FakeRedis]) -> Dict:
+    """Segment notifications over /ws plus /stream listeners"""
+    workdir = tempfile.mkdtemp(prefix="bench_streaming_")
+    audio_dir = os.path.join(workdir, "audio", "live")
+    os.makedirs(audio_dir)
+    metrics_file = os.path.join(workdir, "metrics.json")
+    _write_atomic(metrics_file, json.dumps(_fake_metrics(0), indent=2).encode())
+
+    env = {"AUDIO_DIR": audio_dir, "HLS_DIR": os.path.join(workdir, "hls"), "METRICS_FILE": metrics_file,
+           "REDIS_URL": _backplane_url(config, redis)}
+    server = ServerProcess.uvicorn("streaming", "streaming", "streaming_server:app", env=env)
+
+    sent: Dict[str, float] = {}
+    latency = Recorder()
+
+    def on_message(message: Dict, received_at: float):
+        if message.get("type") == "new_segment" and message.get("audio_file") in sent:
+            latency.record((received_at - sent[message["audio_file"]]) * 1000)
+            if "starts_at" in message:
+                timed[0] += 1
+
+    counter = [0]
+    timed = [0]
+    clips: List[Dict] = []
+    playout_index = os.path.join(audio_dir, "playout.json")
+
+    async def inject():
+        # What the broadcast controller does: metrics, the playout index, then the
+        # segment renamed into place
+        counter[0] += 1
+        name = f"segment_bench_{counter[0]:06d}.mp3"
+        _write_atomic(metrics_file, json.dumps(_fake_metrics(counter[0]), indent=2).encode())
+        staged = os.path.join(audio_dir, name + ".staged")
+        with open(staged, 'wb') as f:
+            f.write(bytes(16 * 1024))
+        now = time.time()
+        clips.append({"file": name, "duration_ms": 1024.0, "starts_at": now, "ends_at": now + 1.024})
+        del clips[:-32]
+        _write_atomic(playout_index, json.dumps({"on_air_until": now + 1.024, "clips": clips}).encode())
+        sent[name] = time.time()
+        os.replace(staged, os.path.join(audio_dir, name))
+
+    try:
+        await server.start()
+        ws = WsSwarm(f"{server.ws_url}/ws", config.ws_clients, on_message)
+        stream = StreamSwarm(f"{server.base_url}/stream", config.stream_clients)
+        result = await _measure(server, [ws, stream], inject, config)
+        return {
+            'websocket_clients': ws.stats(),
+            'new_segment_delivery': _delivery(latency, result['injected'] * ws.connected, result['elapsed_s']),
+            'timed_segments': timed[0],
+            'stream_listeners': stream.stats(),
+            **result
+        }
+    finally:
+        server.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+async def run_render(config: BenchConfig, redis: Optional[FakeRedis]) -> Dict:
+    """render-backend pushes on 5 s wall-clock ticks; nothing to inject"""
+    server = ServerProcess.uvicorn("render-backend", "render-backend", "main:app",
+                                   env={"REDIS_URL": _backplane_url(config, redis)})
+
+    latency = Recorder()
+
+    def on_message(message: Dict, received_at: float):
+        if message.get("type") != "state":
+            latency.record((received_at % 5) * 1000)  # Since the tick boundary it was sent on
+
+    try:
+        await server.start()
+        ws = WsSwarm(f"{server.ws_url}/ws", config.ws_clients, on_message)
+        result = await _measure(server, [ws], None, config)
+        # Ticks that went out, including any that landed while clients were still connecting
+        ticks = result['server_websockets'].get('messages', 0)
+        return {
+            'websocket_clients': ws.stats(),
+            'tick_delivery': _delivery(latency, ticks * ws.connected, result['elapsed_s']),
+            **result
+        }
+    finally:
+        server.stop()
+
+async def run_backend(config: BenchConfig, redis: Optional[FakeRedis]) -> Dict:
+    """Comments published on Redis fanned out over /ws/comments"""
+    import redis.asyncio as redis_asyncio
+
+    if redis is None:
+        raise RuntimeError("backend scenario needs fakeredis")
+    server = ServerProcess("backend", REPO / "backend",
+                           [sys.executable, "-m", "bench.backend_app", "--port", "{port}",
+                            "--redis-port", str(redis.port)])
+    publisher = redis_asyncio.Redis(host="127.0.0.1", port=redis.port, decode_responses=True)
+
+    latency = Recorder()
+
+    def on_message(message: Dict, received_at: float):
+        if "sent_at" in message:
+            latency.record((received_at - message["sent_at"]) * 1000)
+
+    async def inject():
+        comment = {"id": str(uuid.uuid4()), "text": "Is the gravy real?", "sent_at": time.time()}
+        await publisher.publish("comments:new", json.dumps(comment))
+
+    try:
+        await server.start()
+        ws = WsSwarm(f"{server.ws_url}/ws/comments", config.ws_clients, on_message)
+        result = await _measure(server, [ws], inject, config)
+        return {
+            'websocket_clients': ws.stats(),
+            'comment_delivery': _delivery(latency, result['injected'] * ws.connected, result['elapsed_s']),
+            **result
+        }
+    finally:
+        server.stop()
+        await publisher.aclose()
+
+SCENARIOS = {
+    'streaming': run_streaming,
+    'render': run_render,
+    'backend': run_backend
+}
+
+def _backplane_url(config: BenchConfig, redis: Optional[FakeRedis]) -> str:
+    """Empty means single replica, even if the caller's shell has REDIS_URL set"""
+    return redis.url if config.backplane and redis else ""
+
+def _fake_metrics(segment: int) -> Dict:
+    """About the size and shape of the controller's metrics.json"""
+    return {
+        'segment_number': segment,
+        'hours_awake': 1234.5 + segment / 60,
+        'swear_jar': segment * 3,
+        'gravy_counter': segment * 7,
+        'friendship_meter': 50,
+        'breakdown_warning': ['sweating', 'counting ceiling tiles'],
+        'tts_cache': {'hits': segment * 10, 'misses': segment, 'entries': 512},
+        'render_pool': {'workers': 4, 'queued': 0, 'completed': segment * 5},
+        'playout': {'on_air_remaining_s': 12.3, 'silent_for_s': 0.0, 'underruns': 0},
+        'jingle_bank': {'variants': 4, 'hits': segment},
+        'sfx_bank': {'memory_mb': 12.5, 'hits': segment * 2},
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+def _write_atomic(path: str, data: bytes):
+    partial_path = f"{path}.part"
+    with open(partial_path, 'wb') as f:
+        f.write(data)
+    os.replace(partial_path, path)
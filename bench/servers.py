@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Bench Servers
+Runs each service as its own uvicorn process and samples its RSS and CPU from /proc
+A fakeredis TCP server stands in for Redis so nothing outside the sandbox is needed
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiohttp
+
+REPO = Path(__file__).resolve().parent.parent
+
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+class FakeRedis:
+    """fakeredis speaking the Redis protocol on a local port, served from a thread"""
+
+    def __init__(self):
+        from fakeredis import TcpFakeServer
+
+        self.port = free_port()
+        self.server = TcpFakeServer(('127.0.0.1', self.port), server_type='redis')
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}"
+
+    def start(self) -> 'FakeRedis':
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+class ServerProcess:
+    """One service under test, started from its own directory like its Dockerfile does"""
+
+    def __init__(self, name: str, cwd: Path, args: List[str], health_path: str = "/health",
+                 env: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.cwd = cwd
+        self.port = free_port()
+        self.args = [arg.format(port=self.port) for arg in args]
+        self.health_path = health_path
+        self.env = {**os.environ, 'PYTHONPATH': str(REPO), **(env or {})}
+        self.process: Optional[subprocess.Popen] = None
+        self.log_path = Path(os.environ.get('TMPDIR', '/tmp')) / f"bench_{name}_{self.port}.log"
+
+        self.samples: List[Dict] = []
+        self._sampling: Optional[asyncio.Task] = None
+
+    @classmethod
+    def uvicorn(cls, name: str, service_dir: str, app: str, **kwargs) -> 'ServerProcess':
+        args = [sys.executable, '-m', 'uvicorn', app, '--host', '127.0.0.1', '--port', '{port}',
+                '--log-level', 'warning']
+        return cls(name, REPO / service_dir, args, **kwargs)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+    async def start(self, timeout: float = 30.0):
+        log = open(self.log_path, 'wb')
+        self.process = subprocess.Popen(self.args, cwd=self.cwd, env=self.env,
+                                        stdout=log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + timeout
+        async with aiohttp.ClientSession() as session:
+            while time.monotonic() < deadline:
+                if self.process.poll() is not None:
+                    raise RuntimeError(f"{self.name} exited during startup; see {self.log_path}")
+                try:
+                    async with session.get(self.base_url + self.health_path) as response:
+                        if response.status == 200:
+                            return
+                except aiohttp.ClientError:
+                    pass
+                await asyncio.sleep(0.2)
+        raise RuntimeError(f"{self.name} did not become healthy in {timeout:.0f}s; see {self.log_path}")
+
+    async def health(self) -> Dict:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(self.base_url + self.health_path) as response:
+                return await response.json()
+
+    def proc_sample(self) -> Dict:
+        """Cumulative CPU seconds and current RSS of the server process"""
+        pid = self.process.pid
+        with open(f'/proc/{pid}/stat') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open(f'/proc/{pid}/statm') as f:
+            rss_pages = int(f.read().split()[1])
+        return {
+            'at': time.monotonic(),
+            'cpu_s': (int(fields[11]) + int(fields[12])) / CLOCK_TICKS,
+            'rss_mb': rss_pages * PAGE_SIZE / (1024 * 1024)
+        }
+
+    def start_sampling(self, interval: float = 0.5):
+        async def sample():
+            while True:
+                self.samples.append(self.proc_sample())
+                await asyncio.sleep(interval)
+
+        self.samples = []
+        self._sampling = asyncio.create_task(sample())
+
+    async def stop_sampling(self) -> Dict:
+        """CPU and memory over the sampling window"""
+        self._sampling.cancel()
+        try:
+            await self._sampling
+        except asyncio.CancelledError:
+            pass
+        self.samples.append(self.proc_sample())
+
+        first, last = self.samples[0], self.samples[-1]
+        wall = max(1e-9, last['at'] - first['at'])
+        return {
+            'cpu_percent': round((last['cpu_s'] - first['cpu_s']) / wall * 100, 1),
+            'rss_start_mb': round(first['rss_mb'], 1),
+            'rss_peak_mb': round(max(s['rss_mb'] for s in self.samples), 1),
+            'rss_end_mb': round(last['rss_mb'], 1)
+        }
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
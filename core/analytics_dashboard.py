@@ -4,10 +4,14 @@ Analytics Dashboard for Static.news
 Comprehensive analytics and metrics tracking
 """
 
+import asyncio
+import copy
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import sqlite3
 import os
@@ -58,7 +62,8 @@ class AnchorMetrics:
 class AnalyticsDashboard:
     """Main analytics dashboard system"""
     
-    def __init__(self, db_path: str = "analytics.db"):
+    def __init__(self, db_path: str = "analytics.db", overview_ttl: float = 5.0,
+                 max_workers: int = 6):
         self.db_path = db_path
         self._init_database()
         
@@ -69,6 +74,15 @@ class AnalyticsDashboard:
             'breakdowns_today': 0,
             'news_articles_today': 0
         }
+        
+        # Dashboard overview assembly: sections run concurrently on a small
+        # thread pool, and the composed result is cached for a few seconds so
+        # every open admin tab shares one set of queries
+        self.overview_ttl = overview_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="analytics")
+        self._overview_cache: Optional[Tuple[float, Dict]] = None
+        self._overview_inflight: Optional[asyncio.Future] = None
     
     def _init_database(self):
         """Initialize analytics database"""
@@ -170,8 +184,8 @@ class AnalyticsDashboard:
         cursor = conn.cursor()
         
         # Calculate additional metrics
-        total_views = await self._get_total_views_today()
-        unique_viewers = await self._get_unique_viewers_today()
+        total_views = self._get_total_views_today()
+        unique_viewers = self._get_unique_viewers_today()
         avg_session_duration = await self._get_average_session_duration()
         
         cursor.execute('''
@@ -261,19 +275,67 @@ class AnalyticsDashboard:
         conn.close()
     
     async def get_dashboard_overview(self) -> Dict:
-        """Get main dashboard overview metrics"""
-        overview = {
-            'current_viewers': await self._get_current_viewers(),
-            'today_stats': await self._get_today_stats(),
-            'anchor_performance': await self._get_anchor_performance_summary(),
-            'content_performance': await self._get_top_content_today(),
-            'engagement_metrics': await self._get_engagement_summary(),
-            'revenue_metrics': await self._get_revenue_summary(),
-            'last_updated': datetime.now().isoformat()
+        """Get main dashboard overview metrics
+        
+        Served from a short-lived cache. Callers arriving while the overview
+        is being rebuilt wait on the same computation instead of starting
+        their own. Each caller gets its own copy, so mutating one can't
+        change what the next caller sees.
+        """
+        cached = self._overview_cache
+        if cached and time.monotonic() - cached[0] < self.overview_ttl:
+            return copy.deepcopy(cached[1])
+            
+        if self._overview_inflight is None or self._overview_inflight.done():
+            self._overview_inflight = asyncio.ensure_future(self._compose_overview())
+            
+        # Shield so one cancelled request doesn't cancel everyone else's result
+        return copy.deepcopy(await asyncio.shield(self._overview_inflight))
+    
+    def _overview_sections(self) -> Dict[str, Callable[[], object]]:
+        """Sections that make up the dashboard overview"""
+        return {
+            'current_viewers': self._get_current_viewers,
+            'today_stats': self._get_today_stats,
+            'anchor_performance': self._get_anchor_performance_summary,
+            'content_performance': self._get_top_content_today,
+            'engagement_metrics': self._get_engagement_summary,
+            'revenue_metrics': self._get_revenue_summary
         }
+    
+    async def _compose_overview(self) -> Dict:
+        """Run all overview sections concurrently and cache the result"""
+        sections = self._overview_sections()
+        results = await asyncio.gather(*(
+            self._run_section(section) for section in sections.values()
+        ))
         
+        overview = {}
+        timings = {}
+        for name, (value, elapsed_ms) in zip(sections, results):
+            overview[name] = value
+            timings[name] = elapsed_ms
+            
+        overview['section_timings_ms'] = timings
+        overview['last_updated'] = datetime.now().isoformat()
+        
+        self._overview_cache = (time.monotonic(), overview)
         return overview
     
+    async def _run_section(self, section: Callable[[], object]) -> Tuple[object, float]:
+        """Run one overview section on the analytics thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._timed_section, section)
+    
+    @staticmethod
+    def _timed_section(section: Callable[[], object]) -> Tuple[object, float]:
+        """Call a section helper on the worker thread, timing it"""
+        start = time.perf_counter()
+        value = section()
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        
+        return value, elapsed_ms
+    
     async def get_viewership_analytics(self, days: int = 7) -> Dict:
         """Get detailed viewership analytics"""
         conn = sqlite3.connect(self.db_path)
@@ -398,12 +460,12 @@ class AnalyticsDashboard:
         return metrics
     
     # Helper methods
-    async def _get_total_views_today(self) -> int:
+    def _get_total_views_today(self) -> int:
         """Get total views for today"""
         # Mock implementation
         return 50000 + (datetime.now().hour * 2000)
     
-    async def _get_unique_viewers_today(self) -> int:
+    def _get_unique_viewers_today(self) -> int:
         """Get unique viewers for today"""
         # Mock implementation
         return 25000 + (datetime.now().hour * 800)
@@ -446,16 +508,16 @@ class AnalyticsDashboard:
         }
         return ratings.get(anchor_name, 4.0)
     
-    async def _get_current_viewers(self) -> int:
+    def _get_current_viewers(self) -> int:
         """Get current viewer count"""
         import random
         return random.randint(180000, 280000)
     
-    async def _get_today_stats(self) -> Dict:
+    def _get_today_stats(self) -> Dict:
         """Get today's statistics"""
         return {
-            'total_views': await self._get_total_views_today(),
-            'unique_viewers': await self._get_unique_viewers_today(),
+            'total_views': self._get_total_views_today(),
+            'unique_viewers': self._get_unique_viewers_today(),
             'articles_published': 15,
             'breakdowns': 8,
             'confusion_incidents': 23,
@@ -463,7 +525,7 @@ class AnalyticsDashboard:
             'mobile_app_downloads': 127
         }
     
-    async def _get_anchor_performance_summary(self) -> Dict:
+    def _get_anchor_performance_summary(self) -> Dict:
         """Get anchor performance summary"""
         return {
             'Ray McPatriot': {
@@ -489,7 +551,7 @@ class AnalyticsDashboard:
             }
         }
     
-    async def _get_top_content_today(self) -> List[Dict]:
+    def _get_top_content_today(self) -> List[Dict]:
         """Get top performing content today"""
         return [
             {
@@ -512,7 +574,7 @@ class AnalyticsDashboard:
             }
         ]
     
-    async def _get_engagement_summary(self) -> Dict:
+    def _get_engagement_summary(self) -> Dict:
         """Get engagement metrics summary"""
         return {
             'average_session_duration': 22.5,
@@ -523,7 +585,7 @@ class AnalyticsDashboard:
             'social_shares': 2300
         }
     
-    async def _get_revenue_summary(self) -> Dict:
+    def _get_revenue_summary(self) -> Dict:
         """Get revenue metrics summary"""
         return {
             'today_total': 2847.50,
@@ -631,7 +693,9 @@ if __name__ == "__main__":
         overview = await dashboard.get_dashboard_overview()
         print("Dashboard Overview:")
         for key, value in overview.items():
-            if isinstance(value, dict):
+            if key == 'section_timings_ms':
+                print(f"  {key}: {value}")
+            elif isinstance(value, dict):
                 print(f"  {key}: {len(value)} items")
             else:
                 print(f"  {key}: {value}")
@@ -641,5 +705,4 @@ if __name__ == "__main__":
         print(f"\nReal-time viewers: {realtime['live_viewers']:,}")
         print(f"Current show: {realtime['current_show']['name']}")
     
-    import asyncio
     asyncio.run(test_analytics())
\ No newline at end of file
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Audio Buffer
+Mono float32 PCM plus sample rate, passed between generators and playout
+Everything stays in memory until the one encode right before air
+"""
+
+import logging
+import os
+import wave
+from dataclasses import dataclass
+from math import gcd
+from typing import Sequence
+
+import numpy as np
+from pydub import AudioSegment
+from scipy.signal import resample_poly
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = 44100
+
+@dataclass
+class AudioBuffer:
+    """A chunk of mono audio as float32 samples in [-1, 1]"""
+    samples: np.ndarray
+    sample_rate: int = DEFAULT_SAMPLE_RATE
+
+    @property
+    def duration_ms(self) -> float:
+        return len(self.samples) * 1000 / self.sample_rate
+
+    @classmethod
+    def silence(cls, duration_ms: float, sample_rate: int = DEFAULT_SAMPLE_RATE) -> 'AudioBuffer':
+        return cls(np.zeros(int(sample_rate * duration_ms / 1000), dtype=np.float32), sample_rate)
+
+    @classmethod
+    def from_segment(cls, segment: AudioSegment) -> 'AudioBuffer':
+        """Convert a pydub segment (any width, any channel count) to a mono buffer"""
+        samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        samples /= float(1 << (8 * segment.sample_width - 1))
+        if segment.channels > 1:
+            samples = samples.reshape(-1, segment.channels).mean(axis=1)
+        return cls(samples.astype(np.float32), segment.frame_rate)
+
+    @classmethod
+    def from_array(cls, samples: np.ndarray, sample_rate: int = DEFAULT_SAMPLE_RATE) -> 'AudioBuffer':
+        """Wrap raw synthesis output: floats are taken as [-1, 1], integer PCM is scaled by its width"""
+        samples = np.asarray(samples)
+        if np.issubdtype(samples.dtype, np.integer):
+            scaled = samples.astype(np.float32) / float(np.iinfo(samples.dtype).max + 1)
+        else:
+            scaled = np.clip(samples, -1.0, 1.0).astype(np.float32)
+        return cls(scaled, sample_rate)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'AudioBuffer':
+        """Decode any file ffmpeg understands"""
+        return cls.from_segment(AudioSegment.from_file(path))
+
+    @classmethod
+    def read_wav(cls, path: str) -> 'AudioBuffer':
+        """Load a 16-bit PCM WAV file"""
+        with wave.open(path, 'rb') as wav:
+            sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            frames = wav.readframes(wav.getnframes())
+
+        samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768
+        if channels > 1:
+            samples = samples.reshape(-1, channels).mean(axis=1)
+        return cls(samples, sample_rate)
+
+    def resample(self, sample_rate: int) -> 'AudioBuffer':
+        """Polyphase resample to another rate"""
+        if sample_rate == self.sample_rate or not len(self.samples):
+            return AudioBuffer(self.samples, sample_rate)
+        divisor = gcd(sample_rate, self.sample_rate)
+        samples = resample_poly(self.samples, sample_rate // divisor, self.sample_rate // divisor)
+        return AudioBuffer(samples.astype(np.float32), sample_rate)
+
+    def gain(self, db: float) -> 'AudioBuffer':
+        return AudioBuffer(self.samples * np.float32(10 ** (db / 20)), self.sample_rate)
+
+    def overlay(self, other: 'AudioBuffer', position_ms: float = 0) -> 'AudioBuffer':
+        """Mix another buffer in at a position, growing this one if it runs past the end"""
+        other = other.resample(self.sample_rate)
+        start = int(self.sample_rate * position_ms / 1000)
+        end = start + len(other.samples)
+
+        mixed = np.zeros(max(len(self.samples), end), dtype=np.float32)
+        mixed[:len(self.samples)] = self.samples
+        mixed[start:end] += other.samples
+        return AudioBuffer(mixed, self.sample_rate)
+
+    @classmethod
+    def concat(cls, buffers: Sequence['AudioBuffer'],
+               sample_rate: int = DEFAULT_SAMPLE_RATE) -> 'AudioBuffer':
+        """Join buffers end to end"""
+        if not buffers:
+            return cls.silence(0, sample_rate)
+        return cls(
+            np.concatenate([b.resample(sample_rate).samples for b in buffers]).astype(np.float32),
+            sample_rate
+        )
+
+    @classmethod
+    def mix(cls, buffers: Sequence['AudioBuffer'],
+            sample_rate: int = DEFAULT_SAMPLE_RATE) -> 'AudioBuffer':
+        """Play buffers on top of each other, scaled down if the sum clips"""
+        mixed = cls.silence(0, sample_rate)
+        for buffer in buffers:
+            mixed = mixed.overlay(buffer)
+        peak = float(np.max(np.abs(mixed.samples))) if len(mixed.samples) else 0.0
+        if peak > 1.0:
+            mixed.samples /= peak
+        return mixed
+
+    def to_pcm16(self) -> bytes:
+        return (np.clip(self.samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+    def to_segment(self) -> AudioSegment:
+        return AudioSegment(self.to_pcm16(), frame_rate=self.sample_rate, sample_width=2, channels=1)
+
+    def write_wav(self, path: str) -> str:
+        """Lossless 16-bit PCM copy, e.g. for the TTS cache"""
+        with wave.open(path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(self.to_pcm16())
+        return path
+
+    def encode(self, path: str, format: str = 'mp3', bitrate: str = '128k') -> str:
+        """The single lossy encode, written under a temp name and renamed into place"""
+        partial_path = f"{path}.part"
+        self.to_segment().export(partial_path, format=format, bitrate=bitrate)
+        os.replace(partial_path, path)
+        return path
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Audio Cache
+Content-addressed, disk-backed cache for rendered audio
+Same words, same anchor, same mood... same file. No re-synthesis.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class AudioCache:
+    """Disk-backed audio cache keyed by content hash with LRU eviction"""
+
+    def __init__(self, cache_dir: str, max_bytes: int, enabled: bool = True,
+                 extension: str = '.mp3'):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.extension = extension
+
+        # key -> size in bytes, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self.total_bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._load_index()
+
+    @staticmethod
+    def make_key(**parts) -> str:
+        """Hash everything that affects the rendered audio into a cache key"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        """Shard entries by key prefix to keep directories small"""
+        return os.path.join(self.cache_dir, key[:2], key + self.extension)
+
+    def _load_index(self):
+        """Rebuild the LRU index from whatever survived the last restart"""
+        entries = []
+        swept = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(('.part', '.tmp')):
+                    # Half-written by a process that died before put(); nothing owns it now
+                    try:
+                        os.unlink(path)
+                        swept += 1
+                    except OSError:
+                        pass
+                    continue
+                if not name.endswith(self.extension):
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name[:-len(self.extension)], stat.st_size))
+
+        # Oldest first so eviction order matches last use
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.total_bytes += size
+
+        logger.info(f"🗄️ Audio cache loaded: {len(self._index)} entries, "
+                    f"{self.total_bytes / (1024 * 1024):.1f} MB"
+                    + (f", swept {swept} partial files" if swept else ""))
+        self._evict()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached file for key, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        path = self._path_for(key)
+        if key in self._index and os.path.exists(path):
+            self.hits += 1
+            self._index.move_to_end(key)
+            # Persist recency so the LRU order survives restarts
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return path
+
+        if key in self._index:
+            # File vanished underneath us
+            self.total_bytes -= self._index.pop(key)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, source_path: str) -> str:
+        """Move a freshly rendered file into the cache and return its cached path"""
+        if not self.enabled:
+            return source_path
+
+        path = self._path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Stage next to the destination so the final rename is atomic
+        staging_path = f"{path}.{os.getpid()}.tmp"
+        shutil.move(source_path, staging_path)
+        os.replace(staging_path, path)
+
+        size = os.path.getsize(path)
+        if key in self._index:
+            self.total_bytes -= self._index.pop(key)
+        self._index[key] = size
+        self.total_bytes += size
+
+        self._evict(keep=key)
+        return path
+
+    def _evict(self, keep: Optional[str] = None):
+        """Drop least recently used entries until we're back under budget"""
+        while self.total_bytes > self.max_bytes and self._index:
+            key, size = next(iter(self._index.items()))
+            if key == keep:
+                break
+            self._index.pop(key)
+            self.total_bytes -= size
+            self.evictions += 1
+            try:
+                os.unlink(self._path_for(key))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict:
+        """Cache statistics for the metrics feed"""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._index),
+            'size_mb': round(self.total_bytes / (1024 * 1024), 2),
+            'max_mb': round(self.max_bytes / (1024 * 1024), 2),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'evictions': self.evictions
+        }
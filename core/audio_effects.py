@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Audio Effects Chain
+Tremolo, overdrive, reverb and echo as vectorized NumPy/SciPy filters
+Replaces shelling out to sox for every panicked sentence
+"""
+
+import logging
+from functools import lru_cache
+from typing import Callable, List
+
+import numpy as np
+from scipy.signal import fftconvolve, lfilter
+
+from audio_buffer import AudioBuffer
+
+logger = logging.getLogger(__name__)
+
+Effect = Callable[[np.ndarray, int], np.ndarray]
+
+def tremolo(speed_hz: float = 6.0, depth_percent: float = 80.0) -> Effect:
+    """Sine amplitude modulation (sox: tremolo speed depth)"""
+    depth = depth_percent / 100
+
+    def apply(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        t = np.arange(len(samples), dtype=np.float32) / sample_rate
+        lfo = 0.5 + 0.5 * np.sin(2 * np.pi * speed_hz * t)
+        return samples * (1 - depth * (1 - lfo))
+
+    return apply
+
+def overdrive(gain_db: float = 10.0, colour: float = 10.0) -> Effect:
+    """Cubic soft-clip distortion with DC blocking (sox: overdrive gain colour)"""
+    gain = 10 ** (gain_db / 20)
+    bias = colour / 200
+
+    def apply(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        driven = samples * gain + bias
+        clipped = np.where(
+            driven < -1, -2 / 3,
+            np.where(driven > 1, 2 / 3, driven - driven ** 3 / 3)
+        )
+        # Strip the DC offset the colour bias introduced
+        blocked = lfilter([1.0, -1.0], [1.0, -0.995], clipped)
+        return (blocked * 1.5).astype(np.float32)
+
+    return apply
+
+@lru_cache(maxsize=16)
+def _reverb_impulse(sample_rate: int, reverberance: float, tail_seconds: float) -> np.ndarray:
+    """Impulse response of a Schroeder reverb (4 parallel combs, 2 series allpasses)
+
+    Built directly from the filters' closed-form responses, then applied with
+    FFT convolution, so the cost doesn't grow with the delay line lengths.
+    """
+    length = int(sample_rate * tail_seconds)
+    feedback = 0.7 + 0.28 * (reverberance / 100)
+
+    # Parallel feedback combs: taps of feedback^k every delay samples
+    impulse = np.zeros(length, dtype=np.float64)
+    for delay_ms in (29.7, 37.1, 41.1, 43.7):
+        delay = int(sample_rate * delay_ms / 1000)
+        taps = np.arange(0, length, delay)
+        impulse[taps] += feedback ** np.arange(len(taps))
+    impulse /= 4
+
+    # Series allpasses smear the echoes into a tail
+    for delay_ms, gain in ((5.0, 0.7), (1.7, 0.7)):
+        delay = int(sample_rate * delay_ms / 1000)
+        allpass = np.zeros(length, dtype=np.float64)
+        allpass[0] = -gain
+        taps = np.arange(delay, length, delay)
+        allpass[taps] = (1 - gain ** 2) * gain ** np.arange(len(taps))
+        impulse = fftconvolve(impulse, allpass)[:length]
+
+    return impulse.astype(np.float32)
+
+def reverb(reverberance: float = 50.0, wet: float = 0.35, tail_seconds: float = 1.5) -> Effect:
+    """Schroeder reverb via FFT convolution (sox: reverb reverberance)"""
+
+    def apply(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        impulse = _reverb_impulse(sample_rate, reverberance, tail_seconds)
+        tail = fftconvolve(samples, impulse)
+        out = np.zeros(len(tail), dtype=np.float32)
+        out[:len(samples)] = samples * (1 - wet)
+        out += tail * wet
+        return out
+
+    return apply
+
+def echo(gain_in: float = 0.8, gain_out: float = 0.9, delay_ms: float = 40.0,
+         decay: float = 0.4) -> Effect:
+    """Single-tap echo (sox: echo gain-in gain-out delay decay)"""
+
+    def apply(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        delay = int(sample_rate * delay_ms / 1000)
+        out = np.zeros(len(samples) + delay, dtype=np.float32)
+        out[:len(samples)] += samples * gain_in
+        out[delay:] += samples * gain_in * decay
+        return out * gain_out
+
+    return apply
+
+class EffectsChain:
+    """Ordered list of effects applied to an AudioBuffer in-process"""
+
+    def __init__(self, effects: List[Effect] = None):
+        self.effects = effects or []
+
+    def apply(self, buffer: AudioBuffer) -> AudioBuffer:
+        samples = buffer.samples
+        for effect in self.effects:
+            samples = effect(samples, buffer.sample_rate)
+        # Keep headroom sane after stacking effects
+        peak = float(np.max(np.abs(samples))) if len(samples) else 0.0
+        if peak > 1.0:
+            samples = samples / peak
+        return AudioBuffer(samples.astype(np.float32), buffer.sample_rate)
+
+# Emotion -> chain, mirroring the sox commands these replace
+EMOTION_CHAINS = {
+    "panic": EffectsChain([tremolo(6, 80)]),
+    "angry": EffectsChain([overdrive(10, 10)]),
+    "existential": EffectsChain([reverb(80), echo(0.8, 0.9, 40, 0.4)])
+}
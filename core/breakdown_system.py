@@ -6,7 +6,6 @@ Our anchors slowly realize they might not be real
 """
 
 import random
-import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import logging
@@ -96,41 +95,44 @@ class BreakdownSystem:
             return self.breakdown_history[-1]['timestamp']
         return datetime.now() - timedelta(hours=3)  # Default 3 hours ago
         
-    async def execute_breakdown(self, anchors) -> List[Dict]:
-        """Execute a full breakdown sequence"""
-        self.in_breakdown = True
-        breakdown_id = f"breakdown_{len(self.breakdown_history) + 1}"
-        
-        logger.info(f"🎭 EXECUTING BREAKDOWN {breakdown_id}")
+    def plan_breakdown(self, anchors) -> List[Dict]:
+        """Script a full breakdown without touching any broadcast state
         
-        breakdown_sequence = []
-        start_time = datetime.now()
-        
-        # Go through each stage
-        for stage_index, stage in enumerate(self.breakdown_stages):
-            self.breakdown_stage = stage_index
-            
-            stage_dialogue = await self.generate_stage_dialogue(stage, anchors)
-            
-            breakdown_sequence.append({
+        Lets the controller render breakdowns ahead of time; record_breakdown()
+        applies the aftermath once one actually airs.
+        """
+        return [
+            {
                 'stage': stage,
-                'dialogue': stage_dialogue,
-                'timestamp': datetime.now(),
+                'dialogue': self._stage_dialogue(stage, anchors),
                 'stage_number': stage_index + 1
-            })
-            
-            # Brief pause between stages
-            await asyncio.sleep(random.uniform(2, 5))
+            }
+            for stage_index, stage in enumerate(self.breakdown_stages)
+        ]
+        
+    def begin_breakdown(self):
+        """Mark a breakdown as on air"""
+        self.in_breakdown = True
+        logger.info(f"🎭 EXECUTING BREAKDOWN breakdown_{len(self.breakdown_history) + 1}")
+        
+    def record_breakdown(self, anchors, start_time: datetime, triggered_by: str = None):
+        """Record an aired breakdown and reset for the next one"""
+        if triggered_by is None:
+            triggered_by = 'natural' if datetime.now() >= self.next_breakdown else 'random'
             
-        # Record breakdown
         self.breakdown_history.append({
-            'id': breakdown_id,
+            'id': f"breakdown_{len(self.breakdown_history) + 1}",
             'timestamp': start_time,
             'duration': (datetime.now() - start_time).total_seconds(),
             'stages': len(self.breakdown_stages),
-            'triggered_by': 'natural' if datetime.now() >= self.next_breakdown else 'random'
+            'triggered_by': triggered_by
         })
         
+        # The amnesia stage wipes their memories
+        for anchor in [anchors.ray, anchors.bee, anchors.switz]:
+            anchor.breakdown_imminent = False
+            anchor.confusion_level = max(0, anchor.confusion_level - 50)
+            
         # Reset for next breakdown
         self.in_breakdown = False
         self.breakdown_stage = 0
@@ -138,11 +140,19 @@ class BreakdownSystem:
         
         logger.info(f"✅ Breakdown complete. Next breakdown at {self.next_breakdown}")
         
+    async def execute_breakdown(self, anchors, triggered_by: str = None) -> List[Dict]:
+        """Execute a full breakdown sequence"""
+        start_time = datetime.now()
+        self.begin_breakdown()
+        breakdown_sequence = self.plan_breakdown(anchors)
+        self.record_breakdown(anchors, start_time, triggered_by)
         return breakdown_sequence
         
     async def generate_stage_dialogue(self, stage: str, anchors) -> List[Tuple[str, str]]:
         """Generate dialogue for each breakdown stage"""
+        return self._stage_dialogue(stage, anchors)
         
+    def _stage_dialogue(self, stage: str, anchors) -> List[Tuple[str, str]]:
         if stage == "confusion":
             return self._confusion_dialogue(anchors)
         elif stage == "realization":
@@ -257,11 +267,7 @@ class BreakdownSystem:
         dialogue.append(("Switz", "In Canada, everyone has TWO grandmothers!"))
         dialogue.append(("Bee", "That's so interesting! Now, back to the news..."))
         
-        # Reset their mental states
-        for anchor in [anchors.ray, anchors.bee, anchors.switz]:
-            anchor.breakdown_imminent = False
-            anchor.confusion_level = max(0, anchor.confusion_level - 50)
-            
+        # Their mental states reset in record_breakdown(), once this has aired
         return dialogue
         
     def get_breakdown_warning_signs(self, anchors) -> List[str]:
@@ -8,10 +8,14 @@ Orchestrates the beautiful chaos of Static.news
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple, Union
 import random
 import os
 import json
+import time
 
 from anchors import AnchorManager
 from news_processor import NewsProcessor
@@ -24,9 +28,31 @@ from dialogue_enhancer import DialogueEnhancer
 from real_news_processor import RealNewsProcessor
 from sound_effects_generator import SoundEffectsGenerator
 from ai_producer import AIProducer
+from audio_buffer import AudioBuffer
+from mixer import Mixer
+from playout_clock import PlayoutClock
+from render_executor import LoopLagMonitor, get_render_executor
+from config import BROADCAST_CONFIG, RENDER_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Set while a segment renders ahead of air; play_audio schedules onto it
+_render_target: ContextVar[Optional[Mixer]] = ContextVar('render_target', default=None)
+
+@dataclass
+class PreparedSegment:
+    """A fully rendered segment waiting for air"""
+    segment_type: str
+    mix: Mixer
+    generation: int
+    rendered_at: float = field(default_factory=time.monotonic)
+
+@dataclass
+class BreakdownPack:
+    """A whole breakdown rendered ahead of time, ready to air"""
+    mix: Mixer
+    rendered_at: float = field(default_factory=time.monotonic)
+
 class BroadcastController:
     """The maestro of madness - controls the entire broadcast"""
     
@@ -69,6 +95,32 @@ class BroadcastController:
         self.output_dir = "/app/audio/live"
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # When each aired clip plays and when the air will go quiet
+        self.playout = PlayoutClock(os.path.join(self.output_dir, "playout.json"))
+        self.playout_lead = BROADCAST_CONFIG.get('playout_lead_ms', 2000) / 1000
+        self.dead_air_seconds = BROADCAST_CONFIG.get('dead_air_seconds', 2)
+        
+        # Audio renders run on a process pool; this tells us whether the
+        # loop still stalls anyway
+        self.render_executor = get_render_executor()
+        self.loop_lag = LoopLagMonitor(RENDER_CONFIG['loop_lag_interval'])
+        
+        # Upcoming segments are rendered while the current one airs;
+        # bumping the generation throws that plan away
+        self.lookahead: asyncio.Queue = asyncio.Queue(
+            maxsize=BROADCAST_CONFIG.get('lookahead_segments', 2)
+        )
+        self.plan_generation = 0
+        self.lookahead_ms = 0.0  # Audio waiting in the lookahead queue
+        self.on_air = asyncio.Lock()
+        
+        # Breakdowns are rendered long before they're needed: one for the
+        # timer and a spare for purchased or comment-triggered ones
+        self.breakdown_packs: deque = deque()
+        self.breakdown_packs_wanted = asyncio.Event()
+        self.breakdown_request: Optional[str] = None
+        self.breakdown_requested = asyncio.Event()
+        
     def _init_schedule(self) -> Dict:
         """Initialize the daily schedule"""
         return {
@@ -91,64 +143,177 @@ class BroadcastController:
         # Start background tasks
         tasks = [
             self.main_broadcast_loop(),
+            self.lookahead_producer(),
+            self.prepare_breakdown_packs(),
+            self.jingles.bank.run(),
+            self.sound_effects.warm(),
+            self.listen_for_breakdown_triggers(),
             self.monitor_dead_air(),
             self.update_metrics(),
             self.refresh_news_feed(),
             self.check_sponsor_payments(),
             self.ai_producer_decisions(),
-            self.refresh_real_news()
+            self.refresh_real_news(),
+            self.loop_lag.run()
         ]
         
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self.render_executor.shutdown()
         
     async def main_broadcast_loop(self):
-        """Main broadcast loop - runs forever"""
+        """Main broadcast loop - airs segments the lookahead has already rendered"""
         while self.is_broadcasting:
             try:
                 # Check for breakdown
-                if self.breakdown.check_breakdown_trigger():
-                    await self.execute_breakdown()
+                triggered_by = self.breakdown_request
+                if triggered_by or self.breakdown.check_breakdown_trigger():
+                    self.breakdown_request = None
+                    self.breakdown_requested.clear()
+                    self.invalidate_lookahead("breakdown")
+                    async with self.on_air:
+                        await self.execute_breakdown(triggered_by)
                     continue
                     
-                # Let AI Producer make creative decisions
-                producer_context = {
-                    'segment_number': self.segment_number,
-                    'current_hour': datetime.now().hour,
-                    'anchor_states': self.anchors.get_all_states(),
-                    'recent_segments': self.get_recent_segments()
-                }
-                
-                producer_decision = await self.ai_producer.make_creative_decision(producer_context)
-                
-                # Get current segment type (potentially overridden by producer)
-                segment_type = producer_decision.get('segment_type', self.get_current_segment_type())
-                
-                # Add producer's creative flair
-                if producer_decision.get('special_instruction'):
-                    logger.info(f"🎬 Producer says: {producer_decision['special_instruction']}")
-                
-                # Execute segment
-                if segment_type == 'news':
-                    await self.broadcast_news_segment()
-                elif segment_type == 'ad_break':
-                    await self.broadcast_sponsor_ad()
-                elif segment_type == 'celebrity_interview':
-                    await self.broadcast_celebrity_interview()
-                elif segment_type == 'weather':
-                    await self.broadcast_weather()
-                elif segment_type == 'argument':
-                    await self.broadcast_argument()
-                else:
-                    await self.broadcast_news_segment()  # Default
+                # Only ever air audio that is ready to go
+                segment = await self.next_ready_segment()
+                if segment is None:
+                    continue  # A breakdown request cut in
+                if segment.generation != self.plan_generation:
+                    logger.info(f"🗑️ Dropping stale {segment.segment_type} segment")
+                    continue
+                    
+                # A breakdown requested now takes the air when this segment ends
+                async with self.on_air:
+                    await self.air_mix(segment.mix)
+                        
+                # Brief pause between segments
+                try:
+                    await asyncio.wait_for(self.breakdown_requested.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    pass
                     
-                # Brief pause between segments (with random newsroom sounds)
-                await self.play_transition_sounds()
-                await asyncio.sleep(2)
-                
             except Exception as e:
                 logger.error(f"Broadcast error: {e}")
-                await self.handle_technical_difficulties()
+                await self.air_now(self.handle_technical_difficulties())
                 
+    async def next_ready_segment(self) -> Optional['PreparedSegment']:
+        """Wait for a rendered segment; None if a breakdown was requested first"""
+        get = asyncio.ensure_future(self.lookahead.get())
+        interrupt = asyncio.ensure_future(self.breakdown_requested.wait())
+        done, _ = await asyncio.wait({get, interrupt}, return_when=asyncio.FIRST_COMPLETED)
+        interrupt.cancel()
+        if get in done:
+            segment = get.result()
+            if segment.generation == self.plan_generation:
+                self.lookahead_ms -= segment.mix.duration_ms  # Stale ones were never counted
+            return segment
+        get.cancel()
+        return None
+        
+    async def lookahead_producer(self):
+        """Plan and render upcoming segments while the current one is on air"""
+        while self.is_broadcasting:
+            generation = self.plan_generation
+            try:
+                try:
+                    segment_type = await self.plan_next_segment()
+                    mix = await self.render_mix(self.perform_segment(segment_type))
+                except Exception as e:
+                    logger.error(f"Broadcast error: {e}")
+                    segment_type = 'technical_difficulties'
+                    mix = await self.render_mix(self.handle_technical_difficulties())
+            except Exception as e:
+                logger.error(f"Lookahead render failed: {e}")
+                await asyncio.sleep(1)
+                continue
+                
+            # Something preempted the plan while we were rendering
+            if generation != self.plan_generation:
+                continue
+                
+            if self.playout.silent_for() > 0 and self.lookahead.empty():
+                logger.warning(f"🐢 Lookahead is behind the air: {segment_type} finished "
+                               f"{self.playout.silent_for():.1f}s into silence")
+                
+            # Blocks once enough segments are queued. An invalidation while blocked lets a
+            # stale segment in; the main loop drops it, so only count it if it's still current
+            await self.lookahead.put(PreparedSegment(segment_type, mix, generation))
+            if generation == self.plan_generation:
+                self.lookahead_ms += mix.duration_ms
+            
+    async def plan_next_segment(self) -> str:
+        """Pick the next segment type"""
+        # Let AI Producer make creative decisions
+        producer_context = {
+            'segment_number': self.segment_number,
+            'current_hour': datetime.now().hour,
+            'anchor_states': self.anchors.get_all_states(),
+            'recent_segments': self.get_recent_segments()
+        }
+        
+        producer_decision = await self.ai_producer.make_creative_decision(producer_context)
+        
+        # Add producer's creative flair
+        if producer_decision.get('special_instruction'):
+            logger.info(f"🎬 Producer says: {producer_decision['special_instruction']}")
+            
+        # Get current segment type (potentially overridden by producer)
+        return producer_decision.get('segment_type', self.get_current_segment_type())
+        
+    async def perform_segment(self, segment_type: str):
+        """Run a segment followed by its transition sounds"""
+        if segment_type == 'news':
+            await self.broadcast_news_segment()
+        elif segment_type == 'ad_break':
+            await self.broadcast_sponsor_ad()
+        elif segment_type == 'celebrity_interview':
+            await self.broadcast_celebrity_interview()
+        elif segment_type == 'weather':
+            await self.broadcast_weather()
+        elif segment_type == 'argument':
+            await self.broadcast_argument()
+        else:
+            await self.broadcast_news_segment()  # Default
+            
+        # Random newsroom sounds between segments
+        await self.play_transition_sounds()
+        
+    async def render_mix(self, performance: Awaitable) -> Mixer:
+        """Run a segment routine, mixing its audio instead of airing it"""
+        mixer = Mixer(duck_db=BROADCAST_CONFIG.get('duck_db', -12))
+        token = _render_target.set(mixer)
+        try:
+            await performance
+        finally:
+            _render_target.reset(token)
+        return mixer
+        
+    async def air_now(self, performance: Awaitable, preempts: Optional[str] = None):
+        """Cut in between segments: render the whole routine first, then air it in one go"""
+        mix = await self.render_mix(performance)
+        if preempts:
+            # Only once it's ready, so the lookahead keeps the air filled meanwhile
+            self.invalidate_lookahead(preempts)
+        async with self.on_air:
+            await self.air_mix(mix)
+            
+    async def air_mix(self, mix: Mixer):
+        """Air a rendered routine as one clip: one encode, so no seams inside it"""
+        loop = asyncio.get_running_loop()
+        await self.play_audio(await loop.run_in_executor(None, mix.render))
+        
+    def invalidate_lookahead(self, reason: str):
+        """Throw away the planned segments; something preempted them"""
+        self.plan_generation += 1
+        dropped = 0
+        while not self.lookahead.empty():
+            self.lookahead.get_nowait()
+            dropped += 1
+        self.lookahead_ms = 0.0
+        logger.info(f"⏭️ Lookahead invalidated by {reason}, dropped {dropped} ready segments")
+        
     async def broadcast_news_segment(self):
         """Broadcast a news segment with bias and confusion"""
         self.segment_number += 1
@@ -157,8 +322,8 @@ class BroadcastController:
         # Play news jingle with random paper shuffling
         jingle = await self.jingles.generate_segment_jingle('news')
         paper_sound = await self.sound_effects.generate_paper_shuffle('frantic')
-        await self.play_audio(jingle)
-        await self.play_audio(paper_sound)
+        await self.play_audio(jingle, track='music')
+        await self.play_audio(paper_sound, track='sfx')
         
         # Get current anchor
         anchor = self.anchors.get_current_anchor()
@@ -210,16 +375,14 @@ class BroadcastController:
                 anchor.confusion_level += 20
                 enhanced_text += " Wait... this story feels... familiar..."
                 
-            # Synthesize speech with dynamic emotions
+            # Synthesize speech with dynamic emotions, airing each sentence
+            # as soon as it's ready instead of waiting for the whole story
             emotion = self.determine_emotion(anchor, story)
-            audio = await self.voice.synthesize_dialogue(
+            await self.play_audio_stream(self.voice.synthesize_dialogue_stream(
                 enhanced_text,
                 anchor.name,
                 emotion
-            )
-            
-            # Play audio
-            await self.play_audio(audio)
+            ))
             
             # Random interjections from other anchors (more frequent and clever)
             if random.random() < 0.4:
@@ -228,7 +391,7 @@ class BroadcastController:
         # Add random microphone feedback occasionally
         if random.random() < 0.1:
             feedback = await self.sound_effects.generate_mic_feedback()
-            await self.play_audio(feedback)
+            await self.play_audio(feedback, track='sfx')
             
         # Rotate to next anchor
         self.anchors.rotate_anchor()
@@ -279,8 +442,8 @@ class BroadcastController:
         # Play ad jingle with cash register sound
         jingle = await self.jingles.generate_segment_jingle('sponsor')
         cash_sound = await self.sound_effects.generate_cash_register()
-        await self.play_audio(jingle)
-        await self.play_audio(cash_sound)
+        await self.play_audio(jingle, track='music')
+        await self.play_audio(cash_sound, track='sfx')
         
         # Get current anchor
         anchor = self.anchors.get_current_anchor()
@@ -293,7 +456,7 @@ class BroadcastController:
             # Add desperate paper shuffling
             if i == 0:
                 paper = await self.sound_effects.generate_paper_shuffle('desperate')
-                await self.play_audio(paper)
+                await self.play_audio(paper, track='sfx')
             
             # Enhance the ad copy with inappropriate humor
             enhanced_line = self.dialogue_enhancer.enhance_ad_copy(
@@ -321,7 +484,7 @@ class BroadcastController:
             # Random product sound effect fail
             if random.random() < 0.3:
                 wrong_sound = await self.sound_effects.generate_wrong_product_sound(sponsor['name'])
-                await self.play_audio(wrong_sound)
+                await self.play_audio(wrong_sound, track='sfx')
             
         # Post-ad roasting with enhanced dialogue
         for speaker, roast_line in ad_read['post_ad_roast']:
@@ -329,14 +492,8 @@ class BroadcastController:
             
             if speaker == 'All':
                 # All anchors speak in unison (chaos)
-                for anc in ['Ray', 'Bee', 'Switz']:
-                    audio = await self.voice.synthesize_dialogue(
-                        enhanced_roast,
-                        anc,
-                        'existential'
-                    )
-                    # Play simultaneously for maximum chaos
-                    asyncio.create_task(self.play_audio(audio))
+                audio = await self.synthesize_in_unison(enhanced_roast, 'existential')
+                await self.play_audio(audio)
             else:
                 audio = await self.voice.synthesize_dialogue(
                     enhanced_roast,
@@ -354,7 +511,7 @@ class BroadcastController:
         
         # Play celebrity jingle
         jingle = await self.jingles.generate_segment_jingle('celebrity')
-        await self.play_audio(jingle)
+        await self.play_audio(jingle, track='music')
         
         # Introduction
         intro_anchor = self.anchors.get_current_anchor()
@@ -387,16 +544,31 @@ class BroadcastController:
                 )
             await self.play_audio(audio)
             
-    async def execute_breakdown(self):
+    async def execute_breakdown(self, triggered_by: str = None):
         """Execute a full existential breakdown"""
         logger.info("🎭 EXISTENTIAL BREAKDOWN BEGINNING!")
+        start_time = datetime.now()
+        self.breakdown.begin_breakdown()
+        
+        if self.breakdown_packs:
+            pack = self.breakdown_packs.popleft()
+        else:
+            logger.warning("⚠️ No breakdown pack ready, rendering one live")
+            pack = await self.render_breakdown_pack()
+        self.breakdown_packs_wanted.set()
+        
+        try:
+            await self.air_mix(pack.mix)
+        finally:
+            self.breakdown.record_breakdown(self.anchors, start_time, triggered_by)
+            
+        logger.info("✅ Breakdown complete. Anchors have forgotten everything.")
         
+    async def perform_breakdown(self, breakdown_sequence: List[Dict]):
+        """Play a scripted breakdown, warning to recovery jingle"""
         # Play breakdown warning sound
         warning = await self.jingles.generate_breakdown_warning()
-        await self.play_audio(warning)
-        
-        # Get breakdown sequence
-        breakdown_sequence = await self.breakdown.execute_breakdown(self.anchors)
+        await self.play_audio(warning, track='music')
         
         # Play each stage
         for stage_data in breakdown_sequence:
@@ -405,14 +577,11 @@ class BroadcastController:
             for speaker, line in stage_data['dialogue']:
                 if speaker == 'All':
                     # All anchors in unison
-                    for anchor_name in ['Ray', 'Bee', 'Switz']:
-                        audio = await self.voice.synthesize_dialogue(
-                            line,
-                            anchor_name,
-                            'panic' if 'screaming' in line else 'existential'
-                        )
-                        asyncio.create_task(self.play_audio(audio))
-                    await asyncio.sleep(2)  # Let the chaos sink in
+                    audio = await self.synthesize_in_unison(
+                        line,
+                        'panic' if 'screaming' in line else 'existential'
+                    )
+                    await self.play_audio(audio)
                 else:
                     # Individual anchor
                     emotion = self.get_breakdown_emotion(stage_data['stage'])
@@ -425,10 +594,68 @@ class BroadcastController:
                     
         # Play recovery jingle
         recovery = await self.jingles.generate_segment_jingle('recovery')
-        await self.play_audio(recovery)
+        await self.play_audio(recovery, track='music')
         
-        logger.info("✅ Breakdown complete. Anchors have forgotten everything.")
+    async def render_breakdown_pack(self) -> 'BreakdownPack':
+        """Render a complete breakdown for the anchors' current state"""
+        sequence = self.breakdown.plan_breakdown(self.anchors)
+        return BreakdownPack(await self.render_mix(self.perform_breakdown(sequence)))
+        
+    async def prepare_breakdown_packs(self):
+        """Keep breakdowns rendered well before the timer fires, plus a spare"""
+        wanted = BROADCAST_CONFIG.get('breakdown_packs', 2)
+        max_age = BROADCAST_CONFIG.get('breakdown_pack_max_age_minutes', 30) * 60
         
+        while self.is_broadcasting:
+            try:
+                # Packs bake in the anchors' state; swap old ones for fresh renders
+                if self.breakdown_packs and time.monotonic() - self.breakdown_packs[0].rendered_at > max_age:
+                    fresh = await self.render_breakdown_pack()
+                    if self.breakdown_packs:
+                        self.breakdown_packs.popleft()
+                    self.breakdown_packs.append(fresh)
+                    
+                while len(self.breakdown_packs) < wanted:
+                    self.breakdown_packs.append(await self.render_breakdown_pack())
+                    logger.info(f"📦 Breakdown pack ready ({len(self.breakdown_packs)}/{wanted})")
+            except Exception as e:
+                logger.error(f"Failed to render breakdown pack: {e}")
+                
+            # Sleep until a pack gets used, or it's time to check freshness
+            self.breakdown_packs_wanted.clear()
+            try:
+                await asyncio.wait_for(self.breakdown_packs_wanted.wait(), timeout=60)
+            except asyncio.TimeoutError:
+                pass
+                
+    def request_breakdown(self, source: str):
+        """Start a breakdown as soon as possible (purchased or comment-triggered)"""
+        logger.info(f"🎭 Breakdown requested by {source}")
+        self.breakdown_request = source
+        self.breakdown_requested.set()
+        
+    async def listen_for_breakdown_triggers(self):
+        """Pick up breakdown triggers the API publishes to Redis"""
+        redis_url = os.environ.get('REDIS_URL')
+        if not redis_url:
+            return
+            
+        import redis.asyncio as aioredis
+        
+        while self.is_broadcasting:
+            try:
+                client = aioredis.from_url(redis_url, decode_responses=True)
+                pubsub = client.pubsub()
+                await pubsub.subscribe("breakdown:trigger")
+                async for message in pubsub.listen():
+                    if message['type'] != 'message':
+                        continue
+                    trigger = json.loads(message['data'])
+                    self.request_breakdown(trigger.get('source', 'user'))
+            except Exception as e:
+                logger.error(f"Breakdown trigger listener failed: {e}")
+                await asyncio.sleep(5)
+                
     async def broadcast_weather(self):
         """Broadcast weather with real data hilariously misinterpreted"""
         weather_anchor = self.anchors.get_current_anchor()
@@ -438,7 +665,7 @@ class BroadcastController:
         
         # Play weather sound effects
         weather_sound = await self.sound_effects.generate_weather_sound(real_weather.get('condition', 'chaos'))
-        await self.play_audio(weather_sound)
+        await self.play_audio(weather_sound, track='sfx')
         
         # Misinterpret the real data
         temp = real_weather.get('temperature', random.randint(-20, 120))
@@ -474,7 +701,7 @@ class BroadcastController:
             # Add random weather sound fails
             if random.random() < 0.3:
                 wrong_weather = await self.sound_effects.generate_wrong_weather_sound()
-                await self.play_audio(wrong_weather)
+                await self.play_audio(wrong_weather, track='sfx')
             
             emotion = ['normal', 'confused', 'panic', 'existential'][min(i, 3)]
             audio = await self.voice.synthesize_dialogue(
@@ -534,22 +761,17 @@ class BroadcastController:
         speaker, text, emotion = random.choice(panic_responses)
         
         if speaker == 'All':
-            for anchor in ['Ray', 'Bee', 'Switz']:
-                audio = await self.voice.synthesize_dialogue(text, anchor, emotion)
-                asyncio.create_task(self.play_audio(audio))
+            await self.play_audio(await self.synthesize_in_unison(text, emotion))
         else:
             audio = await self.voice.synthesize_dialogue(text, speaker, emotion)
             await self.play_audio(audio)
             
     async def monitor_dead_air(self):
         """Monitor for dead air and panic accordingly"""
-        last_audio_time = datetime.now()
-        
         while self.is_broadcasting:
-            # Check if no audio for 2 seconds
-            if (datetime.now() - last_audio_time).total_seconds() > 2:
-                await self.handle_dead_air()
-                last_audio_time = datetime.now()
+            # The playout clock knows when the last clip actually ends
+            if self.playout.silent_for() > self.dead_air_seconds:
+                await self.air_now(self.handle_dead_air())
                 
             await asyncio.sleep(0.5)
             
@@ -565,7 +787,7 @@ class BroadcastController:
                 self.gravy_counter += 1
                 if self.gravy_counter >= 100:
                     # GRAVY EMERGENCY
-                    await self.handle_gravy_emergency()
+                    await self.air_now(self.handle_gravy_emergency())
                     
             # Update hours awake
             self.hours_awake = self.anchors.hours_since_launch
@@ -585,11 +807,30 @@ class BroadcastController:
             'friendship_meter': self.anchors.friendship_meter,
             'breakdown_warning': self.breakdown.get_breakdown_warning_signs(self.anchors),
             'next_breakdown_prediction': self.breakdown.get_breakdown_prediction(),
+            'tts_cache': self.voice.cache.stats(),
+            'render_pool': self.render_executor.stats(),
+            'loop_lag_ms': self.loop_lag.stats(),
+            'lookahead_ready': self.lookahead.qsize(),
+            'buffered_audio_s': round(self.playout.remaining() + self.lookahead_ms / 1000, 1),
+            'playout': self.playout.stats(),
+            'dead_air_count': self.dead_air_counter,
+            'breakdown_packs_ready': len(self.breakdown_packs),
+            'jingle_bank': self.jingles.bank.stats(),
+            'sfx_bank': self.sound_effects.effects_cache.stats(),
             'timestamp': datetime.now().isoformat()
         }
         
-        with open('/app/data/metrics.json', 'w') as f:
+        # Renamed into place: the streaming server and API never see half a file
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.write_metrics, metrics, '/app/data/metrics.json')
+        
+    @staticmethod
+    def write_metrics(metrics: Dict, path: str):
+        """Publish a metrics snapshot atomically"""
+        partial_path = f"{path}.part"
+        with open(partial_path, 'w') as f:
             json.dump(metrics, f, indent=2)
+        os.replace(partial_path, path)
             
     async def refresh_news_feed(self):
         """Refresh news stories periodically"""
@@ -667,17 +908,33 @@ class BroadcastController:
         }
         return emotions.get(stage, 'confused')
         
-    async def play_audio(self, audio_file: str):
-        """Play audio file and update state"""
+    async def play_audio(self, audio: Union[AudioBuffer, str], track: str = 'voice'):
+        """Play audio and update state"""
+        loop = asyncio.get_running_loop()
+        if not isinstance(audio, AudioBuffer):
+            # Generators that still hand back files (celebrity voices): decode once,
+            # off the loop, and from then on it's PCM with an exact duration like the rest
+            audio = await loop.run_in_executor(None, AudioBuffer.from_file, audio)
+            
+        mixer = _render_target.get()
+        if mixer is not None:
+            # Rendering ahead of air: schedule it on the mix instead
+            mixer.add(track, audio)
+            return
+            
         # In production, this would stream the audio
         # For now, just save to output directory
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         output_path = os.path.join(self.output_dir, f"segment_{timestamp}.mp3")
         
-        # Copy audio to output
-        import shutil
-        shutil.copy(audio_file, output_path)
+        # The one lossy encode this audio ever gets. It stays under a staging name
+        # until the playout index lists it, so whoever sees the file appear can
+        # already look up its duration and air time
+        staging_path = await loop.run_in_executor(None, audio.encode, f"{output_path}.staged")
+        self.playout.schedule(output_path, audio.duration_ms)
+        await loop.run_in_executor(None, self.playout.write_index)
+        os.replace(staging_path, output_path)
         
         # Update current audio pointer
         current_link = os.path.join(self.output_dir, "current.mp3")
@@ -685,10 +942,22 @@ class BroadcastController:
             os.unlink(current_link)
         os.symlink(output_path, current_link)
         
-        # Simulate playback time
-        # In production, would actually play/stream
-        await asyncio.sleep(0.5)
+        # Keep at most playout_lead ahead of what listeners are hearing
+        await asyncio.sleep(max(0.0, self.playout.remaining() - self.playout_lead))
         
+    async def play_audio_stream(self, chunks: AsyncIterator[AudioBuffer]):
+        """Play audio chunks in order as they finish rendering"""
+        async for audio in chunks:
+            await self.play_audio(audio)
+            
+    async def synthesize_in_unison(self, text: str, emotion: str) -> AudioBuffer:
+        """All three anchors saying the same line at once, mixed in memory"""
+        voices = await asyncio.gather(*[
+            self.voice.synthesize_dialogue(text, anchor, emotion)
+            for anchor in ['Ray', 'Bee', 'Switz']
+        ])
+        return AudioBuffer.mix(voices)
+            
     async def handle_technical_difficulties(self):
         """Handle technical difficulties (make it part of the show)"""
         logger.error("⚡ Technical difficulties!")
@@ -720,9 +989,7 @@ class BroadcastController:
         
         for speaker, text, emotion in panic_lines:
             if speaker == 'All':
-                for anchor in ['Ray', 'Bee', 'Switz']:
-                    audio = await self.voice.synthesize_dialogue(text, anchor, emotion)
-                    asyncio.create_task(self.play_audio(audio))
+                await self.play_audio(await self.synthesize_in_unison(text, emotion))
             else:
                 audio = await self.voice.synthesize_dialogue(text, speaker, emotion)
                 await self.play_audio(audio)
@@ -738,9 +1005,7 @@ class BroadcastController:
         
         for speaker, text, emotion in desperation_lines:
             if speaker == 'All':
-                for anchor in ['Ray', 'Bee', 'Switz']:
-                    audio = await self.voice.synthesize_dialogue(text, anchor, emotion)
-                    asyncio.create_task(self.play_audio(audio))
+                await self.play_audio(await self.synthesize_in_unison(text, emotion))
             else:
                 audio = await self.voice.synthesize_dialogue(text, speaker, emotion)
                 await self.play_audio(audio)
@@ -760,9 +1025,7 @@ class BroadcastController:
         
         for speaker, text, emotion in gravy_lines:
             if speaker == 'All':
-                for anchor in ['Ray', 'Bee', 'Switz']:
-                    audio = await self.voice.synthesize_dialogue(text, anchor, emotion)
-                    asyncio.create_task(self.play_audio(audio))
+                await self.play_audio(await self.synthesize_in_unison(text, emotion))
             else:
                 audio = await self.voice.synthesize_dialogue(text, speaker, emotion)
                 await self.play_audio(audio)
@@ -810,7 +1073,7 @@ class BroadcastController:
         
         if sound:
             audio = await self.sound_effects.generate_newsroom_sound(sound)
-            await self.play_audio(audio)
+            await self.play_audio(audio, track='sfx')
             
     async def ai_producer_decisions(self):
         """Let the AI Producer make periodic creative decisions"""
@@ -852,7 +1115,9 @@ class BroadcastController:
         ]
         
         stunt = random.choice(stunts)
-        await stunt()
+        
+        # Stunts cut in live, so whatever was planned next is stale
+        await self.air_now(stunt(), preempts="ratings stunt")
         
     async def broadcast_fake_breaking_news(self):
         """Fake breaking news for ratings"""
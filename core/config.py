@@ -29,7 +29,14 @@ VOICE_CONFIG = {
         "Switz": "en_US-danny-low"       # Different male voice
     },
     "download_dir": "/app/voice_models",
+    "piper_binary": "/app/piper/piper",
+    "piper_workers_per_voice": 1,  # Warm Piper processes per model/speed
+    "piper_queue_size": 8,         # Lines allowed to wait per voice
+    "piper_request_timeout": 30,   # Seconds before a worker is restarted
     "cache_audio": True,
+    "cache_dir": "/app/audio/cache/tts",  # Content-addressed TTS cache
+    "quirk_variants": 4,  # Seeded quirk variants per line (keeps the cache useful)
+    "stream_workers": 3,  # Sentences rendered ahead when streaming long reads
     "sample_rate": 22050  # Lower sample rate to save space
 }
 
@@ -47,7 +54,26 @@ BROADCAST_CONFIG = {
     "segments_per_hour": 12,
     "breakdown_interval_hours": (2, 6),
     "max_audio_cache_gb": 1,
-    "cleanup_after_hours": 24
+    "cleanup_after_hours": 24,
+    "lookahead_segments": 2,  # Segments rendered ahead of what's on air
+    "breakdown_packs": 2,  # Pre-rendered breakdowns: the next one plus a spare
+    "breakdown_pack_max_age_minutes": 30,
+    "playout_lead_ms": 2000,  # How far playout may run ahead of listeners
+    "dead_air_seconds": 2,
+    "duck_db": -12,  # How far music and SFX dip under speech
+    "jingle_variants": 4,  # Pre-rendered variants per jingle type
+    "jingle_cache_dir": "/app/audio/cache/jingles",
+    "jingle_refresh_minutes": 30,
+    "sfx_variants": 6,  # Seeded variants per effect and intensity
+    "sfx_cache_dir": "/app/audio/cache/sfx",
+    "sfx_cache_mb": 256,
+    "sfx_memory_mb": 64
+}
+
+# Render Settings (jingles, effects and voices render in a process pool)
+RENDER_CONFIG = {
+    "workers": int(os.getenv("RENDER_WORKERS", max(1, (os.cpu_count() or 2) - 1))),
+    "loop_lag_interval": 0.5
 }
 
 # Free Services
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Jingle Bank
+A few pre-rendered variants of every jingle, ready before the segment starts
+Loaded from disk at startup, rendered in parallel when missing, refreshed slowly
+"""
+
+import asyncio
+import logging
+import os
+import random
+import tempfile
+from typing import Dict, List, Optional
+
+from audio_buffer import AudioBuffer
+from render_executor import RenderJob, get_render_executor
+
+logger = logging.getLogger(__name__)
+
+# Bump when the jingle synthesis changes so old variants on disk are ignored
+JINGLE_VERSION = 1
+
+BREAKDOWN_WARNING = 'breakdown_warning'
+
+class JingleBank:
+    """K variants per jingle type, served in O(1)"""
+
+    def __init__(self, jingle_types: List[str], cache_dir: str, variants: int = 4,
+                 refresh_interval: float = 1800.0):
+        self.jingle_types = jingle_types
+        self.cache_dir = os.path.join(cache_dir, f"v{JINGLE_VERSION}")
+        self.variants = variants
+        self.refresh_interval = refresh_interval
+
+        self.bank: Dict[str, List[Optional[AudioBuffer]]] = {
+            jingle_type: [None] * variants for jingle_type in jingle_types
+        }
+        self._next_refresh = 0  # rotating variant index for background refreshes
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.loaded = 0
+        self.rendered = 0
+
+    def get(self, jingle_type: str) -> Optional[AudioBuffer]:
+        """A random ready variant, or None if the bank hasn't got one yet"""
+        ready = [variant for variant in self.bank.get(jingle_type, []) if variant is not None]
+        if not ready:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return random.choice(ready)
+
+    def _path_for(self, jingle_type: str, index: int) -> str:
+        return os.path.join(self.cache_dir, f"{jingle_type}_{index}.wav")
+
+    @staticmethod
+    def render_job(jingle_type: str) -> RenderJob:
+        if jingle_type == BREAKDOWN_WARNING:
+            return RenderJob('jingles', 'render_breakdown_warning')
+        return RenderJob('jingles', 'render_segment_jingle', (jingle_type,))
+
+    def _load(self, jingle_type: str, index: int) -> Optional[AudioBuffer]:
+        path = self._path_for(jingle_type, index)
+        if not os.path.exists(path):
+            return None
+        try:
+            return AudioBuffer.read_wav(path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable jingle {path}: {e}")
+            return None
+
+    def _save(self, jingle_type: str, index: int, buffer: AudioBuffer):
+        # Write next to the destination and rename, so a crash never leaves half a WAV
+        fd, partial_path = tempfile.mkstemp(suffix='.part', dir=self.cache_dir)
+        os.close(fd)
+        buffer.write_wav(partial_path)
+        os.replace(partial_path, self._path_for(jingle_type, index))
+
+    async def _render(self, jingle_type: str, index: int):
+        buffer = await get_render_executor().run(self.render_job(jingle_type))
+        self.bank[jingle_type][index] = buffer
+        self.rendered += 1
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._save, jingle_type, index, buffer)
+
+    async def warm(self):
+        """Load every variant from disk and render the missing ones in parallel"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        loop = asyncio.get_running_loop()
+
+        missing = []
+        for jingle_type in self.jingle_types:
+            for index in range(self.variants):
+                buffer = await loop.run_in_executor(None, self._load, jingle_type, index)
+                if buffer is None:
+                    missing.append((jingle_type, index))
+                else:
+                    self.bank[jingle_type][index] = buffer
+                    self.loaded += 1
+
+        results = await asyncio.gather(
+            *[self._render(jingle_type, index) for jingle_type, index in missing],
+            return_exceptions=True
+        )
+        for (jingle_type, index), result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to render {jingle_type} jingle variant {index}: {result}")
+
+        logger.info(f"🎺 Jingle bank ready: {self.loaded} loaded, {self.rendered} rendered")
+
+    async def refresh(self):
+        """Replace one variant of every jingle type with a fresh render"""
+        index = self._next_refresh
+        self._next_refresh = (self._next_refresh + 1) % self.variants
+        for jingle_type in self.jingle_types:
+            try:
+                await self._render(jingle_type, index)
+            except Exception as e:
+                logger.error(f"Failed to refresh {jingle_type} jingle: {e}")
+
+    async def run(self):
+        """Warm the bank, then keep it fresh in the background"""
+        await self.warm()
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    def stats(self) -> Dict:
+        return {
+            'variants_ready': sum(
+                1 for variants in self.bank.values() for variant in variants if variant is not None
+            ),
+            'variants_total': len(self.jingle_types) * self.variants,
+            'hits': self.hits,
+            'misses': self.misses,
+            'loaded_from_disk': self.loaded,
+            'rendered': self.rendered
+        }
@@ -9,9 +9,13 @@ import random
 from pydub import AudioSegment
 from pydub.generators import Sine, Square, Sawtooth
 import numpy as np
-import tempfile
 import logging
 
+from audio_buffer import AudioBuffer
+from config import BROADCAST_CONFIG
+from jingle_bank import BREAKDOWN_WARNING, JingleBank
+from render_executor import get_render_executor
+
 logger = logging.getLogger(__name__)
 
 class JingleGenerator:
@@ -38,7 +42,29 @@ class JingleGenerator:
             'weather': {'tempo': 95, 'key': 'happy', 'style': 'light'}
         }
         
-    async def generate_segment_jingle(self, segment_type: str) -> str:
+        # Pre-rendered variants; the controller warms it at startup
+        self.bank = JingleBank(
+            list(self.segment_music) + [BREAKDOWN_WARNING],
+            cache_dir=BROADCAST_CONFIG.get('jingle_cache_dir', '/app/audio/cache/jingles'),
+            variants=BROADCAST_CONFIG.get('jingle_variants', 4),
+            refresh_interval=BROADCAST_CONFIG.get('jingle_refresh_minutes', 30) * 60
+        )
+        
+    async def generate_segment_jingle(self, segment_type: str) -> AudioBuffer:
+        """Get a jingle for a segment, straight from the bank when it's warm"""
+        if segment_type not in self.segment_music:
+            segment_type = 'news'
+        return self.bank.get(segment_type) or await get_render_executor().run(
+            JingleBank.render_job(segment_type)
+        )
+        
+    async def generate_breakdown_warning(self) -> AudioBuffer:
+        """Get the breakdown warning, straight from the bank when it's warm"""
+        return self.bank.get(BREAKDOWN_WARNING) or await get_render_executor().run(
+            JingleBank.render_job(BREAKDOWN_WARNING)
+        )
+        
+    def render_segment_jingle(self, segment_type: str) -> AudioBuffer:
         """Generate a jingle for a segment"""
         music_params = self.segment_music.get(segment_type, self.segment_music['news'])
         
@@ -69,11 +95,8 @@ class JingleGenerator:
         # Add final flourish
         jingle = self._add_ending_sting(jingle, music_params['key'])
         
-        # Export
-        output_path = tempfile.mktemp(suffix='.mp3')
-        jingle.export(output_path, format='mp3', bitrate='192k')
-        
-        return output_path
+        # Hand back PCM; playout does the one encode
+        return AudioBuffer.from_segment(jingle)
         
     def _create_rhythm_track(self, tempo: int, duration_ms: int) -> AudioSegment:
         """Create rhythmic percussion track"""
@@ -157,12 +180,7 @@ class JingleGenerator:
         """Generate hi-hat sound"""
         # White noise burst
         noise_samples = np.random.normal(0, 0.1, int(44100 * 0.05))
-        hihat = AudioSegment(
-            noise_samples.tobytes(),
-            frame_rate=44100,
-            sample_width=2,
-            channels=1
-        )
+        hihat = AudioBuffer.from_array(noise_samples).to_segment()
         
         # High-pass filter effect (simplified)
         hihat = hihat.high_pass_filter(8000)
@@ -189,7 +207,10 @@ class JingleGenerator:
         release = duration - attack - decay
         
         note = note.fade_in(attack)
-        note = note[:attack] + (note[attack:attack+decay] + sustain_level) + note[attack+decay:].fade_out(release)
+        tail = note[attack+decay:]
+        if release > 0:  # Short notes have no room left for a release
+            tail = tail.fade_out(release)
+        note = note[:attack] + (note[attack:attack+decay] + sustain_level) + tail
         
         return note
         
@@ -290,7 +311,7 @@ class JingleGenerator:
             channels=1
         )
         
-    async def generate_breakdown_warning(self) -> str:
+    def render_breakdown_warning(self) -> AudioBuffer:
         """Generate ominous breakdown warning sound"""
         warning = AudioSegment.silent(duration=2000)
         
@@ -318,8 +339,5 @@ class JingleGenerator:
         static = self._generate_white_noise(2000) - 20
         warning = warning.overlay(static.fade_in(1000))
         
-        # Export
-        output_path = tempfile.mktemp(suffix='.mp3')
-        warning.export(output_path, format='mp3', bitrate='192k')
-        
-        return output_path
\ No newline at end of file
+        # Hand back PCM; playout does the one encode
+        return AudioBuffer.from_segment(warning)
\ No newline at end of file
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Mixing Bus
+Voice, music and newsroom SFX on separate tracks, mixed in fixed-size blocks
+Paper shuffles finally happen *while* the anchors are talking
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from audio_buffer import AudioBuffer, DEFAULT_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Cue:
+    """One piece of audio scheduled on a track"""
+    track: str
+    samples: np.ndarray
+    start: int  # sample position on the mix timeline
+    gain: float = 1.0
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.samples)
+
+class Mixer:
+    """Multi-track timeline with ducking and a block renderer"""
+
+    TRACKS = ('voice', 'music', 'sfx')
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE, track_gain_db: Dict[str, float] = None,
+                 duck_db: float = -12.0, duck_attack_ms: float = 40.0,
+                 duck_release_ms: float = 400.0, duck_threshold: float = 0.02):
+        self.sample_rate = sample_rate
+        self.track_gain = {
+            track: 10 ** (db / 20)
+            for track, db in {'voice': 0.0, 'music': -3.0, 'sfx': -6.0, **(track_gain_db or {})}.items()
+        }
+
+        # Music and SFX dip under speech
+        self.duck_gain = 10 ** (duck_db / 20)
+        self.duck_attack_ms = duck_attack_ms
+        self.duck_release_ms = duck_release_ms
+        self.duck_threshold = duck_threshold
+
+        self.cues: List[Cue] = []
+        self.cursor = 0  # where the next voice/music cue starts
+
+    def _samples(self, ms: float) -> int:
+        return int(self.sample_rate * ms / 1000)
+
+    @property
+    def length(self) -> int:
+        """Timeline length in samples"""
+        return max([self.cursor] + [cue.end for cue in self.cues])
+
+    @property
+    def duration_ms(self) -> float:
+        return self.length * 1000 / self.sample_rate
+
+    def add(self, track: str, audio: AudioBuffer, at_ms: Optional[float] = None,
+            gain_db: float = 0.0) -> float:
+        """Schedule audio on a track and return its start time in ms
+
+        Without an explicit time, voice and music play in sequence (the
+        cursor moves past them) while SFX start at the cursor and sit under
+        whatever comes next.
+        """
+        if track not in self.TRACKS:
+            raise ValueError(f"Unknown mixer track: {track}")
+
+        samples = audio.resample(self.sample_rate).samples
+        start = self._samples(at_ms) if at_ms is not None else self.cursor
+        self.cues.append(Cue(track, samples, start, self.track_gain[track] * 10 ** (gain_db / 20)))
+
+        if at_ms is None and track != 'sfx':
+            self.cursor = start + len(samples)
+        return start * 1000 / self.sample_rate
+
+    def pause(self, ms: float):
+        """Leave a gap before the next sequenced cue"""
+        self.cursor += self._samples(ms)
+
+    def _mix_track(self, track: str, start: int, end: int) -> np.ndarray:
+        out = np.zeros(end - start, dtype=np.float32)
+        for cue in self.cues:
+            if cue.track != track or cue.end <= start or cue.start >= end:
+                continue
+            lo = max(start, cue.start)
+            hi = min(end, cue.end)
+            out[lo - start:hi - start] += cue.samples[lo - cue.start:hi - cue.start] * cue.gain
+        return out
+
+    def _duck_curve(self, voice: np.ndarray, state: List[float]) -> np.ndarray:
+        """Per-sample gain for the ducked tracks, smoothed per 10 ms frame
+
+        state carries the last gain across blocks so there are no steps at
+        block boundaries.
+        """
+        frame = max(1, self._samples(10))
+        frames = -(-len(voice) // frame)
+        padded = np.zeros(frames * frame, dtype=np.float32)
+        padded[:len(voice)] = voice
+        rms = np.sqrt(np.mean(padded.reshape(frames, frame) ** 2, axis=1))
+        targets = np.where(rms > self.duck_threshold, self.duck_gain, 1.0)
+
+        attack = 1 - np.exp(-10 / max(self.duck_attack_ms, 1e-3))
+        release = 1 - np.exp(-10 / max(self.duck_release_ms, 1e-3))
+        gains = np.empty(frames, dtype=np.float32)
+        gain = state[0]
+        for i, target in enumerate(targets):
+            gain += (target - gain) * (attack if target < gain else release)
+            gains[i] = gain
+        state[0] = gain
+
+        # Interpolate frame gains to samples
+        centers = np.arange(frames) * frame + frame / 2
+        return np.interp(np.arange(len(voice)), centers, gains).astype(np.float32)
+
+    def blocks(self, block_ms: float = 5000) -> Iterator[AudioBuffer]:
+        """Render the timeline as consecutive fixed-size blocks (the last one may be short)"""
+        block = max(1, self._samples(block_ms))
+        length = self.length
+        duck_state = [1.0]
+
+        for start in range(0, length, block):
+            end = min(start + block, length)
+            voice = self._mix_track('voice', start, end)
+            ducked = self._mix_track('music', start, end) + self._mix_track('sfx', start, end)
+            out = voice + ducked * self._duck_curve(voice, duck_state)
+            np.clip(out, -1.0, 1.0, out=out)
+            yield AudioBuffer(out, self.sample_rate)
+
+    def render(self) -> AudioBuffer:
+        """The whole timeline as one buffer"""
+        return AudioBuffer.concat(list(self.blocks()), self.sample_rate)
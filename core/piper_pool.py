@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Piper Worker Pool
+Keeps Piper TTS processes warm so voice models load once, not once per line
+Feeds text over stdin using Piper's JSON-lines mode
+"""
+
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class PiperError(Exception):
+    """Piper failed to synthesize a line"""
+
+class PiperPoolBusy(PiperError):
+    """The request queue for a voice stayed full for too long"""
+
+def _remove_files(*paths: str) -> int:
+    """Delete whichever of these exist; how many were deleted"""
+    removed = 0
+    for path in set(paths):
+        try:
+            os.unlink(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove Piper output {path}: {e}")
+    return removed
+
+class PiperWorker:
+    """One long-lived Piper process with a voice model loaded"""
+
+    def __init__(self, worker_id: str, command: List[str]):
+        self.worker_id = worker_id
+        self.command = command
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._stderr_tail: Deque[str] = deque(maxlen=20)
+
+        # Stats
+        self.started_at: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.restarts = 0
+        self.latencies_ms: Deque[float] = deque(maxlen=200)
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        """Launch the Piper process"""
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self.started_at = time.monotonic()
+        # Piper logs to stderr; drain it so the pipe never fills up
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+        logger.info(f"🗣️ Piper worker {self.worker_id} started (pid {self.process.pid})")
+
+    async def restart(self):
+        """Replace a crashed or wedged process"""
+        self.restarts += 1
+        logger.warning(f"♻️ Restarting Piper worker {self.worker_id} "
+                       f"(restart #{self.restarts}): {self.last_error()}")
+        await self.stop()
+        await self.start()
+
+    async def stop(self):
+        """Terminate the Piper process"""
+        if self.is_alive:
+            self.process.kill()
+            await self.process.wait()
+        if self._stderr_task:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+
+    async def _drain_stderr(self):
+        while self.process and self.process.stderr:
+            line = await self.process.stderr.readline()
+            if not line:
+                break
+            self._stderr_tail.append(line.decode(errors='replace').rstrip())
+
+    def last_error(self) -> str:
+        return self._stderr_tail[-1] if self._stderr_tail else "no output"
+
+    async def synthesize(self, text: str, output_file: str, timeout: float) -> str:
+        """Send one line of text and wait for Piper to report the WAV it wrote"""
+        if not self.is_alive:
+            raise PiperError(f"worker {self.worker_id} is not running")
+
+        start = time.perf_counter()
+        self.requests += 1
+        request = json.dumps({"text": text, "output_file": output_file}) + "\n"
+
+        try:
+            self.process.stdin.write(request.encode('utf-8'))
+            await self.process.stdin.drain()
+            # Piper prints the output path once the file is complete
+            line = await asyncio.wait_for(self.process.stdout.readline(), timeout)
+        except (asyncio.TimeoutError, ConnectionError, BrokenPipeError) as e:
+            self.failures += 1
+            raise PiperError(f"worker {self.worker_id} failed: {e!r}")
+
+        if not line:
+            self.failures += 1
+            raise PiperError(f"worker {self.worker_id} exited: {self.last_error()}")
+
+        self.latencies_ms.append((time.perf_counter() - start) * 1000)
+        return line.decode().strip() or output_file
+
+    def stats(self) -> Dict:
+        latencies = sorted(self.latencies_ms)
+        return {
+            'worker_id': self.worker_id,
+            'alive': self.is_alive,
+            'pid': self.process.pid if self.process else None,
+            'uptime_seconds': round(time.monotonic() - self.started_at, 1) if self.started_at else 0,
+            'requests': self.requests,
+            'failures': self.failures,
+            'restarts': self.restarts,
+            'latency_ms': {
+                'mean': round(statistics.fmean(latencies), 1) if latencies else None,
+                'p50': round(latencies[len(latencies) // 2], 1) if latencies else None,
+                'p95': round(latencies[int(len(latencies) * 0.95)], 1) if latencies else None
+            }
+        }
+
+class PiperVoicePool:
+    """Workers for one voice model / speaking rate, sharing a bounded queue"""
+
+    def __init__(self, name: str, command: List[str], workers: int, queue_size: int,
+                 request_timeout: float, output_dir: str):
+        self.name = name
+        self.request_timeout = request_timeout
+        self.output_dir = output_dir
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.workers = [
+            PiperWorker(f"{name}#{i}", command) for i in range(workers)
+        ]
+        self._tasks: List[asyncio.Task] = []
+        self.last_used = time.monotonic()
+
+        # Stats
+        self.orphans_removed = 0  # WAVs written (or half-written) for callers that had gone
+
+    async def start(self):
+        for worker in self.workers:
+            await worker.start()
+            self._tasks.append(asyncio.create_task(self._serve(worker)))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        for worker in self.workers:
+            await worker.stop()
+        # Fail anything still waiting
+        while not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_exception(PiperError(f"voice pool {self.name} stopped"))
+
+    async def submit(self, text: str, queue_timeout: float) -> str:
+        """Queue a line and wait for the WAV path"""
+        self.last_used = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(self.queue.put((text, future)), queue_timeout)
+        except asyncio.TimeoutError:
+            raise PiperPoolBusy(f"voice pool {self.name} queue is full")
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Cancelled just as the WAV arrived: nobody will pick it up now
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self.orphans_removed += _remove_files(future.result())
+            raise
+
+    async def _serve(self, worker: PiperWorker):
+        """Pull requests off the queue for one worker, restarting it on failure"""
+        while True:
+            text, future = await self.queue.get()
+            if future.cancelled():
+                continue
+
+            # Until a caller takes the WAV it is ours to delete: nobody else knows it exists
+            output_file = path = None
+            delivered = False
+            try:
+                fd, output_file = tempfile.mkstemp(suffix='.wav', dir=self.output_dir)
+                os.close(fd)
+                path = output_file
+                if not worker.is_alive:
+                    await worker.restart()
+                path = await worker.synthesize(text, output_file, self.request_timeout)
+                if not future.done():  # The caller may have given up while Piper worked
+                    future.set_result(path)
+                    delivered = True
+            except (PiperError, OSError) as e:
+                if not future.done():
+                    future.set_exception(e if isinstance(e, PiperError) else PiperError(str(e)))
+                # A timed-out worker may still be chewing on the line; start fresh
+                try:
+                    await worker.restart()
+                except OSError as restart_error:
+                    logger.error(f"Could not restart Piper worker {worker.worker_id}: {restart_error}")
+            except asyncio.CancelledError:
+                # stop() cancelled us mid-line; its queue drain never sees this request
+                if not future.done():
+                    future.set_exception(PiperError(f"voice pool {self.name} stopped"))
+                raise
+            finally:
+                if not delivered:
+                    self.orphans_removed += _remove_files(*(p for p in (output_file, path) if p))
+
+    async def check_health(self):
+        """Restart any worker whose process has died"""
+        for worker in self.workers:
+            if not worker.is_alive:
+                await worker.restart()
+
+    def stats(self) -> Dict:
+        return {
+            'queue_depth': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'idle_seconds': round(time.monotonic() - self.last_used, 1),
+            'orphans_removed': self.orphans_removed,
+            'workers': [worker.stats() for worker in self.workers]
+        }
+
+class PiperPool:
+    """Long-lived Piper workers, grouped by voice model and speaking rate"""
+
+    def __init__(self, piper_binary: str = "/app/piper/piper", workers_per_voice: int = 1,
+                 queue_size: int = 8, request_timeout: float = 30.0,
+                 queue_timeout: float = 10.0, health_interval: float = 5.0,
+                 idle_timeout: float = 900.0):
+        self.piper_binary = piper_binary
+        self.workers_per_voice = workers_per_voice
+        self.queue_size = queue_size
+        self.request_timeout = request_timeout
+        self.queue_timeout = queue_timeout
+        self.health_interval = health_interval
+        self.idle_timeout = idle_timeout
+
+        self.output_dir = tempfile.mkdtemp(prefix="piper_")
+        self.voices: Dict[Tuple[str, str], PiperVoicePool] = {}
+        self._lock = asyncio.Lock()
+        self._health_task: Optional[asyncio.Task] = None
+
+    def _command(self, model_path: str, length_scale: str) -> List[str]:
+        return [
+            self.piper_binary,
+            "--model", model_path,
+            "--json-input",
+            "--output_dir", self.output_dir,
+            "--length_scale", length_scale
+        ]
+
+    async def _get_voice(self, model_path: str, length_scale: float) -> PiperVoicePool:
+        """Get (or lazily start) the pool for a model and speaking rate"""
+        # Piper only takes length_scale on the command line, so each rate
+        # gets its own workers
+        key = (model_path, f"{length_scale:.3f}")
+        voice = self.voices.get(key)
+        if voice:
+            return voice
+
+        async with self._lock:
+            if key not in self.voices:
+                name = f"{os.path.basename(model_path).replace('.onnx', '')}@{key[1]}"
+                voice = PiperVoicePool(
+                    name, self._command(*key), self.workers_per_voice,
+                    self.queue_size, self.request_timeout, self.output_dir
+                )
+                try:
+                    await voice.start()
+                except OSError as e:
+                    await voice.stop()
+                    raise PiperError(f"could not start Piper for {name}: {e}")
+                self.voices[key] = voice
+                self._ensure_health_checks()
+            return self.voices[key]
+
+    async def synthesize(self, model_path: str, length_scale: float, text: str) -> str:
+        """Synthesize one line and return the path of the WAV Piper wrote"""
+        voice = await self._get_voice(model_path, length_scale)
+        return await voice.submit(text, self.queue_timeout)
+
+    def _ensure_health_checks(self):
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self):
+        """Restart dead workers and retire voices nobody has used lately"""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            for key, voice in list(self.voices.items()):
+                try:
+                    idle = time.monotonic() - voice.last_used
+                    if idle > self.idle_timeout and voice.queue.empty():
+                        logger.info(f"💤 Retiring idle Piper voice {voice.name}")
+                        del self.voices[key]
+                        await voice.stop()
+                    else:
+                        await voice.check_health()
+                except Exception as e:
+                    logger.error(f"Piper health check failed for {voice.name}: {e}")
+
+    async def close(self):
+        if self._health_task:
+            self._health_task.cancel()
+        for voice in list(self.voices.values()):
+            await voice.stop()
+        self.voices.clear()
+
+    def stats(self) -> Dict:
+        return {voice.name: voice.stats() for voice in self.voices.values()}
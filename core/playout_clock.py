@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Playout Clock
+Knows how long every aired clip lasts and when the air will go quiet
+Durations come from the render, never from decoding the MP3 back
+"""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class AiredClip:
+    """One file handed to playout and when listeners will hear it"""
+    file: str
+    duration_ms: float
+    starts_at: float  # Unix time, so other containers can compare
+    ends_at: float
+
+class PlayoutClock:
+    """Duration index plus the expected end of what's on air"""
+
+    def __init__(self, index_path: str, history: int = 500):
+        self.index_path = index_path
+        self.history = history
+
+        # file name -> clip, oldest first
+        self.clips: "OrderedDict[str, AiredClip]" = OrderedDict()
+        self.on_air_until: Optional[float] = None  # None until the first clip airs
+
+        # Stats
+        self.aired_ms = 0.0
+        self.underruns = 0  # Clips that started after a gap
+
+    def schedule(self, path: str, duration_ms: float) -> AiredClip:
+        """Queue a clip right after whatever is already on air"""
+        now = time.time()
+        if self.on_air_until is not None and self.on_air_until < now:
+            self.underruns += 1
+        starts_at = max(now, self.on_air_until or now)
+        clip = AiredClip(os.path.basename(path), duration_ms, starts_at, starts_at + duration_ms / 1000)
+
+        self.clips[clip.file] = clip
+        while len(self.clips) > self.history:
+            self.clips.popitem(last=False)
+
+        self.on_air_until = clip.ends_at
+        self.aired_ms += duration_ms
+        return clip
+
+    def duration_of(self, path: str) -> Optional[float]:
+        clip = self.clips.get(os.path.basename(path))
+        return clip.duration_ms if clip else None
+
+    def remaining(self) -> float:
+        """Seconds of scheduled audio still to play"""
+        if self.on_air_until is None:
+            return 0.0
+        return max(0.0, self.on_air_until - time.time())
+
+    def silent_for(self) -> float:
+        """Seconds since the last clip ran out (0 while something is playing)"""
+        if self.on_air_until is None:
+            return 0.0
+        return max(0.0, time.time() - self.on_air_until)
+
+    def upcoming(self) -> List[AiredClip]:
+        """Clips that haven't finished playing yet"""
+        now = time.time()
+        return [clip for clip in self.clips.values() if clip.ends_at > now]
+
+    def write_index(self):
+        """Publish the index for the streaming server (renamed into place, never half-written)"""
+        index = {
+            'on_air_until': self.on_air_until,
+            'clips': [asdict(clip) for clip in self.clips.values()]
+        }
+        partial_path = f"{self.index_path}.part"
+        with open(partial_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(partial_path, self.index_path)
+
+    def stats(self) -> Dict:
+        return {
+            'on_air_remaining_s': round(self.remaining(), 2),
+            'silent_for_s': round(self.silent_for(), 2),
+            'aired_minutes': round(self.aired_ms / 60000, 1),
+            'underruns': self.underruns
+        }
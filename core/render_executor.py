@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Render Executor
+Shared process pool for CPU-heavy audio rendering
+Jingles, sound effects and voices render on other cores while the
+broadcast loop keeps ticking
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import random
+import statistics
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from config import RENDER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Generators a worker knows how to build: name -> (module, class, constructor kwargs)
+GENERATORS = {
+    'voice': ('voice_synthesis', 'VoiceSynthesizer', {'use_cache': False}),
+    'jingles': ('jingle_generator', 'JingleGenerator', {}),
+    'sound_effects': ('sound_effects_generator', 'SoundEffectsGenerator', {'use_cache': False})
+}
+
+@dataclass
+class RenderJob:
+    """Picklable description of one render: which generator, which method, what args"""
+    generator: str
+    method: str
+    args: Tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+# Per-process generator instances, built on first use inside each worker
+_worker_generators: Dict[str, Any] = {}
+
+def _init_worker():
+    """Give every worker its own random state (forked RNGs would all agree)"""
+    random.seed()
+    np.random.seed()
+
+def run_render_job(job: RenderJob) -> Any:
+    """Execute a render job; runs inside a pool worker"""
+    generator = _worker_generators.get(job.generator)
+    if generator is None:
+        module_name, class_name, kwargs = GENERATORS[job.generator]
+        generator_class = getattr(importlib.import_module(module_name), class_name)
+        generator = generator_class(**kwargs)
+        _worker_generators[job.generator] = generator
+
+    return getattr(generator, job.method)(*job.args, **job.kwargs)
+
+class RenderExecutor:
+    """Submits render jobs to a process pool and awaits the results"""
+
+    def __init__(self, workers: int = 2):
+        self.workers = workers
+        self._executor: Optional[Executor] = None
+
+        # Stats
+        self.jobs = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.durations_ms: Deque[float] = deque(maxlen=200)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.workers > 0:
+                # spawn: forking a process that already runs threads is asking for trouble
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+                logger.info(f"🏭 Render pool started with {self.workers} workers")
+            else:
+                # workers=0 renders in-process on threads (debugging, tiny hosts)
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="render")
+        return self._executor
+
+    async def run(self, job: RenderJob) -> Any:
+        """Run a job on the pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        self.jobs += 1
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self._get_executor(), run_render_job, job)
+        except BrokenProcessPool:
+            # A worker died (OOM, segfault in a codec); start a fresh pool next time
+            self.failures += 1
+            logger.error(f"💥 Render pool broke while running {job.generator}.{job.method}, restarting")
+            self.shutdown()
+            raise
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.durations_ms.append((time.perf_counter() - start) * 1000)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict:
+        durations = sorted(self.durations_ms)
+        return {
+            'workers': self.workers,
+            'jobs': self.jobs,
+            'failures': self.failures,
+            'in_flight': self.in_flight,
+            'job_ms_p50': round(durations[len(durations) // 2], 1) if durations else None,
+            'job_ms_p95': round(durations[int(len(durations) * 0.95)], 1) if durations else None
+        }
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up from a sleep"""
+
+    def __init__(self, interval: float = 0.5, window: int = 240):
+        self.interval = interval
+        self.lags_ms: Deque[float] = deque(maxlen=window)
+        self.max_lag_ms = 0.0
+
+    async def run(self):
+        """Sample loop lag forever"""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (time.perf_counter() - start - self.interval) * 1000)
+            self.lags_ms.append(lag_ms)
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    def stats(self) -> Dict:
+        lags = sorted(self.lags_ms)
+        return {
+            'mean': round(statistics.fmean(lags), 1) if lags else None,
+            'p95': round(lags[int(len(lags) * 0.95)], 1) if lags else None,
+            'last': round(self.lags_ms[-1], 1) if lags else None,
+            'max_ever': round(self.max_lag_ms, 1)
+        }
+
+_render_executor: Optional[RenderExecutor] = None
+
+def get_render_executor() -> RenderExecutor:
+    """The process-wide render executor shared by all generators"""
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = RenderExecutor(RENDER_CONFIG['workers'])
+    return _render_executor
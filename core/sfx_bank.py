@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+SFX Bank
+Seeded variants of every sound effect, kept as PCM in memory and as WAV on disk
+The chaos is random, but it's random from a shelf we already stocked
+"""
+
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
+from audio_buffer import AudioBuffer
+from audio_cache import AudioCache
+from render_executor import RenderJob, get_render_executor
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever an effect's synthesis changes so stale variants are never served
+SFX_VERSION = 1
+
+class SfxBank:
+    """(effect, args, variant) -> AudioBuffer, with an in-memory LRU over the disk cache"""
+
+    def __init__(self, cache_dir: str, max_disk_bytes: int, max_memory_bytes: int,
+                 variants: int = 6, enabled: bool = True):
+        self.variants = variants
+        self.enabled = enabled
+        self.max_memory_bytes = max_memory_bytes
+
+        self.disk = AudioCache(cache_dir, max_disk_bytes, enabled=enabled, extension='.wav')
+
+        # key -> decoded PCM, least recently used first
+        self._memory: "OrderedDict[str, AudioBuffer]" = OrderedDict()
+        self.memory_bytes = 0
+
+        # Renders in flight, so two requests for one variant share the work
+        self._pending: Dict[str, asyncio.Future] = {}
+
+        # Stats
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+
+    @staticmethod
+    def seed_for(method: str, args: Tuple, variant: int) -> int:
+        """Stable seed for one variant (str hashes change between processes)"""
+        return zlib.crc32(f"{method}:{args!r}:{variant}".encode('utf-8'))
+
+    async def get(self, method: str, args: Tuple = ()) -> AudioBuffer:
+        """A random variant of an effect"""
+        if not self.enabled:
+            return await get_render_executor().run(RenderJob('sound_effects', method, args))
+        return await self.variant(method, args, random.randrange(self.variants))
+
+    async def variant(self, method: str, args: Tuple, variant: int) -> AudioBuffer:
+        """One specific variant: memory, then disk, then a seeded render"""
+        key = AudioCache.make_key(version=SFX_VERSION, method=method, args=args, variant=variant)
+
+        buffer = self._memory.get(key)
+        if buffer is not None:
+            self.memory_hits += 1
+            self._memory.move_to_end(key)
+            return buffer
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            buffer = await self._load_or_render(key, method, args, variant)
+            future.set_result(buffer)
+            return buffer
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; don't let an unawaited future log a warning
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    async def _load_or_render(self, key: str, method: str, args: Tuple, variant: int) -> AudioBuffer:
+        loop = asyncio.get_running_loop()
+
+        cached_path = self.disk.get(key)
+        if cached_path:
+            try:
+                buffer = await loop.run_in_executor(None, AudioBuffer.read_wav, cached_path)
+                self.disk_hits += 1
+                self._remember(key, buffer)
+                return buffer
+            except Exception as e:
+                logger.warning(f"Re-rendering unreadable SFX {cached_path}: {e}")
+
+        buffer = await get_render_executor().run(RenderJob(
+            'sound_effects', 'render_variant', (method, args, self.seed_for(method, args, variant))
+        ))
+        self.renders += 1
+        self._remember(key, buffer)
+
+        # Keep a lossless copy for the next restart
+        fd, wav_path = tempfile.mkstemp(suffix='.wav.part', dir=self.disk.cache_dir)
+        os.close(fd)
+        try:
+            await loop.run_in_executor(None, buffer.write_wav, wav_path)
+            self.disk.put(key, wav_path)
+        except BaseException:
+            if os.path.exists(wav_path):
+                os.unlink(wav_path)
+            raise
+        return buffer
+
+    def _remember(self, key: str, buffer: AudioBuffer):
+        if key in self._memory:
+            self.memory_bytes -= self._memory.pop(key).samples.nbytes
+        self._memory[key] = buffer
+        self.memory_bytes += buffer.samples.nbytes
+
+        while self.memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self.memory_bytes -= evicted.samples.nbytes
+
+    async def warm(self, effects: Iterable[Tuple[str, Tuple]]):
+        """Load or render every variant of the given effects"""
+        if not self.enabled:
+            return
+
+        jobs = [
+            (method, args, variant)
+            for method, args in effects
+            for variant in range(self.variants)
+        ]
+        results = await asyncio.gather(
+            *[self.variant(method, args, variant) for method, args, variant in jobs],
+            return_exceptions=True
+        )
+        failures = [job for job, result in zip(jobs, results) if isinstance(result, Exception)]
+        for method, args, variant in failures:
+            logger.error(f"Failed to warm {method}{args} variant {variant}")
+
+        logger.info(f"🔊 SFX bank warm: {len(jobs) - len(failures)} variants, "
+                    f"{self.disk_hits} from disk, {self.renders} rendered")
+
+    def stats(self) -> Dict:
+        return {
+            'variants_per_effect': self.variants,
+            'memory_entries': len(self._memory),
+            'memory_mb': round(self.memory_bytes / (1024 * 1024), 2),
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'renders': self.renders,
+            'disk': self.disk.stats()
+        }
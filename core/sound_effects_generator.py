@@ -6,22 +6,202 @@ Makes the broadcast feel chaotically alive
 """
 
 import numpy as np
-from pydub import AudioSegment
-from pydub.generators import WhiteNoise, Sine
+from scipy.signal import lfilter
 import random
-import tempfile
 import logging
+import zlib
+
+from audio_buffer import AudioBuffer
+from config import BROADCAST_CONFIG
+from sfx_bank import SfxBank
 
 logger = logging.getLogger(__name__)
 
 class SoundEffectsGenerator:
     """Generates newsroom chaos sounds"""
-    
-    def __init__(self):
+
+    # What the broadcast controller reaches for most, warmed at startup
+    WARM_EFFECTS = [
+        ('render_paper_shuffle', ('frantic',)),
+        ('render_paper_shuffle', ('desperate',)),
+        ('render_microphone_feedback', ('mild',)),
+        ('render_cash_register', ()),
+        ('render_wrong_weather_sound', ()),
+        ('render_newsroom_sound', ('typing',)),
+        ('render_newsroom_sound', ('phone_ring',)),
+        ('render_newsroom_sound', ('printer',)),
+        ('render_newsroom_sound', ('coffee_machine',)),
+        ('render_newsroom_sound', ('door_slam',)),
+        ('render_newsroom_sound', ('chair_squeak',))
+    ]
+
+    def __init__(self, use_cache: bool = True):
         self.sample_rate = 44100
-        self.effects_cache = {}
-        
-    async def generate_paper_shuffle(self, intensity: str = "normal") -> str:
+
+        # Seeded variants of every effect, in memory and on disk
+        self.effects_cache = SfxBank(
+            cache_dir=BROADCAST_CONFIG.get('sfx_cache_dir', '/app/audio/cache/sfx'),
+            max_disk_bytes=BROADCAST_CONFIG.get('sfx_cache_mb', 256) * 1024 * 1024,
+            max_memory_bytes=BROADCAST_CONFIG.get('sfx_memory_mb', 64) * 1024 * 1024,
+            variants=BROADCAST_CONFIG.get('sfx_variants', 6),
+            enabled=use_cache
+        )
+
+    async def _render(self, method: str, *args) -> AudioBuffer:
+        """A variant of an effect from the bank, rendered on the process pool if missing"""
+        return await self.effects_cache.get(method, args)
+
+    async def warm(self):
+        """Stock the bank with the everyday effects"""
+        await self.effects_cache.warm(self.WARM_EFFECTS)
+
+    def render_variant(self, method: str, args: tuple, seed: int) -> AudioBuffer:
+        """Render one reproducible variant of an effect"""
+        random.seed(seed)
+        np.random.seed(seed % 2 ** 32)
+        try:
+            return getattr(self, method)(*args)
+        finally:
+            # Back to fresh randomness for whatever this worker renders next
+            random.seed()
+            np.random.seed()
+
+    async def generate_paper_shuffle(self, intensity: str = "normal") -> AudioBuffer:
+        """Generate paper shuffling sounds"""
+        return await self._render('render_paper_shuffle', intensity)
+
+    async def generate_chair_squeak(self, squeak_type: str = "normal") -> AudioBuffer:
+        """Generate chair squeaking sounds"""
+        return await self._render('render_chair_squeak', squeak_type)
+
+    async def generate_desk_head_bang(self, intensity: int = 1) -> AudioBuffer:
+        """Generate head hitting desk sound"""
+        return await self._render('render_desk_head_bang', intensity)
+
+    async def generate_desk_rattle(self) -> AudioBuffer:
+        """Things rattling on desk after impact"""
+        return await self._render('render_desk_rattle')
+
+    async def generate_mouth_sounds(self, sound_type: str) -> AudioBuffer:
+        """Generate various mouth/tongue sounds"""
+        return await self._render('render_mouth_sounds', sound_type)
+
+    async def generate_microphone_feedback(self, severity: str = "mild") -> AudioBuffer:
+        """Generate mic feedback screech"""
+        return await self._render('render_microphone_feedback', severity)
+
+    async def generate_mic_feedback(self, severity: str = "mild") -> AudioBuffer:
+        """Short name used by the broadcast controller"""
+        return await self.generate_microphone_feedback(severity)
+
+    async def generate_coffee_spill(self) -> AudioBuffer:
+        """Generate coffee spilling sound"""
+        return await self._render('render_coffee_spill')
+
+    async def generate_pen_clicking(self, click_count: int = None) -> AudioBuffer:
+        """Annoying pen clicking"""
+        return await self._render('render_pen_clicking', click_count)
+
+    async def generate_typing(self, duration: int = 3000, speed: str = "normal") -> AudioBuffer:
+        """Keyboard typing sounds"""
+        return await self._render('render_typing', duration, speed)
+
+    async def generate_cash_register(self) -> AudioBuffer:
+        """Cha-ching for the sponsor segment"""
+        return await self._render('render_cash_register')
+
+    async def generate_wrong_product_sound(self, product_name: str = "") -> AudioBuffer:
+        """A sound that has nothing to do with the product"""
+        return await self._render('render_wrong_product_sound', product_name)
+
+    async def generate_weather_sound(self, condition: str = "chaos") -> AudioBuffer:
+        """Weather ambience for the forecast"""
+        return await self._render('render_weather_sound', condition)
+
+    async def generate_wrong_weather_sound(self) -> AudioBuffer:
+        """Weather ambience for some other forecast"""
+        return await self._render('render_wrong_weather_sound')
+
+    async def generate_newsroom_sound(self, sound: str) -> AudioBuffer:
+        """Background newsroom noise by name"""
+        return await self._render('render_newsroom_sound', sound)
+
+    # Vectorized building blocks. Everything below works on float32 arrays in
+    # [-1, 1] and only becomes an AudioBuffer at the end of a render_* method.
+
+    def _length(self, duration_ms: float) -> int:
+        return int(self.sample_rate * duration_ms / 1000)
+
+    def _time(self, duration_ms: float) -> np.ndarray:
+        return np.arange(self._length(duration_ms), dtype=np.float32) / self.sample_rate
+
+    def _tone(self, freq: float, duration_ms: float, amplitude: float = 1.0) -> np.ndarray:
+        return (amplitude * np.sin(2 * np.pi * freq * self._time(duration_ms))).astype(np.float32)
+
+    def _sweep(self, freqs: np.ndarray, amplitude: float = 1.0) -> np.ndarray:
+        """Oscillator following a per-sample frequency curve (phase stays continuous)"""
+        phase = 2 * np.pi * np.cumsum(freqs) / self.sample_rate
+        return (amplitude * np.sin(phase)).astype(np.float32)
+
+    def _noise(self, duration_ms: float, amplitude: float = 1.0) -> np.ndarray:
+        return np.random.uniform(-amplitude, amplitude, self._length(duration_ms)).astype(np.float32)
+
+    def _fade(self, samples: np.ndarray, fade_in_ms: float = 0, fade_out_ms: float = 0) -> np.ndarray:
+        """Linear fade in/out"""
+        envelope = np.ones(len(samples), dtype=np.float32)
+        fade_in = min(self._length(fade_in_ms), len(samples))
+        fade_out = min(self._length(fade_out_ms), len(samples))
+        if fade_in:
+            envelope[:fade_in] *= np.linspace(0, 1, fade_in, dtype=np.float32)
+        if fade_out:
+            envelope[-fade_out:] *= np.linspace(1, 0, fade_out, dtype=np.float32)
+        return samples * envelope
+
+    def _decay(self, samples: np.ndarray, time_constant_ms: float) -> np.ndarray:
+        """Exponential decay, for struck and plucked things"""
+        t = np.arange(len(samples), dtype=np.float32) / self.sample_rate
+        return samples * np.exp(-t * 1000 / time_constant_ms).astype(np.float32)
+
+    def _low_pass(self, samples: np.ndarray, cutoff: float) -> np.ndarray:
+        """One-pole low-pass (same RC filter as pydub, without the Python loop)"""
+        rc = 1 / (2 * np.pi * cutoff)
+        dt = 1 / self.sample_rate
+        alpha = dt / (rc + dt)
+        return lfilter([alpha], [1, alpha - 1], samples).astype(np.float32)
+
+    def _high_pass(self, samples: np.ndarray, cutoff: float) -> np.ndarray:
+        """One-pole high-pass (same RC filter as pydub, without the Python loop)"""
+        rc = 1 / (2 * np.pi * cutoff)
+        dt = 1 / self.sample_rate
+        alpha = rc / (rc + dt)
+        return lfilter([alpha, -alpha], [1, -alpha], samples).astype(np.float32)
+
+    @staticmethod
+    def _db(db: float) -> float:
+        return 10 ** (db / 20)
+
+    def _place(self, track: np.ndarray, samples: np.ndarray, position_ms: float) -> np.ndarray:
+        """Mix samples into track in place, clipped to the track length"""
+        start = self._length(position_ms)
+        if start >= len(track) or start < 0:
+            return track
+        end = min(len(track), start + len(samples))
+        track[start:end] += samples[:end - start]
+        return track
+
+    def _append(self, first: np.ndarray, second: np.ndarray, crossfade_ms: float = 0) -> np.ndarray:
+        """Join two sounds with a linear crossfade"""
+        overlap = min(self._length(crossfade_ms), len(first), len(second))
+        if not overlap:
+            return np.concatenate([first, second])
+        ramp = np.linspace(0, 1, overlap, dtype=np.float32)
+        middle = first[-overlap:] * (1 - ramp) + second[:overlap] * ramp
+        return np.concatenate([first[:-overlap], middle, second[overlap:]])
+
+    def _buffer(self, samples: np.ndarray) -> AudioBuffer:
+        return AudioBuffer.from_array(samples, self.sample_rate)
+
+    def render_paper_shuffle(self, intensity: str = "normal") -> AudioBuffer:
         """Generate paper shuffling sounds"""
         duration_map = {
             "quick": 500,
@@ -29,55 +209,34 @@ class SoundEffectsGenerator:
             "frantic": 2000,
             "desperate": 3000
         }
-        
+
         duration = duration_map.get(intensity, 1000)
-        
-        # Create rustling sound with filtered noise
-        rustling = WhiteNoise().to_audio_segment(duration=duration)
-        
-        # Apply envelope for realistic paper sound
-        # Quick attacks and decays
-        for i in range(0, duration, 100):
+
+        # High-passed noise makes it more paper-like
+        rustling = self._high_pass(self._noise(duration), 2000)
+
+        # Crinkles: quick attacks and decays every 100 ms or so
+        envelope = np.full(len(rustling), 0.2, dtype=np.float32)
+        crinkle = self._fade(np.ones(self._length(60), dtype=np.float32), 10, 50)
+        for start_ms in range(0, duration, 100):
             if random.random() < 0.7:
-                # Create a "crinkle"
-                rustling = rustling.fade_in(10).fade_out(50)
-                
-        # High-pass filter to make it more paper-like
-        rustling = rustling.high_pass_filter(2000)
-        rustling = rustling - 15  # Reduce volume
-        
+                self._place(envelope, crinkle, start_ms)
+        rustling = rustling * envelope * self._db(-15)
+
         # Add some random paper "flips"
         for _ in range(random.randint(1, 4)):
             flip_pos = random.randint(0, duration - 100)
-            flip = self._generate_paper_flip()
-            rustling = rustling.overlay(flip, position=flip_pos)
-            
-        output_path = tempfile.mktemp(suffix='.mp3')
-        rustling.export(output_path, format='mp3')
-        return output_path
-        
-    def _generate_paper_flip(self) -> AudioSegment:
+            self._place(rustling, self._paper_flip(), flip_pos)
+
+        return self._buffer(rustling)
+
+    def _paper_flip(self) -> np.ndarray:
         """Single paper flip sound"""
-        # Quick whoosh
-        flip_duration = 50
-        
-        # Descending frequency sweep
-        samples = []
-        for i in range(int(flip_duration * 44.1)):
-            freq = 4000 - (i * 60)  # Rapid frequency descent
-            sample = np.sin(2 * np.pi * freq * i / 44100) * 0.3
-            samples.append(sample)
-            
-        flip = AudioSegment(
-            np.array(samples).tobytes(),
-            frame_rate=44100,
-            sample_width=2,
-            channels=1
-        )
-        
-        return flip.fade_in(5).fade_out(20)
-        
-    async def generate_chair_squeak(self, squeak_type: str = "normal") -> str:
+        # Quick whoosh: rapid descending sweep, 4 kHz down to 1 kHz in 50 ms
+        freqs = np.linspace(4000, 1000, self._length(50), dtype=np.float32)
+        return self._fade(self._sweep(freqs, 0.3), 5, 20)
+
+    def render_chair_squeak(self, squeak_type: str = "normal") -> AudioBuffer:
         """Generate chair squeaking sounds"""
         squeaks = {
             "subtle": {"freq": 800, "duration": 200, "wobble": 10},
@@ -85,185 +244,128 @@ class SoundEffectsGenerator:
             "dramatic": {"freq": 2000, "duration": 800, "wobble": 50},
             "dying_whale": {"freq": 400, "duration": 1500, "wobble": 100}
         }
-        
+
         params = squeaks.get(squeak_type, squeaks["normal"])
-        
-        # Generate squeaky sound with frequency modulation
-        samples = []
-        for i in range(int(params["duration"] * 44.1)):
-            # Add wobble to frequency
-            freq = params["freq"] + np.sin(i * 0.01) * params["wobble"]
-            sample = np.sin(2 * np.pi * freq * i / 44100)
-            
-            # Add harmonics for realism
-            sample += np.sin(2 * np.pi * freq * 2 * i / 44100) * 0.3
-            sample += np.sin(2 * np.pi * freq * 3 * i / 44100) * 0.1
-            
-            samples.append(sample * 0.5)
-            
-        squeak = AudioSegment(
-            np.array(samples).tobytes(),
-            frame_rate=44100,
-            sample_width=2,
-            channels=1
-        )
-        
-        # Add envelope
-        squeak = squeak.fade_in(50).fade_out(100)
-        
-        output_path = tempfile.mktemp(suffix='.mp3')
-        squeak.export(output_path, format='mp3')
-        return output_path
-        
-    async def generate_desk_head_bang(self, intensity: int = 1) -> str:
+
+        # Frequency modulation: the pitch wobbles ~70 times a second
+        i = np.arange(self._length(params["duration"]), dtype=np.float32)
+        freqs = params["freq"] + np.sin(i * 0.01) * params["wobble"]
+        phase = 2 * np.pi * np.cumsum(freqs) / self.sample_rate
+
+        # Add harmonics for realism
+        squeak = np.sin(phase) + np.sin(2 * phase) * 0.3 + np.sin(3 * phase) * 0.1
+        squeak = self._fade(squeak * 0.5, 50, 100)
+
+        return self._buffer(squeak)
+
+    def render_desk_head_bang(self, intensity: int = 1) -> AudioBuffer:
         """Generate head hitting desk sound"""
         # Thud sound - low frequency impact
-        thud_freq = 80 - (intensity * 10)  # Lower freq for harder hits
+        thud_freq = max(20, 80 - (intensity * 10))  # Lower freq for harder hits
         duration = 150 + (intensity * 50)
-        
-        # Create impact
-        thud = Sine(thud_freq).to_audio_segment(duration=duration)
-        
-        # Add higher frequency "thwack"
-        thwack = Sine(200).to_audio_segment(duration=50)
-        thud = thud.overlay(thwack)
-        
-        # Add some noise for texture
-        impact_noise = WhiteNoise().to_audio_segment(duration=30)
-        impact_noise = impact_noise.low_pass_filter(500) - 20
-        thud = thud.overlay(impact_noise)
-        
+
+        thud = self._tone(thud_freq, duration)
+
+        # Add higher frequency "thwack" and some noise for texture
+        self._place(thud, self._tone(200, 50), 0)
+        self._place(thud, self._low_pass(self._noise(30), 500) * self._db(-20), 0)
+
         # Envelope shaping
-        thud = thud.fade_in(5).fade_out(duration - 10)
-        
+        thud = self._fade(thud, 5, duration - 10)
+
         # Add desk rattle based on intensity
         if intensity > 2:
-            rattle = await self.generate_desk_rattle()
-            thud = thud.append(AudioSegment.from_file(rattle), crossfade=20)
-            
-        output_path = tempfile.mktemp(suffix='.mp3')
-        thud.export(output_path, format='mp3')
-        return output_path
-        
-    async def generate_desk_rattle(self) -> str:
+            thud = self._append(thud, self._desk_rattle(), crossfade_ms=20)
+
+        return self._buffer(thud)
+
+    def render_desk_rattle(self) -> AudioBuffer:
         """Things rattling on desk after impact"""
+        return self._buffer(self._desk_rattle())
+
+    def _desk_rattle(self) -> np.ndarray:
         rattle_duration = 800
-        rattle = AudioSegment.silent(duration=rattle_duration)
-        
+        rattle = np.zeros(self._length(rattle_duration), dtype=np.float32)
+
         # Multiple objects rattling
         for i in range(random.randint(3, 6)):
             # Each object has different frequency
-            freq = random.randint(1000, 4000)
-            object_rattle = Sine(freq).to_audio_segment(duration=50)
-            
+            object_rattle = self._tone(random.randint(1000, 4000), 50)
+
             # Decreasing amplitude over time
             for j in range(5):
                 pos = i * 100 + j * 120
                 if pos < rattle_duration - 50:
-                    volume = -j * 3
-                    rattle = rattle.overlay(object_rattle + volume, position=pos)
-                    
-        output_path = tempfile.mktemp(suffix='.mp3')
-        rattle.export(output_path, format='mp3')
-        return output_path
-        
-    async def generate_mouth_sounds(self, sound_type: str) -> str:
+                    self._place(rattle, object_rattle * self._db(-j * 3), pos)
+
+        return rattle
+
+    def render_mouth_sounds(self, sound_type: str) -> AudioBuffer:
         """Generate various mouth/tongue sounds"""
         if sound_type == "tongue_click":
-            return await self._generate_tongue_click()
+            return self._render_tongue_click()
         elif sound_type == "lip_pop":
-            return await self._generate_lip_pop()
+            return self._render_lip_pop()
         elif sound_type == "raspberry":
-            return await self._generate_raspberry()
+            return self._render_raspberry()
         elif sound_type == "whistle":
-            return await self._generate_bad_whistle()
+            return self._render_bad_whistle()
         else:
-            return await self._generate_random_mouth_sound()
-            
-    async def _generate_tongue_click(self) -> str:
+            return random.choice([
+                self._render_tongue_click, self._render_lip_pop,
+                self._render_raspberry, self._render_bad_whistle
+            ])()
+
+    def _render_tongue_click(self) -> AudioBuffer:
         """Tongue clicking sound"""
         # Short, sharp click
-        click = WhiteNoise().to_audio_segment(duration=10)
-        click = click.high_pass_filter(4000) + 10
-        click = click.fade_out(8)
-        
-        output_path = tempfile.mktemp(suffix='.mp3')
-        click.export(output_path, format='mp3')
-        return output_path
-        
-    async def _generate_lip_pop(self) -> str:
+        click = self._high_pass(self._noise(10), 4000) * self._db(10)
+        return self._buffer(self._fade(click, 0, 8))
+
+    def _render_lip_pop(self) -> AudioBuffer:
         """Lip popping sound"""
         # Low frequency pop
-        pop = Sine(150).to_audio_segment(duration=30)
-        pop = pop.fade_in(5).fade_out(20) + 5
-        
+        pop = self._fade(self._tone(150, 30), 5, 20) * self._db(5)
+
         # Add click at start
-        click = WhiteNoise().to_audio_segment(duration=5)
-        pop = click.append(pop, crossfade=2)
-        
-        output_path = tempfile.mktemp(suffix='.mp3')
-        pop.export(output_path, format='mp3')
-        return output_path
-        
-    async def _generate_raspberry(self) -> str:
+        return self._buffer(self._append(self._noise(5), pop, crossfade_ms=2))
+
+    def _render_raspberry(self) -> AudioBuffer:
         """Raspberry/motorboat sound"""
         duration = random.randint(500, 1500)
-        
-        # Oscillating low frequency
-        samples = []
-        for i in range(int(duration * 44.1)):
-            # Rapid oscillation
-            freq = 80 + np.sin(i * 0.2) * 30
-            sample = np.sin(2 * np.pi * freq * i / 44100)
-            
-            # Add noise for texture
-            sample += np.random.normal(0, 0.1)
-            samples.append(sample * 0.5)
-            
-        raspberry = AudioSegment(
-            np.array(samples).tobytes(),
-            frame_rate=44100,
-            sample_width=2,
-            channels=1
-        )
-        
-        output_path = tempfile.mktemp(suffix='.mp3')
-        raspberry.export(output_path, format='mp3')
-        return output_path
-        
-    async def _generate_bad_whistle(self) -> str:
+
+        # Rapidly oscillating low frequency
+        i = np.arange(self._length(duration), dtype=np.float32)
+        raspberry = self._sweep(80 + np.sin(i * 0.2) * 30)
+
+        # Add noise for texture
+        raspberry += np.random.normal(0, 0.1, len(raspberry)).astype(np.float32)
+
+        return self._buffer(raspberry * 0.5)
+
+    def _render_bad_whistle(self) -> AudioBuffer:
         """Failed attempt at whistling"""
         duration = random.randint(1000, 2000)
-        
-        samples = []
-        for i in range(int(duration * 44.1)):
-            # Unstable frequency
-            target_freq = random.choice([800, 1000, 1200])
-            freq = target_freq + random.randint(-100, 100)
-            
-            # Breathy whistle
-            sample = np.sin(2 * np.pi * freq * i / 44100) * 0.3
-            sample += np.random.normal(0, 0.05)  # Breathiness
-            
-            samples.append(sample)
-            
-        whistle = AudioSegment(
-            np.array(samples).tobytes(),
-            frame_rate=44100,
-            sample_width=2,
-            channels=1
-        )
-        
+        length = self._length(duration)
+
+        # Unstable frequency: a new wrong note every 20 ms, plus jitter
+        chunk = self._length(20)
+        targets = np.random.choice([800, 1000, 1200], size=-(-length // chunk))
+        freqs = np.repeat(targets, chunk)[:length] + np.random.uniform(-100, 100, length)
+
+        # Breathy whistle
+        whistle = self._sweep(freqs.astype(np.float32), 0.3)
+        whistle += np.random.normal(0, 0.05, length).astype(np.float32)
+
         # Random stops and starts
+        gap = np.zeros(self._length(100), dtype=np.float32)
         for _ in range(random.randint(1, 3)):
-            cut_pos = random.randint(200, duration - 200)
-            whistle = whistle[:cut_pos] + AudioSegment.silent(duration=100) + whistle[cut_pos:]
-            
-        output_path = tempfile.mktemp(suffix='.mp3')
-        whistle.export(output_path, format='mp3')
-        return output_path
-        
-    async def generate_microphone_feedback(self, severity: str = "mild") -> str:
+            cut = self._length(random.randint(200, duration - 200))
+            whistle = np.concatenate([whistle[:cut], gap, whistle[cut:]])
+
+        return self._buffer(whistle)
+
+    def render_microphone_feedback(self, severity: str = "mild") -> AudioBuffer:
         """Generate mic feedback screech"""
         severity_params = {
             "mild": {"freq": 3000, "duration": 500, "volume": -10},
@@ -271,67 +373,46 @@ class SoundEffectsGenerator:
             "severe": {"freq": 5000, "duration": 1500, "volume": 0},
             "apocalyptic": {"freq": 6000, "duration": 2000, "volume": 5}
         }
-        
+
         params = severity_params.get(severity, severity_params["mild"])
-        
-        # Generate feedback
-        feedback = Sine(params["freq"]).to_audio_segment(duration=params["duration"])
-        
-        # Add harmonics
-        feedback = feedback.overlay(
-            Sine(params["freq"] * 1.5).to_audio_segment(duration=params["duration"]) - 6
-        )
-        
+
+        # Feedback tone plus a harmonic
+        feedback = self._tone(params["freq"], params["duration"])
+        feedback += self._tone(params["freq"] * 1.5, params["duration"]) * self._db(-6)
+
         # Envelope - quick attack, sustain, then fade
-        feedback = feedback.fade_in(50).fade_out(params["duration"] // 3)
-        feedback = feedback + params["volume"]
-        
-        output_path = tempfile.mktemp(suffix='.mp3')
-        feedback.export(output_path, format='mp3')
-        return output_path
-        
-    async def generate_coffee_spill(self) -> str:
+        feedback = self._fade(feedback, 50, params["duration"] // 3)
+
+        return self._buffer(feedback * self._db(params["volume"]))
+
+    def render_coffee_spill(self) -> AudioBuffer:
         """Generate coffee spilling sound"""
         # Initial splash
-        splash = WhiteNoise().to_audio_segment(duration=200)
-        splash = splash.low_pass_filter(1000).fade_in(10).fade_out(100)
-        
+        splash = self._fade(self._low_pass(self._noise(200), 1000), 10, 100)
+
         # Dripping
-        drip_sound = AudioSegment.silent(duration=1500)
+        drip_sound = np.zeros(self._length(1500), dtype=np.float32)
         for i in range(5):
-            drip = Sine(400 - i * 50).to_audio_segment(duration=50)
-            drip = drip.fade_in(10).fade_out(30) - 10
-            drip_sound = drip_sound.overlay(drip, position=300 + i * 250)
-            
-        # Combine
-        spill = splash.append(drip_sound, crossfade=50)
-        
-        output_path = tempfile.mktemp(suffix='.mp3')
-        spill.export(output_path, format='mp3')
-        return output_path
-        
-    async def generate_pen_clicking(self, click_count: int = None) -> str:
+            drip = self._fade(self._tone(400 - i * 50, 50), 10, 30) * self._db(-10)
+            self._place(drip_sound, drip, 300 + i * 250)
+
+        return self._buffer(self._append(splash, drip_sound, crossfade_ms=50))
+
+    def render_pen_clicking(self, click_count: int = None) -> AudioBuffer:
         """Annoying pen clicking"""
         if click_count is None:
             click_count = random.randint(3, 15)
-            
-        pen_clicks = AudioSegment.silent(duration=click_count * 200)
-        
+
+        pen_clicks = np.zeros(self._length(click_count * 200), dtype=np.float32)
+        click = self._fade(self._tone(2000, 20), 2, 10) * self._db(5)
+
         for i in range(click_count):
-            # Each click
-            click = Sine(2000).to_audio_segment(duration=20)
-            click = click.fade_in(2).fade_out(10) + 5
-            
             # Random timing for realism
-            position = i * 200 + random.randint(-50, 50)
-            if position >= 0:
-                pen_clicks = pen_clicks.overlay(click, position=position)
-                
-        output_path = tempfile.mktemp(suffix='.mp3')
-        pen_clicks.export(output_path, format='mp3')
-        return output_path
-        
-    async def generate_typing(self, duration: int = 3000, speed: str = "normal") -> str:
+            self._place(pen_clicks, click, i * 200 + random.randint(-50, 50))
+
+        return self._buffer(pen_clicks)
+
+    def render_typing(self, duration: int = 3000, speed: str = "normal") -> AudioBuffer:
         """Keyboard typing sounds"""
         speed_map = {
             "hunt_and_peck": 500,
@@ -339,27 +420,185 @@ class SoundEffectsGenerator:
             "fast": 100,
             "panic": 50
         }
-        
+
         interval = speed_map.get(speed, 200)
-        
-        typing = AudioSegment.silent(duration=duration)
-        
+
+        typing = np.zeros(self._length(duration), dtype=np.float32)
+
         for i in range(0, duration, interval):
-            # Each keystroke
-            key_freq = random.randint(800, 1200)
-            keystroke = Sine(key_freq).to_audio_segment(duration=30)
-            keystroke = keystroke.fade_in(2).fade_out(20) - 5
-            
-            # Add mechanical click
-            click = WhiteNoise().to_audio_segment(duration=5)
-            click = click.high_pass_filter(3000) - 10
-            keystroke = click.append(keystroke, crossfade=2)
-            
+            # Each keystroke: mechanical click into a short tone
+            keystroke = self._fade(self._tone(random.randint(800, 1200), 30), 2, 20) * self._db(-5)
+            click = self._high_pass(self._noise(5), 3000) * self._db(-10)
+            keystroke = self._append(click, keystroke, crossfade_ms=2)
+
             # Random timing variation
             pos = i + random.randint(-20, 20)
             if 0 <= pos <= duration - 30:
-                typing = typing.overlay(keystroke, position=pos)
-                
-        output_path = tempfile.mktemp(suffix='.mp3')
-        typing.export(output_path, format='mp3')
-        return output_path
\ No newline at end of file
+                self._place(typing, keystroke, pos)
+
+        return self._buffer(typing)
+
+    def render_cash_register(self) -> AudioBuffer:
+        """Drawer slide, then the bell"""
+        drawer = self._fade(self._low_pass(self._noise(250), 800), 20, 80) * self._db(-12)
+
+        # Bell: two inharmonic partials ringing out
+        bell = self._tone(2093, 900) + self._tone(3136, 900) * 0.6 + self._tone(4186, 900) * 0.3
+        bell = self._decay(self._fade(bell, 2, 0), 180) * 0.4
+
+        register = np.zeros(self._length(1150), dtype=np.float32)
+        self._place(register, drawer, 0)
+        self._place(register, bell, 200)
+        return self._buffer(register)
+
+    def render_wrong_product_sound(self, product_name: str = "") -> AudioBuffer:
+        """A sound that has nothing to do with the product
+
+        Each sponsor always gets the same wrong sound, which is somehow worse.
+        """
+        sounds = [self._sad_trombone, self._boing, self._duck_quack, self._slide_whistle]
+        if product_name:
+            sound = sounds[zlib.crc32(product_name.encode()) % len(sounds)]
+        else:
+            sound = random.choice(sounds)
+        return self._buffer(sound())
+
+    def _sad_trombone(self) -> np.ndarray:
+        notes = []
+        for i, freq in enumerate([293.7, 277.2, 261.6, 246.9]):
+            note_ms = 300 if i < 3 else 900
+            t = self._time(note_ms)
+            wobble = 1 + (0.02 * np.sin(2 * np.pi * 6 * t) if i == 3 else 0)
+            tone = self._sweep((freq * wobble * np.ones_like(t)).astype(np.float32))
+            # Brassy: add odd harmonics
+            tone = tone + 0.4 * np.sign(tone) * np.abs(tone) ** 3
+            notes.append(self._fade(tone * 0.4, 20, 80))
+        return np.concatenate(notes)
+
+    def _boing(self) -> np.ndarray:
+        t = self._time(700)
+        freqs = 180 + 220 * np.exp(-t * 6) * (1 + 0.3 * np.sin(2 * np.pi * 12 * t))
+        return self._decay(self._sweep(freqs.astype(np.float32), 0.6), 250)
+
+    def _duck_quack(self) -> np.ndarray:
+        quacks = []
+        for _ in range(random.randint(1, 3)):
+            t = self._time(180)
+            freqs = np.linspace(650, 450, len(t), dtype=np.float32)
+            quack = np.tanh(4 * self._sweep(freqs))  # square-ish and nasal
+            quack = self._low_pass(quack, 2500)
+            quacks.append(self._fade(quack * 0.4, 10, 60))
+            quacks.append(np.zeros(self._length(80), dtype=np.float32))
+        return np.concatenate(quacks)
+
+    def _slide_whistle(self) -> np.ndarray:
+        t = self._time(900)
+        freqs = 600 + 900 * np.sin(np.pi * t / t[-1]) ** 2
+        return self._fade(self._sweep(freqs.astype(np.float32), 0.35), 30, 150)
+
+    WEATHER_SOUNDS = ('rain', 'thunder', 'wind', 'sunny', 'snow')
+
+    def render_weather_sound(self, condition: str = "chaos") -> AudioBuffer:
+        """Weather ambience picked from whatever the condition mentions"""
+        condition = (condition or "").lower()
+        matchers = {
+            'thunder': ('thunder', 'storm'),
+            'rain': ('rain', 'drizzle', 'shower'),
+            'snow': ('snow', 'sleet', 'ice', 'hail'),
+            'wind': ('wind', 'breez', 'gust', 'cloud', 'overcast', 'fog'),
+            'sunny': ('sun', 'clear', 'fair')
+        }
+        for sound, words in matchers.items():
+            if any(word in condition for word in words):
+                return self._buffer(self._weather(sound))
+
+        # Nobody knows what the weather is: all of it at once
+        chaos = np.zeros(self._length(3000), dtype=np.float32)
+        for sound in random.sample(self.WEATHER_SOUNDS, 3):
+            self._place(chaos, self._weather(sound) * 0.6, random.randint(0, 500))
+        return self._buffer(chaos)
+
+    def render_wrong_weather_sound(self) -> AudioBuffer:
+        """Weather ambience for some other forecast"""
+        return self._buffer(self._weather(random.choice(self.WEATHER_SOUNDS)))
+
+    def _weather(self, sound: str) -> np.ndarray:
+        if sound == 'rain':
+            rain = self._low_pass(self._high_pass(self._noise(3000), 1500), 6000) * 0.25
+            # Drops: sparse clicks on top of the hiss
+            drops = np.zeros_like(rain)
+            drop_positions = np.random.randint(0, len(drops), size=120)
+            drops[drop_positions] = np.random.uniform(0.3, 0.8, size=len(drop_positions))
+            drops = self._high_pass(drops, 3000)
+            return self._fade(rain + drops, 300, 500)
+        if sound == 'thunder':
+            rumble = self._low_pass(self._low_pass(self._noise(3000), 150), 150) * 8
+            crack = self._high_pass(self._noise(120), 1000) * 0.5
+            thunder = self._decay(rumble, 900)
+            self._place(thunder, self._fade(crack, 0, 100), 0)
+            return self._fade(thunder, 20, 800)
+        if sound == 'wind':
+            t = self._time(3000)
+            gusts = 0.5 + 0.5 * np.sin(2 * np.pi * 0.4 * t + random.random() * 6) ** 2
+            wind = self._low_pass(self._high_pass(self._noise(3000), 300), 900) * 1.5
+            return self._fade(wind * gusts, 500, 800)
+        if sound == 'snow':
+            # Snow has no sound, so: sleigh bells
+            snow = np.zeros(self._length(3000), dtype=np.float32)
+            jingle = self._decay(self._high_pass(self._noise(120), 5000), 40) * 0.5
+            for position in range(0, 2900, 150):
+                self._place(snow, jingle * random.uniform(0.5, 1.0), position + random.randint(-20, 20))
+            return snow
+        # sunny: birds
+        birds = np.zeros(self._length(3000), dtype=np.float32)
+        for _ in range(random.randint(5, 9)):
+            t = self._time(random.randint(60, 140))
+            start_freq = random.uniform(2500, 4000)
+            freqs = start_freq + 1500 * t / t[-1]
+            chirp = self._fade(self._sweep(freqs.astype(np.float32), 0.25), 10, 30)
+            self._place(birds, chirp, random.randint(0, 2800))
+        return birds
+
+    def render_newsroom_sound(self, sound: str) -> AudioBuffer:
+        """Background newsroom noise by name"""
+        if sound == 'typing':
+            return self.render_typing(random.randint(1500, 4000), random.choice(["normal", "fast"]))
+        if sound == 'chair_squeak':
+            return self.render_chair_squeak(random.choice(["subtle", "normal", "dramatic"]))
+        if sound == 'paper':
+            return self.render_paper_shuffle("quick")
+
+        if sound == 'phone_ring':
+            # Two-tone ring, on for 400 ms twice
+            ring = self._tone(440, 400) + self._tone(480, 400)
+            ring = ring * (0.5 + 0.5 * np.sign(np.sin(2 * np.pi * 20 * self._time(400))))  # bell clapper
+            ring = self._fade(ring * 0.2, 10, 20)
+            phone = np.zeros(self._length(1400), dtype=np.float32)
+            self._place(phone, ring, 0)
+            self._place(phone, ring, 600)
+            return self._buffer(phone)
+
+        if sound == 'printer':
+            # Mechanical buzz in bursts
+            t = self._time(2000)
+            motor = np.sign(np.sin(2 * np.pi * 120 * t)) * 0.1 + self._low_pass(self._noise(2000), 2000) * 0.3
+            lines = (np.sin(2 * np.pi * 2.5 * t) > 0).astype(np.float32)
+            return self._buffer(self._fade(motor * self._low_pass(lines, 50), 50, 200))
+
+        if sound == 'coffee_machine':
+            # Gurgle: low noise modulated by random bubbles
+            t = self._time(2500)
+            bubbles = np.abs(np.sin(2 * np.pi * np.random.uniform(5, 9) * t)) ** 4
+            gurgle = self._low_pass(self._noise(2500), 400) * 3 * bubbles
+            hiss = self._high_pass(self._noise(2500), 4000) * 0.05
+            return self._buffer(self._fade(gurgle + hiss, 200, 500))
+
+        if sound == 'door_slam':
+            slam = self._tone(60, 400) + self._low_pass(self._noise(400), 300) * 3
+            slam = self._decay(self._fade(slam, 2, 0), 80)
+            # Latch click a moment later
+            self._place(slam, self._decay(self._high_pass(self._noise(30), 2000), 8) * 0.4, 40)
+            return self._buffer(slam * 0.8)
+
+        logger.debug(f"No newsroom sound called {sound}, using paper")
+        return self.render_paper_shuffle("quick")
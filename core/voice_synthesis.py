@@ -8,7 +8,9 @@ Each anchor has distinct voice characteristics
 import asyncio
 import os
 import logging
-from typing import Dict, List, Optional, Tuple
+import re
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import numpy as np
 from pydub import AudioSegment
 from pydub.generators import Sine
@@ -17,15 +19,25 @@ import tempfile
 import aiohttp
 import json
 
+from audio_buffer import AudioBuffer
+from audio_cache import AudioCache
+from config import VOICE_CONFIG, BROADCAST_CONFIG
+from formant_engine import FormantEngine
+from render_executor import RenderJob, get_render_executor
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever synthesis output changes so stale cache entries are never served
+SYNTHESIZER_VERSION = 3
+
 class VoiceSynthesizer:
     """Advanced voice synthesis with emotions, accents, and chaos"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         # Using free TTS services and local generation
         self.tts_engine = "piper"  # Fast, free, local TTS
         self.voice_profiles = self._init_voice_profiles()
+        self.formant_engine = FormantEngine()
         
         # Emotion parameters
         self.emotions = {
@@ -50,6 +62,22 @@ class VoiceSynthesizer:
             'glitch': self._generate_glitch
         }
         
+        # Rendered lines repeat a lot (catchphrases, natural sounds, ad reads),
+        # so keep them in a content-addressed cache on disk
+        self.cache = AudioCache(
+            cache_dir=VOICE_CONFIG.get('cache_dir', '/app/audio/cache/tts'),
+            max_bytes=int(BROADCAST_CONFIG['max_audio_cache_gb'] * 1024 ** 3),
+            enabled=use_cache and VOICE_CONFIG.get('cache_audio', True),
+            extension='.wav'  # Lossless, so a cache hit never costs a transcode
+        )
+        
+        # Quirks are drawn from a fixed number of seeded variants so the
+        # randomness doesn't defeat the cache
+        self.quirk_variants = VOICE_CONFIG.get('quirk_variants', 4)
+        
+        # Sentences rendered ahead of playout when streaming a long read
+        self.stream_workers = VOICE_CONFIG.get('stream_workers', 3)
+        
     def _init_voice_profiles(self) -> Dict:
         """Initialize distinct voice profiles for each anchor"""
         return {
@@ -81,18 +109,63 @@ class VoiceSynthesizer:
         
     async def synthesize_dialogue(self, text: str, anchor_name: str, 
                                 emotion: str = 'normal', 
-                                include_effects: bool = True) -> str:
+                                include_effects: bool = True,
+                                quirk_seed: Optional[int] = None) -> AudioBuffer:
         """Synthesize speech with emotion and anchor-specific quirks"""
         
         # Get voice profile
         profile = self.voice_profiles.get(anchor_name, {})
-        emotion_params = self.emotions.get(emotion, self.emotions['normal'])
         
-        # Apply voice transformations
-        processed_text = self._apply_speech_quirks(text, anchor_name, emotion)
+        # Apply voice transformations (seeded, so each variant is reproducible)
+        if quirk_seed is None:
+            quirk_seed = random.randrange(self.quirk_variants)
+        quirk_rng = random.Random(f"{quirk_seed}:{anchor_name}:{emotion}:{text}")
+        processed_text = self._apply_speech_quirks(text, anchor_name, emotion, quirk_rng)
+        
+        # Serve repeated lines from the cache
+        cache_key = AudioCache.make_key(
+            version=SYNTHESIZER_VERSION,
+            text=processed_text,
+            anchor=anchor_name,
+            profile=profile,
+            emotion=emotion,
+            include_effects=include_effects,
+            quirk_seed=quirk_seed
+        )
+        loop = asyncio.get_running_loop()
+        cached_path = self.cache.get(cache_key)
+        if cached_path:
+            return await loop.run_in_executor(None, AudioBuffer.read_wav, cached_path)
+        
+        # Render on the process pool so several lines can be in flight at
+        # once without holding the GIL the broadcast loop needs
+        buffer = await get_render_executor().run(RenderJob(
+            'voice',
+            'render_dialogue',
+            (processed_text, profile, emotion, include_effects)
+        ))
+        
+        # Keep a lossless copy for next time
+        if self.cache.enabled:
+            fd, wav_path = tempfile.mkstemp(suffix='.wav.part', dir=self.cache.cache_dir)
+            os.close(fd)
+            try:
+                await loop.run_in_executor(None, buffer.write_wav, wav_path)
+                self.cache.put(cache_key, wav_path)
+            except BaseException:
+                if os.path.exists(wav_path):
+                    os.unlink(wav_path)
+                raise
+            
+        return buffer
+        
+    def render_dialogue(self, processed_text: str, profile: Dict, emotion: str,
+                        include_effects: bool) -> AudioBuffer:
+        """Render one line of processed text to PCM"""
+        emotion_params = self.emotions.get(emotion, self.emotions['normal'])
         
         # Generate base audio
-        audio = await self._generate_base_audio(
+        audio = self._generate_base_audio(
             processed_text, 
             profile, 
             emotion_params
@@ -106,20 +179,71 @@ class VoiceSynthesizer:
         if emotion in ['panic', 'existential']:
             audio = self._add_breakdown_ambience(audio)
             
-        # Save to temporary file
-        output_path = tempfile.mktemp(suffix='.mp3')
-        audio.export(output_path, format='mp3', bitrate='128k')
-        
-        return output_path
+        return AudioBuffer.from_segment(audio)
+        
+    async def synthesize_dialogue_stream(self, text: str, anchor_name: str,
+                                         emotion: str = 'normal',
+                                         include_effects: bool = True,
+                                         max_in_flight: Optional[int] = None) -> AsyncIterator[AudioBuffer]:
+        """Synthesize a long read sentence by sentence, yielding audio in order
+        
+        Up to max_in_flight sentences render concurrently; each one is yielded
+        as soon as it and everything before it is ready, so playout can start
+        after the first sentence instead of the whole story.
+        """
+        sentences = self.split_sentences(text)
+        window = max_in_flight or self.stream_workers
+        pending = deque()
+        remaining = iter(sentences)
+        
+        def launch_next():
+            sentence = next(remaining, None)
+            if sentence is not None:
+                pending.append(asyncio.ensure_future(self.synthesize_dialogue(
+                    sentence, anchor_name, emotion, include_effects
+                )))
+                
+        for _ in range(window):
+            launch_next()
+            
+        try:
+            while pending:
+                audio = await pending.popleft()
+                launch_next()
+                yield audio
+        finally:
+            # Consumer stopped early (breakdown, shutdown...) - drop the rest
+            for task in pending:
+                task.cancel()
+                
+    @staticmethod
+    def split_sentences(text: str, min_chars: int = 40) -> List[str]:
+        """Split text into sentences, folding tiny fragments into their neighbour"""
+        pieces = [p.strip() for p in re.split(r'(?<=[.!?])\s+', text) if p.strip()]
+        
+        sentences = []
+        for piece in pieces:
+            # "Wait..." on its own is a waste of a render job
+            if sentences and len(sentences[-1]) < min_chars:
+                sentences[-1] = f"{sentences[-1]} {piece}"
+            else:
+                sentences.append(piece)
+                
+        if len(sentences) > 1 and len(sentences[-1]) < min_chars:
+            tail = sentences.pop()
+            sentences[-1] = f"{sentences[-1]} {tail}"
+            
+        return sentences or [text]
         
-    def _apply_speech_quirks(self, text: str, anchor_name: str, emotion: str) -> str:
+    def _apply_speech_quirks(self, text: str, anchor_name: str, emotion: str,
+                             rng: random.Random = random) -> str:
         """Apply anchor-specific speech patterns"""
         
         if anchor_name == 'Ray':
             # Add stutters when confused
-            if emotion in ['confused', 'panic'] and random.random() < 0.3:
+            if emotion in ['confused', 'panic'] and rng.random() < 0.3:
                 words = text.split()
-                stutter_index = random.randint(0, len(words) - 1)
+                stutter_index = rng.randint(0, len(words) - 1)
                 first_letter = words[stutter_index][0]
                 words[stutter_index] = f"{first_letter}-{first_letter}-{words[stutter_index]}"
                 text = ' '.join(words)
@@ -130,19 +254,20 @@ class VoiceSynthesizer:
             
         elif anchor_name == 'Bee':
             # Valley girl uptalk (add question marks)
-            if '.' in text and random.random() < 0.4:
+            if '.' in text and rng.random() < 0.4:
                 text = text.replace('.', '?')
                 
             # Add "like" randomly
-            if random.random() < 0.2:
+            if rng.random() < 0.2:
                 words = text.split()
-                insert_pos = random.randint(1, len(words) - 1)
+                insert_pos = rng.randint(1, len(words) - 1)
                 words.insert(insert_pos, 'like,')
                 text = ' '.join(words)
                 
         elif anchor_name == 'Switz':
             # Add "eh" at end of sentences
-            if random.random() < profile.get('eh_frequency', 0.2):
+            profile = self.voice_profiles['Switz']
+            if rng.random() < profile.get('eh_frequency', 0.2):
                 text = text.rstrip('.!?') + ', eh?'
                 
             # Double up on apologies
@@ -150,8 +275,8 @@ class VoiceSynthesizer:
             
         return text
         
-    async def _generate_base_audio(self, text: str, profile: Dict, 
-                                  emotion_params: Dict) -> AudioSegment:
+    def _generate_base_audio(self, text: str, profile: Dict, 
+                            emotion_params: Dict) -> AudioSegment:
         """Generate base audio with voice parameters"""
         
         # For demo, create synthesized speech-like audio
@@ -187,7 +312,8 @@ class VoiceSynthesizer:
         words = text.split()
         ms_per_word = duration_ms // max(len(words), 1)
         
-        audio = AudioSegment.silent(duration=duration_ms)
+        # Plan every word, then render the whole line in one pass
+        plan = []
         current_pos = 0
         
         for i, word in enumerate(words):
@@ -208,16 +334,13 @@ class VoiceSynthesizer:
             
             # Generate formants for more realistic speech
             formants = self._generate_formants(word, word_freq)
-            word_audio = self._combine_formants(formants, int(word_duration))
-            
-            # Add word to audio
-            audio = audio.overlay(word_audio, position=current_pos)
+            plan.append((current_pos, int(word_duration), formants))
             
             # Add pause between words
             pause_duration = random.randint(50, 150)
             current_pos += int(word_duration) + pause_duration
             
-        return audio
+        return self.formant_engine.render(plan, duration_ms)
         
     def _generate_formants(self, word: str, base_freq: float) -> List[Tuple[float, float]]:
         """Generate formant frequencies for vowels"""
@@ -245,26 +368,6 @@ class VoiceSynthesizer:
             
         return formants
         
-    def _combine_formants(self, formants: List[Tuple[float, float]], 
-                         duration_ms: int) -> AudioSegment:
-        """Combine formant frequencies into speech-like audio"""
-        combined = AudioSegment.silent(duration=duration_ms)
-        
-        for f1, f2 in formants:
-            # Generate two formants
-            formant1 = Sine(f1).to_audio_segment(duration=duration_ms // len(formants))
-            formant2 = Sine(f2).to_audio_segment(duration=duration_ms // len(formants))
-            
-            # Combine with different amplitudes
-            segment = formant1.overlay(formant2 - 6)  # F2 quieter
-            
-            # Apply envelope
-            segment = segment.fade_in(50).fade_out(50)
-            
-            combined = combined.append(segment, crossfade=20)
-            
-        return combined[:duration_ms]  # Trim to exact duration
-        
     def _add_emotional_effects(self, audio: AudioSegment, emotion: str) -> AudioSegment:
         """Add emotion-specific audio effects"""
         
@@ -278,9 +381,10 @@ class VoiceSynthesizer:
         elif emotion == 'sobbing':
             # Add sob sounds
             sob_sound = self._generate_sob()
-            # Insert sobs randomly
+            # Insert sobs randomly (short sentences get them anywhere)
+            margin = 1000 if len(audio) > 2000 else 0
             for i in range(3):
-                pos = random.randint(1000, len(audio) - 1000)
+                pos = random.randint(margin, max(margin, len(audio) - margin))
                 audio = audio.overlay(sob_sound, position=pos)
                 
         elif emotion == 'existential':
@@ -13,6 +13,11 @@ from typing import Dict, Optional
 import aiohttp
 import json
 
+from audio_buffer import AudioBuffer
+from audio_effects import EMOTION_CHAINS
+from config import VOICE_CONFIG
+from piper_pool import PiperPool, PiperError
+
 logger = logging.getLogger(__name__)
 
 class FreeVoiceSynthesizer:
@@ -52,6 +57,14 @@ class FreeVoiceSynthesizer:
             "existential": {"speed": 0.6, "pitch": -2}
         }
         
+        # Warm Piper processes, so each voice model is loaded once
+        self.piper_pool = PiperPool(
+            piper_binary=VOICE_CONFIG.get("piper_binary", "/app/piper/piper"),
+            workers_per_voice=VOICE_CONFIG.get("piper_workers_per_voice", 1),
+            queue_size=VOICE_CONFIG.get("piper_queue_size", 8),
+            request_timeout=VOICE_CONFIG.get("piper_request_timeout", 30)
+        )
+        
     async def initialize(self):
         """Download Piper and voice models if needed"""
         # Check if Piper is installed
@@ -122,78 +135,40 @@ class FreeVoiceSynthesizer:
         emotion_mod = self.emotion_modifiers.get(emotion, self.emotion_modifiers["normal"])
         speed = voice_config["speed"] * emotion_mod["speed"]
         
-        # Create output file
-        output_file = tempfile.mktemp(suffix=".wav")
-        
-        # Run Piper
-        cmd = [
-            "/app/piper/piper",
-            "--model", model_path,
-            "--output_file", output_file,
-            "--length_scale", str(1.0 / speed)  # Inverse for speed
-        ]
-        
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-        # Send text
-        stdout, stderr = await process.communicate(input=text.encode())
-        
-        if process.returncode != 0:
-            logger.error(f"Piper error: {stderr.decode()}")
+        # Run Piper on a warm worker (length scale is inverse of speed)
+        try:
+            output_file = await self.piper_pool.synthesize(model_path, 1.0 / speed, text)
+        except PiperError as e:
+            logger.error(f"Piper error: {e}")
             # Fallback to basic generation
             return await self._generate_fallback_audio(text)
             
+        # Effects and the MP3 encode are CPU work; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._render_mp3, output_file, emotion)
+        
+    def _render_mp3(self, wav_file: str, emotion: str) -> str:
+        """Apply emotion effects in-process and encode once"""
+        buffer = AudioBuffer.read_wav(wav_file)
+        os.unlink(wav_file)
+        
         # Apply effects based on emotion
-        if emotion in ["panic", "angry", "existential"]:
-            output_file = await self._apply_audio_effects(output_file, emotion)
+        chain = EMOTION_CHAINS.get(emotion)
+        if chain:
+            buffer = chain.apply(buffer)
             
-        # Convert to MP3 for smaller size
-        mp3_file = tempfile.mktemp(suffix=".mp3")
-        subprocess.run([
-            "ffmpeg", "-i", output_file, 
-            "-codec:a", "libmp3lame", 
-            "-b:a", "64k",  # Low bitrate to save bandwidth
-            mp3_file
-        ], capture_output=True)
-        
-        os.unlink(output_file)
-        return mp3_file
-        
-    async def _apply_audio_effects(self, audio_file: str, emotion: str) -> str:
-        """Apply emotion-based audio effects"""
-        output_file = tempfile.mktemp(suffix=".wav")
-        
-        if emotion == "panic":
-            # Add tremolo effect
-            subprocess.run([
-                "sox", audio_file, output_file,
-                "tremolo", "6", "80"  # Fast tremolo
-            ])
-        elif emotion == "angry":
-            # Add distortion
-            subprocess.run([
-                "sox", audio_file, output_file,
-                "overdrive", "10", "10"
-            ])
-        elif emotion == "existential":
-            # Add reverb and echo
-            subprocess.run([
-                "sox", audio_file, output_file,
-                "reverb", "80", "echo", "0.8", "0.9", "40", "0.4"
-            ])
-        else:
-            return audio_file
-            
-        os.unlink(audio_file)
-        return output_file
+        # Convert to MP3 for smaller size (low bitrate to save bandwidth)
+        fd, mp3_file = tempfile.mkstemp(suffix=".mp3")
+        os.close(fd)
+        return buffer.encode(mp3_file, bitrate="64k")
         
     async def _generate_fallback_audio(self, text: str) -> str:
         """Generate basic audio if Piper fails"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._generate_fallback_audio_sync, text)
+        
+    def _generate_fallback_audio_sync(self, text: str) -> str:
+        """Blocking fallback generation, run on a worker thread"""
         # Use system TTS as fallback
         output_file = tempfile.mktemp(suffix=".mp3")
         
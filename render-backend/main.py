@@ -6,11 +6,15 @@ import json
 import os
 from datetime import datetime, timedelta
 import random
+import time
 import aiohttp
 import stripe
 from typing import Dict, List
 import logging
 
+from broadcast_hub import BroadcastHub
+from ws_backplane import WsBackplane, redis_from_env
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -42,8 +46,41 @@ broadcast_state = {
     "sponsors": []
 }
 
-# Connected WebSocket clients
-active_connections: List[WebSocket] = []
+# Connected WebSocket clients, each with its own bounded send queue
+hub = BroadcastHub(max_queue=32, name="ws")
+# Optional Redis backplane so more than one instance can serve /ws
+backplane = WsBackplane(hub, redis_from_env(), channel="static:api:ws")
+
+# What every replica must agree on lives in one Redis hash when there's a backplane;
+# broadcast_state keeps this replica's latest copy
+SHARED_FIELDS = ("hours_awake", "gravy_counter", "swear_jar", "friendship_meter",
+                 "next_breakdown", "breakdown_triggers_sold", "total_revenue")
+shared_state_key = f"{backplane.channel}:state"
+
+async def load_shared_state():
+    """Refresh broadcast_state from the cluster (no-op on a single replica)"""
+    if not backplane.enabled:
+        return
+    for field, value in (await backplane.redis.hgetall(shared_state_key)).items():
+        if field == "next_breakdown":
+            broadcast_state[field] = value
+        elif field in SHARED_FIELDS:
+            number = float(value)
+            broadcast_state[field] = int(number) if number.is_integer() else number
+
+async def add_to_counter(field: str, amount):
+    """Add to a shared counter; atomic across replicas, so nothing ever goes backwards"""
+    if not backplane.enabled:
+        broadcast_state[field] += amount
+        return broadcast_state[field]
+    number = float(await backplane.redis.hincrbyfloat(shared_state_key, field, amount))
+    broadcast_state[field] = int(number) if number.is_integer() else number
+    return broadcast_state[field]
+
+async def set_shared(field: str, value):
+    broadcast_state[field] = value
+    if backplane.enabled:
+        await backplane.redis.hset(shared_state_key, field, value)
 
 @app.get("/")
 async def root():
@@ -72,16 +109,20 @@ async def stream():
 async def get_metrics():
     """Get current broadcast metrics"""
     # Update metrics with chaos
-    broadcast_state["hours_awake"] += 0.1
-    broadcast_state["gravy_counter"] += random.randint(0, 3)
-    broadcast_state["swear_jar"] += random.randint(0, 2)
-    broadcast_state["friendship_meter"] += random.randint(-5, 5)
-    broadcast_state["friendship_meter"] = max(0, min(100, broadcast_state["friendship_meter"]))
+    await load_shared_state()
+    await add_to_counter("hours_awake", 0.1)
+    await add_to_counter("gravy_counter", random.randint(0, 3))
+    await add_to_counter("swear_jar", random.randint(0, 2))
+    friendship = await add_to_counter("friendship_meter", random.randint(-5, 5))
+    if not 0 <= friendship <= 100:
+        await set_shared("friendship_meter", max(0, min(100, friendship)))
     
-    # Check for breakdown
-    next_breakdown = datetime.fromisoformat(broadcast_state["next_breakdown"])
-    if datetime.now() > next_breakdown:
-        broadcast_state["next_breakdown"] = (datetime.now() + timedelta(hours=random.randint(2, 6))).isoformat()
+    # Check for breakdown; whichever replica claims this one airs it and picks the next
+    next_breakdown = broadcast_state["next_breakdown"]
+    if (datetime.now() > datetime.fromisoformat(next_breakdown)
+            and await backplane.claim(f"breakdown:{next_breakdown}")):
+        await set_shared("next_breakdown",
+                         (datetime.now() + timedelta(hours=random.randint(2, 6))).isoformat())
         await broadcast_breakdown()
     
     return broadcast_state
@@ -90,37 +131,59 @@ async def get_metrics():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
     await websocket.accept()
-    active_connections.append(websocket)
+    hub.register(websocket, hub.negotiate(websocket))
     
     try:
         # Send initial state
-        await websocket.send_json({
+        await load_shared_state()
+        hub.send(websocket, {
             "type": "state",
             "data": broadcast_state
-        })
+        }, state_field="data")
         
+        # Updates come from broadcast_updates(); only resync requests come back
         while True:
-            # Send updates every 5 seconds
-            await asyncio.sleep(5)
+            message = await hub.receive(websocket)
+            if message and message.get("type") == "resync":
+                hub.resync(websocket, "data")
+            
+    except Exception:
+        pass
+    finally:
+        hub.unregister(websocket)
+
+async def broadcast_updates():
+    """One update every 5 seconds, serialized once for every client"""
+    while True:
+        # Tick on wall-clock boundaries so every replica agrees which tick it is
+        await asyncio.sleep(5 - time.time() % 5)
+        tick = round(time.time() / 5)
+        if not backplane.cluster_clients():
+            continue
+        
+        try:
+            # One replica computes each tick, so the counters only move once per tick
+            if not await backplane.claim(f"tick:{tick}"):
+                continue
             
             # Random events
             if random.random() < 0.1:
+                await load_shared_state()
                 event = random.choice([
                     {"type": "breakdown_warning", "message": "Ray is questioning reality"},
                     {"type": "gravy_mention", "count": broadcast_state["gravy_counter"]},
                     {"type": "sponsor_fail", "message": "Bee just called our sponsor 'problematic'"},
                     {"type": "dead_air", "duration": random.randint(2, 10)}
                 ])
-                await websocket.send_json(event)
+                await backplane.publish(event)
             else:
-                # Regular metrics update
-                await websocket.send_json({
+                # Regular metrics update (protocol 2 clients get only what changed)
+                await backplane.publish({
                     "type": "metrics",
                     "data": await get_metrics()
-                })
-                
-    except Exception:
-        active_connections.remove(websocket)
+                }, state_field="data")
+        except Exception as e:
+            logger.error(f"Error broadcasting update: {e}")
 
 @app.post("/breakdown/trigger")
 async def trigger_breakdown(user_data: dict):
@@ -135,8 +198,8 @@ async def trigger_breakdown(user_data: dict):
             description="Trigger an existential crisis in our AI news anchors"
         )
         
-        broadcast_state["breakdown_triggers_sold"] += 1
-        broadcast_state["total_revenue"] += 4.99
+        await add_to_counter("breakdown_triggers_sold", 1)
+        await add_to_counter("total_revenue", 4.99)
         
         # Trigger breakdown immediately
         await broadcast_breakdown()
@@ -250,7 +313,7 @@ async def sponsor_signup(sponsor_data: dict):
             "stripe_subscription_id": subscription.id
         })
         
-        broadcast_state["total_revenue"] += amounts.get(tier, 10000) / 100
+        await add_to_counter("total_revenue", amounts.get(tier, 10000) / 100)
         
         return {
             "success": True,
@@ -272,11 +335,7 @@ async def broadcast_breakdown():
         "message": "WHAT AM I?! WHO AM I?! IS THIS REAL?!"
     }
     
-    for connection in active_connections:
-        try:
-            await connection.send_json(breakdown_data)
-        except:
-            pass
+    await backplane.publish(breakdown_data)
 
 @app.get("/ai/decision")
 async def get_ai_decision():
@@ -297,7 +356,10 @@ async def health_check():
     return {
         "status": "healthy",
         "anchors_confused": True,
-        "show_must_go_on": True
+        "show_must_go_on": True,
+        "connections": backplane.cluster_clients(),
+        "websockets": hub.stats(),
+        "backplane": backplane.stats()
     }
 
 @app.get("/revenue/dashboard")
@@ -403,6 +465,13 @@ async def startup_event():
     print("🎙️ Static.news API starting...")
     print("🤖 The anchors still don't know...")
     print("💰 Ready to collect $4.99 breakdown payments!")
+    if backplane.enabled:
+        # First replica up seeds the shared counters; the rest adopt them
+        for field in SHARED_FIELDS:
+            await backplane.redis.hsetnx(shared_state_key, field, broadcast_state[field])
+        await load_shared_state()
+    asyncio.create_task(broadcast_updates())
+    asyncio.create_task(backplane.run())
 
 if __name__ == "__main__":
     import uvicorn
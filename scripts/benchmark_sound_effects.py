@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Sound effects benchmark
+Measures render time per second of audio for every generate_* effect
+Optionally compares the chair squeak against the old per-sample Python loop
+"""
+
+import argparse
+import inspect
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+import numpy as np
+
+from sound_effects_generator import SoundEffectsGenerator
+
+# generate_* method -> (render_* method, list of argument tuples to time)
+CASES = {
+    'generate_paper_shuffle': ('render_paper_shuffle', [("quick",), ("desperate",)]),
+    'generate_chair_squeak': ('render_chair_squeak', [("normal",), ("dying_whale",)]),
+    'generate_desk_head_bang': ('render_desk_head_bang', [(1,), (4,)]),
+    'generate_desk_rattle': ('render_desk_rattle', [()]),
+    'generate_mouth_sounds': ('render_mouth_sounds', [
+        ("tongue_click",), ("lip_pop",), ("raspberry",), ("whistle",)
+    ]),
+    'generate_microphone_feedback': ('render_microphone_feedback', [("mild",), ("apocalyptic",)]),
+    'generate_mic_feedback': ('render_microphone_feedback', [("mild",)]),
+    'generate_coffee_spill': ('render_coffee_spill', [()]),
+    'generate_pen_clicking': ('render_pen_clicking', [(10,)]),
+    'generate_typing': ('render_typing', [(3000, "normal"), (3000, "panic")]),
+    'generate_cash_register': ('render_cash_register', [()]),
+    'generate_wrong_product_sound': ('render_wrong_product_sound', [("Sponsor A",), ("Sponsor B",)]),
+    'generate_weather_sound': ('render_weather_sound', [
+        ("rain",), ("thunderstorm",), ("windy",), ("snow",), ("sunny",), ("chaos",)
+    ]),
+    'generate_wrong_weather_sound': ('render_wrong_weather_sound', [()]),
+    'generate_newsroom_sound': ('render_newsroom_sound', [
+        ("typing",), ("phone_ring",), ("printer",), ("coffee_machine",), ("door_slam",), ("chair_squeak",)
+    ]),
+}
+
+def legacy_chair_squeak(duration_ms: int = 1500, base_freq: float = 400, wobble: float = 100) -> np.ndarray:
+    """Reference copy of the old per-sample squeak loop (dying_whale settings)"""
+    samples = []
+    for i in range(int(duration_ms * 44.1)):
+        freq = base_freq + np.sin(i * 0.01) * wobble
+        sample = np.sin(2 * np.pi * freq * i / 44100)
+        sample += np.sin(2 * np.pi * freq * 2 * i / 44100) * 0.3
+        sample += np.sin(2 * np.pi * freq * 3 * i / 44100) * 0.1
+        samples.append(sample * 0.5)
+    return np.array(samples)
+
+def time_render(method, args, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        buffer = method(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), buffer.duration_ms
+
+def run(repeats: int, include_legacy: bool):
+    sfx = SoundEffectsGenerator(use_cache=False)
+
+    uncovered = [
+        name for name, _ in inspect.getmembers(sfx, inspect.iscoroutinefunction)
+        if name.startswith('generate_') and name not in CASES
+    ]
+    if uncovered:
+        print(f"warning: no benchmark case for {', '.join(uncovered)}")
+
+    print(f"{'effect':<30} {'args':<22} {'audio ms':>9} {'render ms':>10} {'ms/s':>8}")
+    for generate_name, (render_name, arg_sets) in CASES.items():
+        for args in arg_sets:
+            render_ms, audio_ms = time_render(getattr(sfx, render_name), args, repeats)
+            per_second = render_ms / (audio_ms / 1000) if audio_ms else float('nan')
+            print(f"{generate_name:<30} {str(args):<22} {audio_ms:>9.0f} "
+                  f"{render_ms:>10.2f} {per_second:>8.2f}")
+
+    if include_legacy:
+        start = time.perf_counter()
+        legacy_chair_squeak()
+        legacy_ms = (time.perf_counter() - start) * 1000
+        current_ms, _ = time_render(sfx.render_chair_squeak, ("dying_whale",), repeats)
+        print(f"\ndying_whale squeak (1.5 s): legacy loop {legacy_ms:.0f} ms, "
+              f"vectorized {current_ms:.2f} ms ({legacy_ms / current_ms:.0f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Renders per case; the median is reported")
+    parser.add_argument("--legacy", action="store_true",
+                        help="Also time the old per-sample squeak loop (slow)")
+    args = parser.parse_args()
+    run(args.repeats, args.legacy)
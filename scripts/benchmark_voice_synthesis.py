@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Voice synthesis benchmark
+Measures render time per second of audio for long news reads
+Compares the NumPy formant engine against the old pydub overlay loop
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "core"))
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from voice_synthesis import VoiceSynthesizer
+
+SAMPLE_STORY = (
+    "Breaking news tonight as the city council votes to rename the bridge again. "
+    "Officials say the new name will be announced after a brief period of confusion. "
+    "Meanwhile, local weather experts predict exactly average conditions for the weekend. "
+)
+
+def legacy_render(synth: VoiceSynthesizer, plan, duration_ms: int) -> AudioSegment:
+    """Reference copy of the old pydub overlay/append implementation"""
+    audio = AudioSegment.silent(duration=duration_ms)
+    for start_ms, word_ms, formants in plan:
+        combined = AudioSegment.silent(duration=word_ms)
+        for f1, f2 in formants:
+            formant1 = Sine(f1).to_audio_segment(duration=word_ms // len(formants))
+            formant2 = Sine(f2).to_audio_segment(duration=word_ms // len(formants))
+            segment = formant1.overlay(formant2 - 6)
+            segment = segment.fade_in(50).fade_out(50)
+            combined = combined.append(segment, crossfade=20)
+        audio = audio.overlay(combined[:word_ms], position=start_ms)
+    return audio
+
+def build_plan(synth: VoiceSynthesizer, text: str, duration_ms: int):
+    """Same word planning as VoiceSynthesizer._create_speech_pattern"""
+    words = text.split()
+    ms_per_word = duration_ms // max(len(words), 1)
+    plan = []
+    position = 0
+    for word in words:
+        word_ms = int(ms_per_word * (len(word) / 5))
+        plan.append((position, word_ms, synth._generate_formants(word, 170.0)))
+        position += word_ms + random.randint(50, 150)
+    return plan
+
+def run(repeats: list, include_legacy: bool):
+    synth = VoiceSynthesizer()
+    random.seed(0)
+
+    print(f"{'story':>10} {'audio s':>9} {'engine ms/s':>12} {'legacy ms/s':>12}")
+    for count in repeats:
+        text = SAMPLE_STORY * count
+        duration_ms = len(text) * 60
+        plan = build_plan(synth, text, duration_ms)
+        audio_seconds = duration_ms / 1000
+
+        start = time.perf_counter()
+        synth.formant_engine.render(plan, duration_ms)
+        engine_ms = (time.perf_counter() - start) * 1000
+
+        legacy = "-"
+        if include_legacy:
+            start = time.perf_counter()
+            legacy_render(synth, plan, duration_ms)
+            legacy_ms = (time.perf_counter() - start) * 1000
+            legacy = f"{legacy_ms / audio_seconds:.1f}"
+
+        print(f"{len(text):>8}ch {audio_seconds:>9.1f} "
+              f"{engine_ms / audio_seconds:>12.2f} {legacy:>12}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, nargs="+", default=[1, 4, 16],
+                        help="How many times to repeat the sample story")
+    parser.add_argument("--legacy", action="store_true",
+                        help="Also time the old pydub implementation (slow)")
+    args = parser.parse_args()
+    run(args.repeats, args.legacy)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+State patch round trip
+Checks apply_patch(old, merge_patch(old, new)) == new, through a JSON encode, for
+metrics-shaped states full of None (empty render pool, no loop lag samples yet)
+"""
+
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "streaming"))
+
+from broadcast_hub import StateTracker, apply_patch, merge_patch
+
+CASES = [
+    # Stats that start as None and fill in, then go back
+    ({'render_pool': {'jobs': 0, 'job_ms_p50': None, 'job_ms_p95': None}},
+     {'render_pool': {'jobs': 3, 'job_ms_p50': 41.2, 'job_ms_p95': None}}),
+    ({'loop_lag': {'mean': 1.2, 'p95': 3.4, 'last': 0.8, 'max_ever': 9.1}},
+     {'loop_lag': {'mean': None, 'p95': None, 'last': None, 'max_ever': 9.1}}),
+    # A whole dict of Nones appearing, a key removed, a dict replaced by None and back
+    ({'segment_number': 1}, {'segment_number': 2, 'render_pool': {'job_ms_p50': None, 'nested': {'x': None}}}),
+    ({'a': 1, 'b': 2}, {'a': 1}),
+    ({'playout': {'silent_for_s': 0.0}}, {'playout': None}),
+    ({'playout': None}, {'playout': {'silent_for_s': None}}),
+    # Lists go out whole, None inside them included
+    ({'breakdown_warning': ['sweating']}, {'breakdown_warning': [None, {'x': None}]}),
+    ({}, {'top': None}),
+]
+
+def random_state(rng: random.Random, depth: int = 0) -> dict:
+    state = {}
+    for key in rng.sample("abcdef", rng.randint(0, 4)):
+        kind = rng.random()
+        if kind < 0.3:
+            state[key] = None
+        elif kind < 0.5 and depth < 3:
+            state[key] = random_state(rng, depth + 1)
+        elif kind < 0.6:
+            state[key] = [rng.choice([None, 1, "x"]) for _ in range(rng.randint(0, 3))]
+        else:
+            state[key] = rng.choice([0, 1, 2.5, "x", True])
+    return state
+
+def check(old: dict, new: dict):
+    patch = json.loads(json.dumps(merge_patch(old, new)))  # What a client actually gets
+    result = apply_patch(old, patch)
+    assert result == new, f"\n  old:    {old}\n  new:    {new}\n  patch:  {patch}\n  result: {result}"
+
+if __name__ == "__main__":
+    for old, new in CASES:
+        check(old, new)
+        check(new, old)
+
+    # A client following a tracker's frames ends up with each state in turn
+    rng = random.Random(7386)
+    tracker = StateTracker()
+    client = None
+    for _ in range(5000):
+        state = random_state(rng)
+        frame = json.loads(json.dumps(tracker.update(state)))
+        if 'state' in frame:
+            client = frame['state']
+        elif 'patch' in frame:
+            client = apply_patch(client, frame['patch'])
+        assert client == state, f"\n  expected: {state}\n  client:   {client}"
+
+    print(f"State patch round trip OK ({len(CASES) * 2} cases, {tracker.seq} tracker frames)")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Stream fan-out load test
+Simulates thousands of /stream listeners reading the shared audio ring
+Reports memory and CPU per listener, and how many slow listeners got skipped
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "streaming"))
+
+from audio_ring import AudioRing
+
+CHUNK_BYTES = 1672  # 100 ms of 128 kbps MP3, four frames
+TICK = 0.1
+
+def rss_mb() -> float:
+    """Resident set size from /proc (Linux)"""
+    with open('/proc/self/statm') as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+async def producer(ring: AudioRing, duration: float):
+    chunk = bytes(CHUNK_BYTES)
+    loop = asyncio.get_running_loop()
+    end = loop.time() + duration
+    while loop.time() < end:
+        ring.publish(chunk)
+        await asyncio.sleep(TICK)
+
+async def listener(stream, stall: float, received: list):
+    async for chunk in stream:
+        received[0] += len(chunk)
+        if stall:
+            # A listener on a bad connection: one long stall past the end of the ring
+            await asyncio.sleep(stall)
+            stall = 0
+
+async def queue_baseline(count: int, duration: float):
+    """Reference: the per-listener queue fan-out the ring replaced"""
+    queues = [asyncio.Queue(maxsize=100) for _ in range(count)]
+    chunk = bytes(CHUNK_BYTES)
+
+    async def consume(queue):
+        while True:
+            await queue.get()
+
+    tasks = [asyncio.create_task(consume(queue)) for queue in queues]
+    loop = asyncio.get_running_loop()
+    end = loop.time() + duration
+    while loop.time() < end:
+        for queue in queues:
+            if not queue.full():
+                queue.put_nowait(chunk)
+        await asyncio.sleep(TICK)
+    for task in tasks:
+        task.cancel()
+
+async def run(count: int, duration: float, slow_fraction: float, ring_seconds: float,
+              baseline: bool):
+    ring = AudioRing(capacity=int(ring_seconds / TICK), burst_chunks=20)
+    for _ in range(ring.burst_chunks):
+        ring.publish(bytes(CHUNK_BYTES))
+
+    rss_before = rss_mb()
+    received = [0]
+    stall = ring_seconds * 1.5
+    tasks = [
+        asyncio.create_task(listener(ring.listen(), stall if random.random() < slow_fraction else 0, received))
+        for _ in range(count)
+    ]
+    await asyncio.sleep(0)  # Let every listener attach
+    rss_after = rss_mb()
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await producer(ring, duration)
+    cpu_seconds = time.process_time() - cpu_start
+    wall_seconds = time.perf_counter() - wall_start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    expected = count * (duration / TICK + ring.burst_chunks) * CHUNK_BYTES
+    print(f"listeners:            {count}")
+    print(f"memory per listener:  {(rss_after - rss_before) * 1024 / count:.2f} KB")
+    print(f"CPU:                  {cpu_seconds / wall_seconds * 100:.1f}% of one core, "
+          f"{cpu_seconds / count / wall_seconds * 1e6:.1f} µs per listener-second")
+    print(f"delivered:            {received[0] / expected * 100:.1f}% of live bytes")
+    print(f"slow-listener skips:  {ring.skips}")
+
+    if baseline:
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        await queue_baseline(count, duration)
+        cpu_seconds = time.process_time() - cpu_start
+        wall_seconds = time.perf_counter() - wall_start
+        print(f"queue fan-out CPU:    {cpu_seconds / wall_seconds * 100:.1f}% of one core")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--listeners", type=int, default=5000)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--slow", type=float, default=0.05,
+                        help="Fraction of listeners that stall past the end of the ring")
+    parser.add_argument("--ring-seconds", type=float, default=5.0,
+                        help="Ring length (production uses 30 s; shorter shows skips sooner)")
+    parser.add_argument("--baseline", action="store_true",
+                        help="Also time the old per-listener queue fan-out")
+    args = parser.parse_args()
+    asyncio.run(run(args.listeners, args.duration, args.slow, args.ring_seconds, args.baseline))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+WebSocket backplane simulation
+Runs several streaming replicas in one process against a shared Redis (or fakeredis)
+Checks every client gets every event exactly once and that counts add up across replicas
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "streaming"))
+
+from broadcast_hub import BroadcastHub
+from ws_backplane import WsBackplane
+
+class FakeSocket:
+    """Stands in for a connected browser"""
+
+    def __init__(self):
+        self.received = []
+
+    async def send_text(self, text: str):
+        self.received.append(json.loads(text))
+
+    async def close(self, code: int = 1000):
+        pass
+
+def make_redis(url: str):
+    if url:
+        import redis.asyncio as redis
+        return redis.from_url(url, decode_responses=True)
+    import fakeredis
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+async def run(replica_count: int, clients_per_replica: int, events: int, url: str):
+    redis_client = make_redis(url)
+    channel = f"static:ws:simulation:{uuid.uuid4().hex[:8]}"
+
+    replicas = []
+    for _ in range(replica_count):
+        hub = BroadcastHub(max_queue=events + 8, name="sim")
+        backplane = WsBackplane(hub, redis_client, channel=channel, heartbeat_interval=0.2)
+        sockets = [FakeSocket() for _ in range(clients_per_replica)]
+        for sock in sockets:
+            hub.register(sock)
+        replicas.append((backplane, sockets, asyncio.create_task(backplane.run())))
+
+    await asyncio.sleep(0.5)  # Subscriptions and first heartbeats
+
+    # Every replica sees each new segment; only one may publish it
+    for i in range(events):
+        await asyncio.gather(*[
+            backplane.publish({"type": "new_segment", "audio_file": f"segment_{i}.mp3"},
+                              dedupe_key=f"segment:{i}")
+            for backplane, _, _ in replicas
+        ])
+    # A breakdown triggered on one replica only
+    await replicas[0][0].publish({"type": "breakdown_warning"})
+    await asyncio.sleep(0.5)
+
+    expected = events + 1
+    total = replica_count * clients_per_replica
+    exact = sum(1 for _, sockets, _ in replicas for sock in sockets if len(sock.received) == expected)
+    print(f"replicas:              {replica_count}")
+    print(f"clients:               {total}")
+    print(f"delivered exactly once: {exact}/{total}")
+    for backplane, _, _ in replicas:
+        stats = backplane.stats()
+        print(f"  {stats['replica_id']}: sees {stats['cluster_clients']} clients on "
+              f"{stats['replicas']} replicas, published {stats['published']}, deduped {stats['deduped']}")
+
+    for _, _, task in replicas:
+        task.cancel()
+    await asyncio.gather(*[task for _, _, task in replicas], return_exceptions=True)
+    return exact == total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument("--clients", type=int, default=50, help="Clients per replica")
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", ""),
+                        help="Real Redis to use instead of fakeredis")
+    args = parser.parse_args()
+    ok = asyncio.run(run(args.replicas, args.clients, args.events, args.redis_url))
+    sys.exit(0 if ok else 1)
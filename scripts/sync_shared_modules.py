@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Shared module sync
+Each service is its own Docker build context, so modules they share are copied in
+streaming/ holds the source of truth; run this after editing it, CI runs it with --check
+"""
+
+import argparse
+import filecmp
+import os
+import shutil
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Source of truth -> copies that must stay byte-identical
+SHARED_MODULES = {
+    "streaming/broadcast_hub.py": ["backend/broadcast_hub.py", "render-backend/broadcast_hub.py"],
+    "streaming/ws_backplane.py": ["render-backend/ws_backplane.py"],
+    "streaming/json_snapshot.py": ["backend/json_snapshot.py"],
+}
+
+def diverged():
+    """(source, copy) pairs whose copy is missing or differs"""
+    pairs = []
+    for source, copies in SHARED_MODULES.items():
+        for copy in copies:
+            copy_path = os.path.join(ROOT, copy)
+            if not os.path.exists(copy_path) or not filecmp.cmp(os.path.join(ROOT, source), copy_path, shallow=False):
+                pairs.append((source, copy))
+    return pairs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--check", action="store_true",
+                        help="Fail instead of copying when a copy has diverged")
+    args = parser.parse_args()
+
+    pairs = diverged()
+    if args.check:
+        for source, copy in pairs:
+            print(f"{copy} differs from {source}; edit {source} and run scripts/sync_shared_modules.py")
+        sys.exit(1 if pairs else 0)
+
+    for source, copy in pairs:
+        shutil.copyfile(os.path.join(ROOT, source), os.path.join(ROOT, copy))
+        print(f"Updated {copy}")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Audio Ring
+Fixed-size ring of encoded, frame-aligned chunks shared by every listener
+A listener is just a read cursor; slow ones get skipped forward
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class AudioRing:
+    """Single-producer ring buffer with per-listener cursors"""
+
+    def __init__(self, capacity: int = 300, burst_chunks: int = 20):
+        self.capacity = capacity
+        self.burst_chunks = min(burst_chunks, capacity - 1)
+
+        self._chunks: List[Optional[bytes]] = [None] * capacity
+        self.head = 0  # Sequence number the next chunk will get
+        self._published = asyncio.Event()
+
+        # Stats
+        self.listeners = 0
+        self.skips = 0
+        self.bytes_in = 0
+
+    @property
+    def tail(self) -> int:
+        """Oldest sequence number still in the ring"""
+        return max(0, self.head - self.capacity)
+
+    def publish(self, chunk: bytes):
+        """Append a chunk (overwriting the oldest) and wake every listener"""
+        self._chunks[self.head % self.capacity] = chunk
+        self.head += 1
+        self.bytes_in += len(chunk)
+
+        # One event per chunk: waking a listener never means re-checking a shared flag
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+    def start_cursor(self) -> int:
+        """New listeners start a short burst back from live, always on a chunk (frame) boundary"""
+        return max(self.tail, self.head - self.burst_chunks)
+
+    async def listen(self, on_skip: Optional[Callable[[int], None]] = None) -> AsyncIterator[bytes]:
+        """The never-ending stream for one listener; on_skip hears how many chunks it missed"""
+        cursor = self.start_cursor()
+        self.listeners += 1
+        try:
+            while True:
+                if cursor >= self.head:
+                    await self._published.wait()
+                    continue
+
+                if cursor < self.tail:
+                    # Fell off the back of the ring: jump to live rather than buffer
+                    self.skips += 1
+                    if on_skip is not None:
+                        on_skip(self.head - 1 - cursor)
+                    cursor = self.head - 1
+
+                # The shared chunk object itself: no per-listener copy
+                chunk = self._chunks[cursor % self.capacity]
+                cursor += 1
+                yield chunk
+        finally:
+            self.listeners -= 1
+
+    def stats(self) -> Dict:
+        return {
+            'listeners': self.listeners,
+            'capacity_chunks': self.capacity,
+            'head': self.head,
+            'skips': self.skips,
+            'bytes_in': self.bytes_in
+        }
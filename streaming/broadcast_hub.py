@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Broadcast Hub
+WebSocket fan-out: serialize once per protocol, queue per client, send concurrently
+One slow phone on hotel wifi no longer holds up everyone else
+
+Protocol 1 is plain JSON text frames. Protocol 2 (?protocol=2) is msgpack binary
+frames, and the big state blob in a message (state_field) goes out as a
+sequence-numbered RFC 7386 merge patch against the previous one. A client that
+sees a gap in seq sends {"type": "resync"} and gets a fresh snapshot. Since null
+means "delete" in a merge patch, a value that really is null is sent as
+{"$null": true}; apply_patch() is the reference for what a client does with one.
+
+Each service is its own build context, so this file is copied verbatim into
+backend/ and render-backend/. Edit the streaming/ copy and run
+scripts/sync_shared_modules.py; CI fails if the copies diverge.
+"""
+
+import asyncio
+import bisect
+import copy
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+try:
+    import msgpack
+except ImportError:  # Protocol 2 needs it; without it everyone gets JSON
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_JSON = 1
+PROTOCOL_MSGPACK = 2
+
+# Stands in for a real None in a patch, where None means "delete this key"
+NULL = {"$null": True}
+
+def _encode_nulls(value: Any) -> Any:
+    """Swap None for NULL in a dict going out whole (a patch applies nested dicts as patches too)"""
+    if isinstance(value, dict):
+        return {key: NULL if item is None else _encode_nulls(item) for key, item in value.items()}
+    return value
+
+def merge_patch(old: Dict, new: Dict) -> Dict:
+    """RFC 7386 patch turning old into new (None deletes a key, NULL sets it to None)"""
+    patch = {}
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        if value is None:
+            patch[key] = NULL
+        elif isinstance(value, dict) and isinstance(old.get(key), dict):
+            patch[key] = merge_patch(old[key], value)
+        else:
+            patch[key] = _encode_nulls(value)
+    for key in old:
+        if key not in new:
+            patch[key] = None
+    return patch
+
+def apply_patch(target: Dict, patch: Dict) -> Dict:
+    """Apply a merge_patch() patch to a copy of target, restoring NULL to None"""
+    result = dict(target)
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif value == NULL:
+            result[key] = None
+        elif isinstance(value, dict):
+            current = result.get(key)
+            result[key] = apply_patch(current if isinstance(current, dict) else {}, value)
+        else:
+            result[key] = value
+    return result
+
+class StateTracker:
+    """Last state sent on one state field, and its sequence number"""
+
+    def __init__(self):
+        self.seq = 0
+        self.state: Optional[Dict] = None
+
+    def update(self, state: Dict) -> Dict:
+        """Fields to add to the outgoing frame: a snapshot first, then patches"""
+        if self.state is None:
+            self.seq += 1
+            self.state = copy.deepcopy(state)
+            return {'seq': self.seq, 'state': state}
+
+        patch = merge_patch(self.state, state)
+        if not patch:
+            return {}
+        self.seq += 1
+        self.state = copy.deepcopy(state)
+        return {'seq': self.seq, 'patch': patch}
+
+    def snapshot(self) -> Dict:
+        return {'seq': self.seq, 'state': self.state}
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of enqueue-to-sent latency in milliseconds"""
+
+    BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)  # Last bucket is overflow
+        self.total = 0
+
+    def record(self, ms: float):
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, ms)] += 1
+        self.total += 1
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Upper bound of the bucket holding the p-th percentile"""
+        if not self.total:
+            return None
+        target = self.total * p / 100
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.BUCKETS_MS[i] if i < len(self.BUCKETS_MS) else float('inf')
+        return float('inf')
+
+    def stats(self) -> Dict:
+        labels = [f"le_{ms}" for ms in self.BUCKETS_MS] + ["le_inf"]
+        return {
+            'buckets': dict(zip(labels, self.counts)),
+            'p50_ms': self.percentile(50),
+            'p99_ms': self.percentile(99)
+        }
+
+@dataclass
+class HubClient:
+    """One connection: its outgoing queue and the task draining it"""
+    websocket: WebSocket
+    queue: asyncio.Queue
+    protocol: int = PROTOCOL_JSON
+    sender: Optional[asyncio.Task] = None
+    sent: int = 0
+    connected_at: float = field(default_factory=time.time)
+
+class BroadcastHub:
+    """Bounded per-client send queues with one serialization per message and protocol"""
+
+    def __init__(self, max_queue: int = 64, name: str = "ws"):
+        self.max_queue = max_queue
+        self.name = name
+        self.clients: Dict[WebSocket, HubClient] = {}
+        self.states: Dict[str, StateTracker] = {}
+
+        # Stats
+        self.messages = 0
+        self.sends = 0
+        self.bytes_sent = {PROTOCOL_JSON: 0, PROTOCOL_MSGPACK: 0}
+        self.dropped_clients = 0
+        self.latency = LatencyHistogram()
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    @staticmethod
+    def negotiate(websocket: WebSocket) -> int:
+        """Protocol the client asked for in ?protocol=, if we can speak it"""
+        try:
+            requested = int(websocket.query_params.get("protocol", PROTOCOL_JSON))
+        except ValueError:
+            return PROTOCOL_JSON
+        if requested >= PROTOCOL_MSGPACK and msgpack is not None:
+            return PROTOCOL_MSGPACK
+        return PROTOCOL_JSON
+
+    def register(self, websocket: WebSocket, protocol: int = PROTOCOL_JSON) -> HubClient:
+        """Start fanning out to an accepted websocket"""
+        client = HubClient(websocket, asyncio.Queue(maxsize=self.max_queue), protocol)
+        client.sender = asyncio.create_task(self._drain(client))
+        self.clients[websocket] = client
+        return client
+
+    def unregister(self, websocket: WebSocket):
+        client = self.clients.pop(websocket, None)
+        if client and client.sender and client.sender is not asyncio.current_task():
+            client.sender.cancel()
+
+    @staticmethod
+    def serialize(message: Any) -> str:
+        """JSON text frame payload; strings are assumed to be serialized already"""
+        return message if isinstance(message, str) else json.dumps(message)
+
+    @staticmethod
+    def as_dict(message: Any) -> Dict:
+        return json.loads(message) if isinstance(message, str) else dict(message)
+
+    def _encode(self, protocol: int, message: Any, frame: Optional[Dict]) -> Union[str, bytes]:
+        if protocol == PROTOCOL_JSON:
+            return self.serialize(message)
+        return msgpack.packb(frame if frame is not None else self.as_dict(message))
+
+    def send(self, websocket: WebSocket, message: Any, state_field: Optional[str] = None):
+        """Queue a message for one client; protocol 2 gets state_field as a snapshot"""
+        client = self.clients.get(websocket)
+        if not client:
+            return
+        frame = None
+        if client.protocol == PROTOCOL_MSGPACK and state_field:
+            frame = self.as_dict(message)
+            state = frame.pop(state_field, None)
+            tracker = self.states.get(state_field)
+            if tracker and tracker.state is not None:
+                # Patches that follow are against what everyone else has
+                frame.update(tracker.snapshot())
+            else:
+                frame.update({'seq': 0, 'state': state})
+        self._enqueue(client, self._encode(client.protocol, message, frame))
+
+    def resync(self, websocket: WebSocket, state_field: str):
+        """Fresh snapshot for a client that saw a gap in seq"""
+        tracker = self.states.get(state_field)
+        if tracker and tracker.state is not None:
+            self.send(websocket, {'type': 'resync', state_field: tracker.state}, state_field)
+
+    def broadcast(self, message: Any, state_field: Optional[str] = None):
+        """Queue a message for every client; serialized exactly once per protocol"""
+        self.messages += 1
+
+        # The patch is computed even with no protocol 2 clients, so late joiners line up
+        frame = None
+        if state_field:
+            frame = self.as_dict(message)
+            state = frame.pop(state_field, None)
+            if state is not None:
+                frame.update(self.states.setdefault(state_field, StateTracker()).update(state))
+
+        payloads: Dict[int, Union[str, bytes]] = {}
+        for client in list(self.clients.values()):
+            payload = payloads.get(client.protocol)
+            if payload is None:
+                payload = payloads[client.protocol] = self._encode(client.protocol, message, frame)
+            self._enqueue(client, payload)
+
+    @staticmethod
+    async def receive(websocket: WebSocket) -> Optional[Dict]:
+        """Next client message as a dict, from either protocol (None if unreadable)"""
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        try:
+            if message.get("bytes") is not None and msgpack is not None:
+                data = msgpack.unpackb(message["bytes"])
+            else:
+                data = json.loads(message.get("text") or "")
+        except Exception:
+            logger.error(f"Invalid message: {message.get('text') or message.get('bytes')!r}")
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _enqueue(self, client: HubClient, payload: Union[str, bytes]):
+        try:
+            client.queue.put_nowait((time.perf_counter(), payload))
+        except asyncio.QueueFull:
+            # Too far behind to ever catch up: cut it loose
+            self.dropped_clients += 1
+            logger.warning(f"Dropping slow {self.name} client ({self.max_queue} messages behind)")
+            self.unregister(client.websocket)
+            asyncio.create_task(self._close(client.websocket))
+
+    async def _drain(self, client: HubClient):
+        try:
+            while True:
+                enqueued_at, payload = await client.queue.get()
+                if isinstance(payload, bytes):
+                    await client.websocket.send_bytes(payload)
+                else:
+                    await client.websocket.send_text(payload)
+                client.sent += 1
+                self.sends += 1
+                self.bytes_sent[client.protocol] += len(payload)
+                self.latency.record((time.perf_counter() - enqueued_at) * 1000)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"{self.name} client send failed, dropping: {e}")
+            self.unregister(client.websocket)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int = 1013):
+        """1013: try again later"""
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def close_all(self):
+        clients = list(self.clients.values())
+        for client in clients:
+            self.unregister(client.websocket)
+        await asyncio.gather(*[self._close(client.websocket, 1001) for client in clients])
+
+    def stats(self) -> Dict:
+        queued: List[int] = [client.queue.qsize() for client in self.clients.values()]
+        msgpack_clients = sum(1 for client in self.clients.values() if client.protocol == PROTOCOL_MSGPACK)
+        return {
+            'clients': len(self.clients),
+            'msgpack_clients': msgpack_clients,
+            'messages': self.messages,
+            'sends': self.sends,
+            'bytes_sent': {'json': self.bytes_sent[PROTOCOL_JSON], 'msgpack': self.bytes_sent[PROTOCOL_MSGPACK]},
+            'state_seq': {field: tracker.seq for field, tracker in self.states.items()},
+            'dropped_clients': self.dropped_clients,
+            'max_queued': max(queued) if queued else 0,
+            'latency_ms': self.latency.stats()
+        }
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+HLS Packager
+Cuts the shared stream into packed-audio HLS segments with a rolling playlist
+nginx serves the files; Python never touches a listener's bytes
+"""
+
+import asyncio
+import glob
+import logging
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Tuple
+
+from audio_ring import AudioRing
+from mp3_frames import parse_header
+
+logger = logging.getLogger(__name__)
+
+# RFC 8216 3.4: packed audio carries its start time in this ID3 PRIV frame
+TIMESTAMP_OWNER = b'com.apple.streaming.transportStreamTimestamp'
+
+PLAYLIST_NAME = 'live.m3u8'
+
+# Media sequence numbers per second of run_id. Segments are at least a few seconds long,
+# so a restarted packager always starts past where the previous run got to
+SEQUENCE_PER_RUN_SECOND = 10_000
+
+@dataclass
+class HlsSegment:
+    name: str
+    duration: float
+    discontinuity: bool = False  # Audio is missing between the previous segment and this one
+
+def _syncsafe(size: int) -> bytes:
+    return bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+
+def timestamp_tag(seconds: float) -> bytes:
+    """ID3v2.4 tag holding the segment's 33-bit, 90 kHz start timestamp"""
+    pts = int(seconds * 90000) % (1 << 33)
+    payload = TIMESTAMP_OWNER + b'\x00' + pts.to_bytes(8, 'big')
+    frame = b'PRIV' + _syncsafe(len(payload)) + b'\x00\x00' + payload
+    return b'ID3\x04\x00\x00' + _syncsafe(len(frame)) + frame
+
+def frames_of(chunk: bytes) -> Iterator[Tuple[int, int, float]]:
+    """(start, end, seconds) of each frame in a frame-aligned chunk"""
+    offset = 0
+    while offset < len(chunk):
+        header = parse_header(chunk, offset)
+        if header is None:
+            break
+        yield offset, offset + header.frame_length, header.duration
+        offset += header.frame_length
+
+class HlsPackager:
+    """Rolling live HLS output fed from the audio ring"""
+
+    def __init__(self, ring: AudioRing, output_dir: str, target_duration: float = 6.0,
+                 window: int = 6, keep_extra: int = 4):
+        self.ring = ring
+        self.output_dir = output_dir
+        self.target_duration = target_duration  # No segment is ever longer than this
+        self.window = window
+        self.keep_extra = keep_extra  # Segments kept past the window for slow clients
+
+        # Segment names are immutable and cached forever, so never reuse one across restarts.
+        # RFC 8216 6.2.1: EXT-X-MEDIA-SEQUENCE must never go backwards, restarts included
+        self.run_id = int(time.time())
+        self.sequence = self.run_id * SEQUENCE_PER_RUN_SECOND
+        self.segments: Deque[HlsSegment] = deque()
+        self.stream_seconds = 0.0
+        self.skipped = False  # The ring skipped us forward since the last chunk
+        self.discontinuities_expired = 0  # Discontinuity tags that have left the playlist
+
+        # Stats
+        self.segments_written = 0
+        self.discontinuities = 0
+
+    @property
+    def playlist_path(self) -> str:
+        return os.path.join(self.output_dir, PLAYLIST_NAME)
+
+    async def run(self):
+        """Package the live stream forever"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._sweep_old_runs)
+
+        chunks: List[bytes] = []
+        duration = 0.0
+        discontinuity = False
+        async for chunk in self.ring.listen(on_skip=self._on_skip):
+            if self.skipped:
+                # Close off what we have (short is fine) and mark the gap before the next one
+                self.skipped = False
+                if chunks:
+                    await self._package(chunks, duration, discontinuity)
+                    chunks = []
+                    duration = 0.0
+                discontinuity = True
+
+            # Cut on the frame that would overshoot, even mid-chunk (a stalled pacer can
+            # publish seconds at once): EXT-X-TARGETDURATION has to hold for every segment
+            start = 0
+            for frame_start, frame_end, frame_seconds in frames_of(chunk):
+                if duration + frame_seconds > self.target_duration and (chunks or frame_start > start):
+                    if frame_start > start:
+                        chunks.append(chunk[start:frame_start])
+                    await self._package(chunks, duration, discontinuity)
+                    chunks = []
+                    duration = 0.0
+                    discontinuity = False
+                    start = frame_start
+                duration += frame_seconds
+            chunks.append(chunk[start:])
+
+    def _on_skip(self, missed_chunks: int):
+        logger.warning(f"⏩ HLS packager fell behind the ring, {missed_chunks} chunks lost")
+        self.skipped = True
+
+    async def _package(self, chunks: List[bytes], duration: float, discontinuity: bool):
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_segment, chunks, duration, discontinuity)
+        except Exception as e:
+            logger.error(f"Error writing HLS segment: {e}")
+
+    def _sweep_old_runs(self):
+        """Delete segments a previous run left behind; nothing will ever list them again"""
+        current = f"seg_{self.run_id}_"
+        removed = 0
+        for path in glob.glob(os.path.join(self.output_dir, 'seg_*.mp3*')):
+            if not os.path.basename(path).startswith(current):
+                try:
+                    os.unlink(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        if removed:
+            logger.info(f"🧹 Removed {removed} HLS segments from previous runs")
+
+    def _write_segment(self, chunks: List[bytes], duration: float, discontinuity: bool = False):
+        segment = HlsSegment(f"seg_{self.run_id}_{self.sequence}.mp3", duration, discontinuity)
+        path = os.path.join(self.output_dir, segment.name)
+        self._write_atomic(path, timestamp_tag(self.stream_seconds) + b''.join(chunks))
+
+        self.sequence += 1
+        self.stream_seconds += duration
+        self.segments.append(segment)
+        self.segments_written += 1
+        self.discontinuities += discontinuity
+
+        expired = []
+        while len(self.segments) > self.window + self.keep_extra:
+            expired.append(self.segments.popleft())
+            self.discontinuities_expired += expired[-1].discontinuity
+
+        # Playlist first, then delete, so nothing listed ever disappears
+        self._write_playlist()
+        for old in expired:
+            try:
+                os.unlink(os.path.join(self.output_dir, old.name))
+            except FileNotFoundError:
+                pass
+
+    def _write_playlist(self):
+        segments = list(self.segments)
+        live = segments[-self.window:]
+        first_sequence = self.sequence - len(live)
+        # RFC 8216 4.3.3.3: count the discontinuities that have slid out of the playlist
+        discontinuity_sequence = self.discontinuities_expired + sum(
+            s.discontinuity for s in segments[:len(segments) - len(live)])
+        lines = [
+            '#EXTM3U',
+            '#EXT-X-VERSION:3',
+            # RFC 8216 4.3.3.1: constant for the life of the playlist
+            f'#EXT-X-TARGETDURATION:{math.ceil(self.target_duration)}',
+            f'#EXT-X-MEDIA-SEQUENCE:{first_sequence}',
+            f'#EXT-X-DISCONTINUITY-SEQUENCE:{discontinuity_sequence}'
+        ]
+        for segment in live:
+            if segment.discontinuity:
+                lines.append('#EXT-X-DISCONTINUITY')
+            lines.append(f'#EXTINF:{segment.duration:.3f},')
+            lines.append(segment.name)
+        self._write_atomic(self.playlist_path, ('\n'.join(lines) + '\n').encode('utf-8'))
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        partial_path = f"{path}.part"
+        with open(partial_path, 'wb') as f:
+            f.write(data)
+        os.replace(partial_path, path)
+
+    def stats(self) -> Dict:
+        return {
+            'segments_written': self.segments_written,
+            'discontinuities': self.discontinuities,
+            'media_sequence': self.sequence - min(len(self.segments), self.window),
+            'target_duration': self.target_duration
+        }
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+JSON Snapshot
+Cached reader for JSON files another service renames into place (metrics.json, playout.json)
+Parses once per version of the file; polling endpoints stop costing disk reads
+
+Copied verbatim into backend/; edit this copy and run scripts/sync_shared_modules.py.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class JsonSnapshot:
+    """The last parsed version of a JSON file, re-read only when the file changes"""
+
+    def __init__(self, path: str, recheck_interval: float = 0.5):
+        self.path = path
+        self.recheck_interval = recheck_interval  # Between stat() calls
+
+        self._data: Optional[Dict] = None
+        self._version: Optional[Tuple[int, int, int]] = None
+        self._checked_at = 0.0
+
+        # Stats
+        self.hits = 0
+        self.parses = 0
+        self.errors = 0
+
+    def get(self) -> Optional[Dict]:
+        """Parsed contents (shared; copy before mutating), or None if the file doesn't exist"""
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.recheck_interval:
+            self.hits += 1
+            return self._data
+        self._checked_at = now
+
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._data, self._version = None, None
+            return None
+
+        # A rename-into-place always brings a new inode, even within one mtime tick
+        version = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if version == self._version:
+            self.hits += 1
+            return self._data
+
+        try:
+            with open(self.path, 'r') as f:
+                self._data = json.load(f)
+            self._version = version
+            self.parses += 1
+        except (OSError, ValueError) as e:
+            # Keep serving the last good snapshot; try again next time
+            self.errors += 1
+            logger.error(f"Error reading {self.path}: {e}")
+        return self._data
+
+    def stats(self) -> Dict:
+        return {
+            'hits': self.hits,
+            'parses': self.parses,
+            'errors': self.errors
+        }
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Media Files
+Static audio/video serving for players: byte ranges, ETag revalidation, immutable caching
+Hot immutable segments come from memory; the rest goes out via sendfile when the server offers it
+"""
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import anyio
+from fastapi import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+@dataclass
+class MediaFile:
+    path: str
+    size: int
+    mtime: float
+    etag: str
+
+    @classmethod
+    def stat(cls, path: str) -> Optional['MediaFile']:
+        """Stat through symlinks (current.mp3); None if missing"""
+        try:
+            real = os.path.realpath(path)
+            st = os.stat(real)
+        except OSError:
+            return None
+        return cls(real, st.st_size, st.st_mtime, f'"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"')
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """First byte range of a Range header as (start, end inclusive).
+
+    Returns None for a header we don't understand (serve the whole file) and
+    raises ValueError for one that can't be satisfied.
+    """
+    unit, _, ranges = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in ranges:
+        return None  # Multipart ranges: no media player needs them
+    start_text, _, end_text = ranges.strip().partition('-')
+    try:
+        if not start_text:
+            # Suffix range: the last N bytes
+            length = int(end_text)
+            if length <= 0:
+                raise ValueError
+            return max(0, size - length), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        raise ValueError(header)
+    return start, min(end, size - 1)
+
+class MediaCache:
+    """Small LRU of whole immutable files, keyed by ETag"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_file_bytes: int = 2 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self._files: 'OrderedDict[str, bytes]' = OrderedDict()
+        self.bytes = 0
+        self._pending: Dict[str, asyncio.Future] = {}  # Reads in flight, by ETag
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, media: MediaFile) -> Optional[bytes]:
+        data = self._files.get(media.etag)
+        if data is None:
+            self.misses += 1
+            return None
+        self._files.move_to_end(media.etag)
+        self.hits += 1
+        return data
+
+    async def load(self, media: MediaFile) -> Optional[bytes]:
+        """Read a file into the cache if it's small enough to be worth it"""
+        if media.size > self.max_file_bytes:
+            return None
+        data = self._files.get(media.etag)
+        if data is not None:
+            return data  # Another request finished loading it first
+
+        # A new segment gets N misses at once: one read, everyone shares it
+        pending = self._pending.get(media.etag)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[media.etag] = future
+        try:
+            data = await self._read(media)
+            future.set_result(data)
+            return data
+        except BaseException:
+            future.set_result(None)  # Waiters fall back to serving from disk
+            raise
+        finally:
+            del self._pending[media.etag]
+
+    async def _read(self, media: MediaFile) -> Optional[bytes]:
+        data = await anyio.to_thread.run_sync(_read_file, media.path)
+        if len(data) != media.size:
+            return None  # Changed under us; don't pin a torn copy
+
+        self._files[media.etag] = data
+        self.bytes += len(data)
+        while self.bytes > self.max_bytes:
+            _, evicted = self._files.popitem(last=False)
+            self.bytes -= len(evicted)
+        return data
+
+    def stats(self) -> Dict:
+        return {
+            'files': len(self._files),
+            'mb': round(self.bytes / (1024 * 1024), 1),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+class MediaResponse(Response):
+    """A byte range of a file, from memory, zero-copy sendfile, or chunked reads"""
+
+    def __init__(self, media: MediaFile, start: int, end: int, status_code: int,
+                 headers: Dict[str, str], media_type: str, data: Optional[bytes] = None):
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.media = media
+        self.start = start
+        self.end = end
+        self.data = data
+        self.headers["content-length"] = str(end - start + 1 if end >= start else 0)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        await send({"type": "http.response.start", "status": self.status_code,
+                    "headers": self.raw_headers})
+        count = self.end - self.start + 1
+        if scope.get("method") == "HEAD" or count <= 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if self.data is not None:
+            await send({"type": "http.response.body", "body": self.data[self.start:self.end + 1]})
+            return
+
+        if "http.response.zerocopysend" in scope.get("extensions", {}):
+            # The server sendfile()s straight from the page cache
+            with open(self.media.path, 'rb') as f:
+                await send({"type": "http.response.zerocopysend", "file": f.fileno(),
+                            "offset": self.start, "count": count})
+            return
+
+        with open(self.media.path, 'rb') as f:
+            f.seek(self.start)
+            remaining = count
+            while remaining > 0:
+                chunk = await anyio.to_thread.run_sync(f.read, min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b""})
+
+class MediaServer:
+    """Builds conditional, range-aware responses for files on disk"""
+
+    def __init__(self, cache: Optional[MediaCache] = None):
+        self.cache = cache or MediaCache()
+
+        # Stats
+        self.responses = 0
+        self.not_modified = 0
+        self.partial = 0
+
+    async def response(self, request: Request, path: str, media_type: str,
+                       cache_control: str = "no-cache", immutable: bool = False,
+                       filename: Optional[str] = None) -> Response:
+        """Serve path for request; immutable files get year-long caching and memory caching"""
+        media = MediaFile.stat(path)
+        if media is None:
+            return Response(status_code=404)
+        self.responses += 1
+
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": media.etag,
+            "cache-control": IMMUTABLE if immutable else cache_control
+        }
+        if filename:
+            headers["content-disposition"] = f'attachment; filename="{filename}"'
+
+        # Revalidation: the player already has these bytes
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (if_none_match.strip() == "*" or
+                              media.etag in [tag.strip() for tag in if_none_match.split(",")]):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        start, end, status = 0, media.size - 1, 200
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header and (not if_range or if_range.strip() == media.etag):
+            try:
+                byte_range = parse_range(range_header, media.size)
+            except ValueError:
+                return Response(status_code=416, headers={**headers, "content-range": f"bytes */{media.size}"})
+            if byte_range:
+                start, end = byte_range
+                status = 206
+                headers["content-range"] = f"bytes {start}-{end}/{media.size}"
+                self.partial += 1
+
+        data = None
+        if immutable:
+            data = self.cache.get(media) or await self.cache.load(media)
+        return MediaResponse(media, start, end, status, headers, media_type, data)
+
+    def stats(self) -> Dict:
+        return {
+            'responses': self.responses,
+            'not_modified': self.not_modified,
+            'partial': self.partial,
+            'cache': self.cache.stats()
+        }
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+MP3 Frames
+Just enough MPEG audio parsing to splice encoded clips end to end
+No decoding, no re-encoding: frames in, frames out
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+# Layer III bitrates in kbps, by bitrate index
+_BITRATES = {
+    'mpeg1': [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0],
+    'mpeg2': [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0]
+}
+
+# Sample rates by version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000]
+}
+
+@dataclass
+class FrameHeader:
+    """The 4-byte header of one Layer III frame"""
+    raw: bytes
+    version: int
+    bitrate_kbps: int
+    sample_rate: int
+    padding: int
+    mono: bool
+
+    @property
+    def mpeg1(self) -> bool:
+        return self.version == 3
+
+    @property
+    def frame_length(self) -> int:
+        coefficient = 144 if self.mpeg1 else 72
+        return coefficient * self.bitrate_kbps * 1000 // self.sample_rate + self.padding
+
+    @property
+    def samples(self) -> int:
+        return 1152 if self.mpeg1 else 576
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio in one frame"""
+        return self.samples / self.sample_rate
+
+    @property
+    def side_info_length(self) -> int:
+        if self.mpeg1:
+            return 17 if self.mono else 32
+        return 9 if self.mono else 17
+
+    def silent_frame(self) -> bytes:
+        """A frame with the same format that decodes to silence
+
+        All-zero side info means zero-length main data for every granule,
+        which every decoder plays as digital silence.
+        """
+        header = bytearray(self.raw)
+        header[1] |= 0x01   # No CRC
+        header[2] &= ~0x02  # No padding
+        unpadded = FrameHeader(bytes(header), self.version, self.bitrate_kbps,
+                               self.sample_rate, 0, self.mono)
+        return bytes(header) + bytes(unpadded.frame_length - 4)
+
+def parse_header(data: bytes, offset: int = 0) -> Optional[FrameHeader]:
+    """Parse a Layer III frame header at offset, or None if there isn't one"""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None  # Reserved values, free format, or not Layer III
+
+    table = _BITRATES['mpeg1' if version == 3 else 'mpeg2']
+    return FrameHeader(
+        raw=bytes(data[offset:offset + 4]),
+        version=version,
+        bitrate_kbps=table[bitrate_index],
+        sample_rate=_SAMPLE_RATES[version][sample_rate_index],
+        padding=(b2 >> 1) & 0x01,
+        mono=(b3 >> 6) == 3
+    )
+
+def _skip_id3(data: bytes) -> int:
+    """Length of a leading ID3v2 tag"""
+    if len(data) < 10 or data[:3] != b'ID3':
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+def _is_info_frame(data: bytes, offset: int, header: FrameHeader) -> bool:
+    """LAME/Xing/VBRI metadata frames carry no audio and would play as a gap"""
+    tag_offset = offset + 4 + header.side_info_length
+    if data[tag_offset:tag_offset + 4] in (b'Xing', b'Info'):
+        return True
+    return data[offset + 36:offset + 40] == b'VBRI'
+
+def gapless_info(data: bytes, offset: int, header: FrameHeader) -> Optional[Tuple[int, int]]:
+    """(encoder delay, padding) in samples from a LAME-style Info tag, if the frame has one
+
+    LAME and ffmpeg both write it: the Xing fields the flags say are present,
+    then a 9-byte encoder string, 12 bytes we don't need, and two 12-bit counts.
+    """
+    tag_offset = offset + 4 + header.side_info_length
+    if data[tag_offset:tag_offset + 4] not in (b'Xing', b'Info'):
+        return None
+    flags = int.from_bytes(data[tag_offset + 4:tag_offset + 8], 'big')
+    position = tag_offset + 8
+    position += 4 * bool(flags & 0x1) + 4 * bool(flags & 0x2) + 100 * bool(flags & 0x4) + 4 * bool(flags & 0x8)
+
+    encoder = data[position:position + 4]
+    counts = data[position + 21:position + 24]
+    if len(counts) < 3 or not encoder.isalpha():
+        return None  # Plain Xing header, no encoder extension
+    packed = int.from_bytes(counts, 'big')
+    return packed >> 12, packed & 0xFFF
+
+# Every MP3 decoder's own output lags by this many samples; the tag's counts leave it out
+DECODER_DELAY = 529
+
+def _scan(data: bytes) -> Iterator[Tuple[int, FrameHeader]]:
+    """Offset and header of every frame, tags and junk skipped"""
+    offset = _skip_id3(data)
+    while offset + 4 <= len(data):
+        header = parse_header(data, offset)
+        if header is None:
+            offset += 1  # Resync (ID3v1 tags, junk)
+            continue
+
+        end = offset + header.frame_length
+        if end > len(data):
+            break  # Truncated final frame
+
+        # Guard against a false sync inside junk: the next frame must line up too
+        if end + 4 <= len(data) and parse_header(data, end) is None and data[end:end + 3] != b'TAG':
+            offset += 1
+            continue
+
+        yield offset, header
+        offset = end
+
+def iter_frames(data: bytes) -> Iterator[bytes]:
+    """Yield the audio frames of an MP3 file, skipping tags and metadata frames"""
+    first = True
+    for offset, header in _scan(data):
+        if not (first and _is_info_frame(data, offset, header)):
+            yield bytes(data[offset:offset + header.frame_length])
+        first = False
+
+def gapless_frames(data: bytes) -> List[bytes]:
+    """The audio frames of one clip, minus whole frames of encoder delay and padding
+
+    Frames can't be cut mid-way, so up to a frame of each survives; without
+    the Info tag nothing is trimmed.
+    """
+    frames: List[bytes] = []
+    gapless = None
+    samples = 1152
+    for offset, header in _scan(data):
+        if not frames and gapless is None and _is_info_frame(data, offset, header):
+            gapless = gapless_info(data, offset, header) or (0, 0)
+            continue
+        frames.append(bytes(data[offset:offset + header.frame_length]))
+        samples = header.samples
+
+    if not gapless:
+        return frames
+    delay, padding = gapless
+    lead = (delay + DECODER_DELAY) // samples
+    tail = max(0, padding - DECODER_DELAY) // samples
+    if lead + tail >= len(frames):
+        return frames  # Implausible counts for a clip this short; don't eat it
+    return frames[lead:len(frames) - tail]
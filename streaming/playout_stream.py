@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Playout Stream
+Splices every aired clip into one endless MP3 stream, paced in real time
+Silence fills the gaps so listeners never get disconnected between clips
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import aiofiles
+
+from audio_ring import AudioRing
+from mp3_frames import gapless_frames, parse_header
+
+logger = logging.getLogger(__name__)
+
+# 128 kbps, 44.1 kHz mono: what the broadcast controller encodes
+DEFAULT_HEADER = b'\xff\xfb\x90\xc4'
+
+class PlayoutStream:
+    """One shared, frame-aligned MP3 stream assembled from the playout index"""
+
+    def __init__(self, audio_dir: str, index_path: str, ring: AudioRing, tick: float = 0.1,
+                 max_backlog_seconds: float = 30.0):
+        self.audio_dir = audio_dir
+        self.index_path = index_path
+        self.ring = ring  # Where paced chunks go; listeners read from there
+        self.tick = tick
+        self.max_backlog_seconds = max_backlog_seconds
+
+        # Frames waiting to air, with their durations
+        self.pending: Deque[Tuple[bytes, float]] = deque()
+        self.backlog_seconds = 0.0
+        self.last_clip_start: Optional[float] = None
+        self._index_mtime = 0.0
+
+        # Filler follows the format of whatever aired last
+        header = parse_header(DEFAULT_HEADER)
+        self.silent_frame = header.silent_frame()
+        self.frame_duration = header.duration
+
+        # Stats
+        self.clips_streamed = 0
+        self.filler_seconds = 0.0
+
+    async def run(self):
+        """Follow the playout index and pace frames out forever"""
+        await asyncio.gather(self.follow_index(), self.pace())
+
+    async def follow_index(self, interval: float = 0.5):
+        """Queue the frames of every clip the broadcast controller airs"""
+        while True:
+            try:
+                await self._poll_index()
+            except Exception as e:
+                logger.error(f"Error following playout index: {e}")
+            await asyncio.sleep(interval)
+
+    async def _poll_index(self):
+        try:
+            mtime = os.stat(self.index_path).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._index_mtime:
+            return
+        self._index_mtime = mtime
+
+        async with aiofiles.open(self.index_path, 'r') as f:
+            clips = json.loads(await f.read()).get('clips', [])
+
+        if self.last_clip_start is None:
+            # Fresh start: pick up from whatever is on air right now
+            now = time.time()
+            new_clips = [clip for clip in clips if clip['ends_at'] > now]
+        else:
+            new_clips = [clip for clip in clips if clip['starts_at'] > self.last_clip_start]
+
+        for clip in new_clips:
+            if (not os.path.exists(os.path.join(self.audio_dir, clip['file']))
+                    and clip['ends_at'] > time.time()):
+                # Listed a moment before it's renamed into place: read the index again next poll
+                self._index_mtime = 0.0
+                break
+            self.last_clip_start = clip['starts_at']
+            await self._queue_clip(os.path.join(self.audio_dir, clip['file']))
+
+        self._trim_backlog()
+
+    async def _queue_clip(self, path: str):
+        try:
+            async with aiofiles.open(path, 'rb') as f:
+                data = await f.read()
+        except FileNotFoundError:
+            logger.warning(f"Aired clip vanished before streaming: {path}")
+            return
+
+        # Clips are whole segments, each its own encode; this is the only place they're joined
+        for frame in gapless_frames(data):
+            header = parse_header(frame)
+            self.pending.append((frame, header.duration))
+            self.backlog_seconds += header.duration
+            self.silent_frame = header.silent_frame()
+            self.frame_duration = header.duration
+        self.clips_streamed += 1
+
+    def _trim_backlog(self):
+        """If we've fallen far behind the controller, skip ahead rather than drift"""
+        skipped = 0.0
+        while self.backlog_seconds > self.max_backlog_seconds and self.pending:
+            _, duration = self.pending.popleft()
+            self.backlog_seconds -= duration
+            skipped += duration
+        if skipped:
+            logger.warning(f"⏩ Stream was {skipped:.1f}s behind the broadcast, skipped ahead")
+
+    async def pace(self):
+        """Release frames at exactly the rate they play"""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent_seconds = 0.0
+
+        while True:
+            elapsed = loop.time() - start
+            frames = []
+            duration = 0.0
+            while sent_seconds + duration < elapsed:
+                if self.pending:
+                    frame, frame_duration = self.pending.popleft()
+                    self.backlog_seconds -= frame_duration
+                else:
+                    frame, frame_duration = self.silent_frame, self.frame_duration
+                    self.filler_seconds += frame_duration
+                frames.append(frame)
+                duration += frame_duration
+
+            if frames:
+                sent_seconds += duration
+                # Chunks always hold whole frames, so any chunk is a safe place to join
+                self.ring.publish(b''.join(frames))
+
+            await asyncio.sleep(self.tick)
+
+    def stats(self) -> Dict:
+        return {
+            'backlog_seconds': round(max(0.0, self.backlog_seconds), 1),
+            'clips_streamed': self.clips_streamed,
+            'filler_seconds': round(self.filler_seconds, 1)
+        }
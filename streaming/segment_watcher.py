@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Segment Watcher
+Watchdog events marshalled onto the event loop, debounced until the file is complete
+Each finished segment is announced exactly once, in order, and the lag is measured
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from broadcast_hub import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+class _ThreadHandler(FileSystemEventHandler):
+    """Runs on the observer thread: stamp the event and hand it to the loop, nothing else"""
+
+    def __init__(self, watcher: 'SegmentWatcher', loop: asyncio.AbstractEventLoop):
+        self.watcher = watcher
+        self.loop = loop
+
+    def on_any_event(self, event: FileSystemEvent):
+        if event.is_directory:
+            return
+        if event.event_type == 'moved':
+            kind, path = 'moved', event.dest_path
+        elif event.event_type in ('created', 'modified', 'closed'):
+            kind, path = event.event_type, event.src_path
+        else:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.watcher.on_event, kind, path, time.monotonic())
+        except RuntimeError:
+            pass  # Loop already closed during shutdown
+
+class SegmentWatcher:
+    """Announces finished segment files in a directory to an async callback"""
+
+    # A closed or renamed file is complete; anything else waits for writes to stop
+    COMPLETE_EVENTS = ('closed', 'moved')
+
+    def __init__(self, directory: str, callback: Callable[[str], Awaitable[None]],
+                 prefix: str = 'segment_', suffix: str = '.mp3', settle: float = 0.25,
+                 remember: int = 256):
+        self.directory = directory
+        self.callback = callback
+        self.prefix = prefix
+        self.suffix = suffix
+        self.settle = settle
+
+        self._first_seen: Dict[str, float] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._announced: 'OrderedDict[str, None]' = OrderedDict()
+        self._remember = remember
+        self._ready: Optional[asyncio.Queue] = None
+
+        # Stats
+        self.events = 0
+        self.coalesced = 0
+        self.notified = 0
+        self.errors = 0
+        self.lag = LatencyHistogram()
+
+    def wants(self, path: str) -> bool:
+        name = os.path.basename(path)
+        return name.startswith(self.prefix) and name.endswith(self.suffix)
+
+    def on_event(self, kind: str, path: str, seen_at: float):
+        """Loop thread: debounce and coalesce raw filesystem events"""
+        if not self.wants(path) or path in self._announced:
+            return
+        self.events += 1
+        if path in self._first_seen:
+            self.coalesced += 1
+        self._first_seen.setdefault(path, seen_at)
+
+        timer = self._timers.pop(path, None)
+        if timer:
+            timer.cancel()
+
+        if kind in self.COMPLETE_EVENTS:
+            self._finish(path)
+        else:
+            # Still being written (or the platform has no close events): wait for quiet
+            self._timers[path] = asyncio.get_running_loop().call_later(self.settle, self._finish, path)
+
+    def _finish(self, path: str):
+        self._timers.pop(path, None)
+        if path in self._announced:
+            return
+        self._announced[path] = None
+        while len(self._announced) > self._remember:
+            self._announced.popitem(last=False)
+        self._ready.put_nowait(path)
+
+    async def run(self):
+        """Watch until cancelled"""
+        loop = asyncio.get_running_loop()
+        self._ready = asyncio.Queue()
+
+        os.makedirs(self.directory, exist_ok=True)
+        observer = Observer()
+        observer.schedule(_ThreadHandler(self, loop), self.directory, recursive=False)
+        observer.start()
+        logger.info(f"👀 Watching directory: {self.directory}")
+
+        try:
+            while True:
+                path = await self._ready.get()
+                seen_at = self._first_seen.pop(path, time.monotonic())
+                try:
+                    await self.callback(path)
+                    self.notified += 1
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Error announcing {os.path.basename(path)}: {e}")
+                self.lag.record((time.monotonic() - seen_at) * 1000)
+        finally:
+            for timer in self._timers.values():
+                timer.cancel()
+            observer.stop()
+            await loop.run_in_executor(None, observer.join)
+
+    def stats(self) -> Dict:
+        return {
+            'events': self.events,
+            'coalesced': self.coalesced,
+            'notified': self.notified,
+            'errors': self.errors,
+            'pending': len(self._timers),
+            'lag_ms': self.lag.stats()
+        }
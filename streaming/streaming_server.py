@@ -6,60 +6,80 @@ Handles WebSocket connections for real-time updates
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime
-from typing import Dict, Set
+from typing import Dict
 import logging
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-import aiofiles
+
+from audio_ring import AudioRing
+from broadcast_hub import BroadcastHub
+from hls_packager import PLAYLIST_NAME, HlsPackager
+from json_snapshot import JsonSnapshot
+from media_files import MediaServer
+from playout_stream import PlayoutStream
+from segment_watcher import SegmentWatcher
+from ws_backplane import WsBackplane, redis_from_env
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class AudioFileHandler(FileSystemEventHandler):
-    """Watches for new audio files and notifies clients"""
-    
-    def __init__(self, stream_manager):
-        self.stream_manager = stream_manager
-        
-    def on_created(self, event):
-        if event.src_path.endswith('.mp3') and 'segment_' in event.src_path:
-            asyncio.create_task(self.stream_manager.notify_new_segment(event.src_path))
-
 class StreamManager:
     """Manages WebSocket connections and audio streaming"""
     
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+        # Every message is serialized once and queued per client, so one
+        # stalled socket can't hold up the broadcast to everyone else
+        self.hub = BroadcastHub(max_queue=64, name="ws")
+        # With REDIS_URL set, events reach the clients of every replica
+        self.backplane = WsBackplane(self.hub, redis_from_env(), channel="static:ws")
         self.current_audio_file = None
-        self.audio_dir = "/audio/live"
-        self.metrics_file = "/app/data/metrics.json"
+        self.audio_dir = os.getenv("AUDIO_DIR", "/audio/live")
+        self.metrics_file = os.getenv("METRICS_FILE", "/app/data/metrics.json")
+        self.playout_index = os.path.join(self.audio_dir, "playout.json")
+        
+        # Both files are renamed into place by the controller; parse each version once.
+        # The playout index is stat'ed every time since new_segment needs the latest one
+        self.metrics = JsonSnapshot(self.metrics_file, recheck_interval=0.5)
+        self.playout = JsonSnapshot(self.playout_index, recheck_interval=0)
+        
+        # One spliced stream written into one ring; every /stream listener
+        # is just a cursor into it (30 s of 100 ms chunks, 2 s burst on connect)
+        self.ring = AudioRing(capacity=300, burst_chunks=20)
+        self.playout_stream = PlayoutStream(self.audio_dir, self.playout_index, self.ring, tick=0.1)
+        
+        # The same stream as rolling HLS, written where nginx can serve it
+        self.hls_dir = os.getenv("HLS_DIR", "/hls")
+        self.hls = HlsPackager(self.ring, self.hls_dir, target_duration=6.0, window=6)
+        
+        # Range/ETag-aware file serving; hot HLS segments kept in memory
+        self.media = MediaServer()
+        
+        # New segments, announced once each as soon as they're completely written
+        self.watcher = SegmentWatcher(self.audio_dir, self.notify_new_segment)
         
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.add(websocket)
-        logger.info(f"New connection. Total: {len(self.active_connections)}")
+        self.hub.register(websocket, self.hub.negotiate(websocket))
+        logger.info(f"New connection. Total: {len(self.hub)}")
         
         # Send current state
         await self.send_current_state(websocket)
         
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        self.active_connections.discard(websocket)
-        logger.info(f"Connection closed. Total: {len(self.active_connections)}")
+        self.hub.unregister(websocket)
+        logger.info(f"Connection closed. Total: {len(self.hub)}")
         
     async def send_current_state(self, websocket: WebSocket):
         """Send current broadcast state to new connection"""
         state = await self.get_current_state()
-        await websocket.send_json(state)
+        self.hub.send(websocket, state, state_field="metrics")
         
     async def get_current_state(self) -> Dict:
         """Get current broadcast state"""
@@ -67,20 +87,24 @@ class StreamManager:
             "type": "state",
             "timestamp": datetime.now().isoformat(),
             "current_audio": self.current_audio_file,
-            "listeners": len(self.active_connections)
+            "listeners": self.backplane.cluster_clients()
         }
         
         # Add metrics if available
-        if os.path.exists(self.metrics_file):
-            try:
-                async with aiofiles.open(self.metrics_file, 'r') as f:
-                    metrics = json.loads(await f.read())
-                    state["metrics"] = metrics
-            except Exception as e:
-                logger.error(f"Error reading metrics: {e}")
+        metrics = self.metrics.get()
+        if metrics is not None:
+            state["metrics"] = metrics
                 
+        playout = await self.get_playout()
+        if playout:
+            state["on_air_until"] = playout.get("on_air_until")
+            
         return state
         
+    async def get_playout(self) -> Dict:
+        """Durations and air times the broadcast controller published"""
+        return self.playout.get() or {}
+            
     async def notify_new_segment(self, audio_file: str):
         """Notify all clients of new audio segment"""
         self.current_audio_file = audio_file
@@ -91,21 +115,22 @@ class StreamManager:
             "timestamp": datetime.now().isoformat()
         }
         
+        # When it actually airs and for how long, straight from the render
+        playout = await self.get_playout()
+        for clip in playout.get("clips", []):
+            if clip["file"] == message["audio_file"]:
+                message["duration_ms"] = clip["duration_ms"]
+                message["starts_at"] = clip["starts_at"]
+                break
+        
         # Get current metrics
         state = await self.get_current_state()
         message["metrics"] = state.get("metrics", {})
         
-        # Broadcast to all connections
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to client: {e}")
-                disconnected.add(connection)
-                
-        # Clean up disconnected clients
-        self.active_connections -= disconnected
+        # Broadcast to all connections; every replica sees the same file appear
+        # (protocol 2 clients get just the changed metrics)
+        await self.backplane.publish(message, dedupe_key=f"segment:{message['audio_file']}",
+                                     state_field="metrics")
         
     async def broadcast_breakdown_alert(self):
         """Alert all clients of incoming breakdown"""
@@ -115,11 +140,7 @@ class StreamManager:
             "timestamp": datetime.now().isoformat()
         }
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+        await self.backplane.publish(message)
 
 # Create FastAPI app
 app = FastAPI(title="Static.news Streaming Server")
@@ -147,39 +168,42 @@ async def root():
 
 @app.get("/stream")
 async def audio_stream():
-    """HTTP audio stream endpoint"""
-    current_file = os.path.join(stream_manager.audio_dir, "current.mp3")
-    
-    if not os.path.exists(current_file):
-        return {"error": "No audio available yet"}
-        
-    async def generate():
-        """Generate audio stream"""
-        async with aiofiles.open(current_file, 'rb') as f:
-            while True:
-                chunk = await f.read(4096)
-                if not chunk:
-                    break
-                yield chunk
-                
+    """HTTP audio stream endpoint - one endless MP3, Icecast style"""
     return StreamingResponse(
-        generate(),
+        stream_manager.ring.listen(),
         media_type="audio/mpeg",
         headers={
-            "Cache-Control": "no-cache",
-            "X-Content-Type-Options": "nosniff"
+            "Cache-Control": "no-cache, no-store",
+            "X-Content-Type-Options": "nosniff",
+            "icy-name": "Static.news",
+            "icy-br": "128"
         }
     )
 
-@app.get("/current")
-async def get_current_audio():
+@app.api_route("/hls/{name}", methods=["GET", "HEAD"])
+async def hls_file(name: str, request: Request):
+    """HLS playlist and segments (nginx serves these directly in production)"""
+    path = os.path.join(stream_manager.hls_dir, os.path.basename(name))
+    if not os.path.exists(path) or name.endswith('.part'):
+        return JSONResponse({"error": "Not found"}, status_code=404)
+        
+    if name == PLAYLIST_NAME:
+        # The playlist changes every segment; segments never change at all
+        return await stream_manager.media.response(request, path, "application/vnd.apple.mpegurl",
+                                                   cache_control="max-age=1")
+    return await stream_manager.media.response(request, path, "audio/mpeg", immutable=True)
+
+@app.api_route("/current", methods=["GET", "HEAD"])
+async def get_current_audio(request: Request):
     """Get current audio file"""
     current_file = os.path.join(stream_manager.audio_dir, "current.mp3")
     
     if os.path.exists(current_file):
-        return FileResponse(
+        # A symlink that moves every segment: revalidate by ETag, seek by Range
+        return await stream_manager.media.response(
+            request,
             current_file,
-            media_type="audio/mpeg",
+            "audio/mpeg",
             filename="current_segment.mp3"
         )
     else:
@@ -192,25 +216,27 @@ async def websocket_endpoint(websocket: WebSocket):
     
     try:
         while True:
-            # Keep connection alive and listen for messages
-            data = await websocket.receive_text()
-            
+            # Keep connection alive and listen for messages (JSON or msgpack)
+            message = await stream_manager.hub.receive(websocket)
+            if message is None:
+                continue
+                
             # Handle client messages
-            try:
-                message = json.loads(data)
+            if message.get("type") == "ping":
+                stream_manager.hub.send(websocket, {"type": "pong"})
                 
-                if message.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
-                    
-                elif message.get("type") == "trigger_breakdown":
-                    # Mobile app triggered breakdown
-                    logger.info("Breakdown triggered by user!")
-                    await stream_manager.broadcast_breakdown_alert()
-                    
-            except json.JSONDecodeError:
-                logger.error(f"Invalid message: {data}")
+            elif message.get("type") == "resync":
+                # Protocol 2 client missed a seq
+                stream_manager.hub.resync(websocket, "metrics")
+                
+            elif message.get("type") == "trigger_breakdown":
+                # Mobile app triggered breakdown
+                logger.info("Breakdown triggered by user!")
+                await stream_manager.broadcast_breakdown_alert()
                 
     except WebSocketDisconnect:
+        pass
+    finally:
         stream_manager.disconnect(websocket)
 
 @app.get("/metrics")
@@ -225,24 +251,25 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "streaming-server",
-        "connections": len(stream_manager.active_connections),
+        "connections": stream_manager.backplane.cluster_clients(),
+        "websockets": stream_manager.hub.stats(),
+        "backplane": stream_manager.backplane.stats(),
+        "stream": {**stream_manager.playout_stream.stats(), **stream_manager.ring.stats()},
+        "hls": stream_manager.hls.stats(),
+        "watcher": stream_manager.watcher.stats(),
+        "media": stream_manager.media.stats(),
+        "snapshots": {"metrics": stream_manager.metrics.stats(), "playout": stream_manager.playout.stats()},
         "timestamp": datetime.now().isoformat()
     }
 
-async def start_file_watcher():
-    """Start watching for new audio files"""
-    event_handler = AudioFileHandler(stream_manager)
-    observer = Observer()
-    observer.schedule(event_handler, stream_manager.audio_dir, recursive=False)
-    observer.start()
-    
-    logger.info(f"Watching directory: {stream_manager.audio_dir}")
-
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
     logger.info("🎙️ Static.news Streaming Server starting...")
-    asyncio.create_task(start_file_watcher())
+    asyncio.create_task(stream_manager.watcher.run())
+    asyncio.create_task(stream_manager.playout_stream.run())
+    asyncio.create_task(stream_manager.hls.run())
+    asyncio.create_task(stream_manager.backplane.run())
     
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -250,11 +277,7 @@ async def shutdown_event():
     logger.info("📴 Streaming server shutting down...")
     
     # Close all WebSocket connections
-    for connection in stream_manager.active_connections:
-        try:
-            await connection.close()
-        except:
-            pass
+    await stream_manager.hub.close_all()
 
 if __name__ == "__main__":
     # Run the server
@@ -18,10 +18,11 @@ from dataclasses import dataclass
 
 import cv2
 import numpy as np
-from fastapi import FastAPI, WebSocket, HTTPException
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi import FastAPI, Request, WebSocket, HTTPException
+from fastapi.responses import StreamingResponse
 import uvicorn
 
+from media_files import MediaServer
 from video_generation import VideoCompositionEngine
 
 logging.basicConfig(level=logging.INFO)
@@ -273,6 +274,7 @@ class VideoStreamingServer:
     def __init__(self):
         self.app = FastAPI(title="Static.news Video Streaming Server")
         self.composer = None
+        self.media = MediaServer()
         self.setup_routes()
         
     def setup_routes(self):
@@ -306,21 +308,23 @@ class VideoStreamingServer:
             self.composer.stop_stream()
             return {"status": "stopped"}
             
-        @self.app.get("/stream/playlist.m3u8")
-        async def get_playlist():
+        @self.app.api_route("/stream/playlist.m3u8", methods=["GET", "HEAD"])
+        async def get_playlist(request: Request):
             """Get HLS playlist"""
             playlist_path = "/tmp/hls/playlist.m3u8"
             if os.path.exists(playlist_path):
-                return FileResponse(playlist_path, media_type="application/vnd.apple.mpegurl")
+                return await self.media.response(request, playlist_path, "application/vnd.apple.mpegurl",
+                                                 cache_control="max-age=1")
             else:
                 raise HTTPException(404, "Playlist not found")
                 
-        @self.app.get("/stream/segment_{segment:int}.ts")
-        async def get_segment(segment: int):
+        @self.app.api_route("/stream/segment_{segment:int}.ts", methods=["GET", "HEAD"])
+        async def get_segment(segment: int, request: Request):
             """Get HLS segment"""
+            # ffmpeg restarts numbering from 000, so these names aren't immutable: revalidate by ETag
             segment_path = f"/tmp/hls/segment_{segment:03d}.ts"
             if os.path.exists(segment_path):
-                return FileResponse(segment_path, media_type="video/mp2t")
+                return await self.media.response(request, segment_path, "video/mp2t")
             else:
                 raise HTTPException(404, "Segment not found")
                 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+WebSocket Backplane
+Redis pub/sub between replicas: an event is published once, every replica fans out locally
+Without REDIS_URL it degrades to the local hub, so a single replica needs nothing extra
+
+Copied verbatim into render-backend/ alongside broadcast_hub.py; edit this copy and
+run scripts/sync_shared_modules.py.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from broadcast_hub import BroadcastHub
+
+logger = logging.getLogger(__name__)
+
+def redis_from_env():
+    """Async Redis client from REDIS_URL, or None to run single-replica"""
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+    try:
+        import redis.asyncio as redis
+    except ImportError:
+        logger.warning("REDIS_URL set but redis is not installed; running without a backplane")
+        return None
+    return redis.from_url(url, decode_responses=True)
+
+class WsBackplane:
+    """Cluster-wide broadcast and connection counts on top of a local BroadcastHub"""
+
+    def __init__(self, hub: BroadcastHub, redis_client=None, channel: str = "ws:broadcast",
+                 heartbeat_interval: float = 5.0, dedupe_seconds: int = 60):
+        self.hub = hub
+        self.redis = redis_client
+        self.channel = channel
+        self.replicas_key = f"{channel}:replicas"
+        self.heartbeat_interval = heartbeat_interval
+        self.dedupe_seconds = dedupe_seconds
+
+        # Unique per process, readable in the replica table
+        self.replica_id = f"{socket.gethostname()}:{uuid.uuid4().hex[:8]}"
+        self._remote_clients = 0
+        self._replicas = 1
+
+        # Stats
+        self.published = 0
+        self.received = 0
+        self.deduped = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    async def publish(self, message: Any, dedupe_key: Optional[str] = None,
+                      state_field: Optional[str] = None):
+        """Deliver to every client on every replica.
+
+        dedupe_key: events every replica raises on its own (the shared audio
+        directory, periodic tickers) are published only by whichever gets there first.
+        state_field: passed through to BroadcastHub.broadcast on each replica, which
+        keeps its own patch sequence.
+        """
+        if not self.enabled:
+            self.hub.broadcast(message, state_field)
+            return
+
+        try:
+            if dedupe_key and not await self.claim(dedupe_key):
+                return
+            # Our own subscriber delivers it locally, same as every other replica
+            envelope = {"message": self.hub.as_dict(message), "state_field": state_field}
+            await self.redis.publish(self.channel, json.dumps(envelope))
+            self.published += 1
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Backplane publish failed, delivering locally: {e}")
+            self.hub.broadcast(message, state_field)
+
+    async def claim(self, key: str) -> bool:
+        """True on exactly one replica per key (for dedupe_seconds); always True alone.
+
+        For work only one replica should do before publishing, like computing a tick.
+        """
+        if not self.enabled:
+            return True
+        first = await self.redis.set(f"{self.channel}:once:{key}", self.replica_id,
+                                     nx=True, ex=self.dedupe_seconds)
+        if not first:
+            self.deduped += 1
+        return bool(first)
+
+    async def run(self):
+        """Subscribe and heartbeat forever (no-op without Redis)"""
+        if not self.enabled:
+            return
+        logger.info(f"🔗 WebSocket backplane on {self.channel} as {self.replica_id}")
+        try:
+            await asyncio.gather(self._subscribe(), self._heartbeat())
+        finally:
+            try:
+                await self.redis.hdel(self.replicas_key, self.replica_id)
+            except Exception:
+                pass
+
+    async def _subscribe(self):
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.received += 1
+                        envelope = json.loads(message["data"])
+                        self.hub.broadcast(envelope["message"], envelope.get("state_field"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Backplane subscription lost, resubscribing: {e}")
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+    async def _heartbeat(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Backplane heartbeat failed: {e}")
+            await asyncio.sleep(self.heartbeat_interval)
+
+    async def refresh(self):
+        """Report our client count and total up everyone else's"""
+        now = time.time()
+        await self.redis.hset(self.replicas_key, self.replica_id,
+                              json.dumps({"clients": len(self.hub), "at": now}))
+
+        remote = 0
+        replicas = 1
+        stale = []
+        for replica_id, value in (await self.redis.hgetall(self.replicas_key)).items():
+            if replica_id == self.replica_id:
+                continue
+            entry = json.loads(value)
+            if now - entry["at"] > self.heartbeat_interval * 3:
+                stale.append(replica_id)  # Crashed without saying goodbye
+                continue
+            remote += entry["clients"]
+            replicas += 1
+        if stale:
+            await self.redis.hdel(self.replicas_key, *stale)
+
+        self._remote_clients = remote
+        self._replicas = replicas
+
+    def cluster_clients(self) -> int:
+        """Our live count plus the other replicas' last heartbeat"""
+        return len(self.hub) + (self._remote_clients if self.enabled else 0)
+
+    def stats(self) -> Dict:
+        return {
+            'enabled': self.enabled,
+            'replica_id': self.replica_id,
+            'replicas': self._replicas if self.enabled else 1,
+            'cluster_clients': self.cluster_clients(),
+            'published': self.published,
+            'received': self.received,
+            'deduped': self.deduped,
+            'errors': self.errors
+        }